@@ -166,10 +166,9 @@ def run_atr_backtest(data: pd.DataFrame, config: ATRBreakoutConfig, initial_capi
     # Initialize strategy
     strategy = ATRBreakoutStrategy(config)
     
-    # Initialize metrics pipeline with basic metrics
-    from backtesting.metrics.pipeline import EquityCurveMetric, DrawdownMetric, TradeListMetric
-    metrics = [EquityCurveMetric(), DrawdownMetric(), TradeListMetric()]
-    pipeline = MetricsPipeline(metrics)
+    # Initialize metrics pipeline with the default processors
+    pipeline = MetricsPipeline()
+    pipeline.initialize(initial_capital)
     
     # Simulate portfolio tracking
     portfolio_value = initial_capital
@@ -232,19 +231,15 @@ def run_atr_backtest(data: pd.DataFrame, config: ATRBreakoutConfig, initial_capi
             })
             
             # Process bar in pipeline
-            pipeline.process_bar({
-                'equity': portfolio_value,
-                'timestamp': row['date']
-            })
+            pipeline.process_bar(row['date'], portfolio_value)
             
         except Exception as e:
             print(f"Error processing bar at {row['date']}: {e}")
             continue
     
-    # Finalize pipeline calculations
+    # Collect pipeline results
     try:
-        pipeline.finalize()
-        pipeline_results = pipeline.results()
+        pipeline_results = pipeline.get_all_metrics()
         
         # Calculate basic metrics
         total_return = ((portfolio_value - initial_capital) / initial_capital) * 100
@@ -3,6 +3,7 @@
 from .alpha_vantage import AlphaVantageDataProvider
 from .mock_alpha_vantage import MockAlphaVantageDataProvider
 from .adapter import DataAdapter, DataAdapterError, InvalidSymbolError, DataParsingError
+from .parsing import DailyBar
 
 __all__ = [
     "AlphaVantageDataProvider", 
@@ -10,5 +11,6 @@ __all__ = [
     "DataAdapter",
     "DataAdapterError",
     "InvalidSymbolError", 
-    "DataParsingError"
+    "DataParsingError",
+    "DailyBar",
 ]
\ No newline at end of file
@@ -9,7 +9,7 @@ import logging
 from typing import Any, Dict, Optional, Union
 from datetime import datetime
 
-from ..interfaces.data_provider import DataProviderProtocol
+from interfaces.data_provider import DataProviderProtocol
 
 
 class DataAdapterError(Exception):
@@ -106,18 +106,18 @@ class DataAdapter:
         """
         try:
             normalized_symbol = self._validate_symbol(symbol)
-            self.logger.debug(f"Getting quote for {normalized_symbol}")
+            self.logger.debug("Getting quote for %s", normalized_symbol)
             
             # Get raw data from provider
             raw_data = await self.provider.get_quote(normalized_symbol)
             if raw_data is None:
-                self.logger.warning(f"No raw quote data returned for {normalized_symbol}")
+                self.logger.warning("No raw quote data returned for %s", normalized_symbol)
                 return None
             
             # Parse the data using provider's parser
             parsed_data = self.provider.parse_quote_data(raw_data)
             if parsed_data is None:
-                self.logger.warning(f"Failed to parse quote data for {normalized_symbol}")
+                self.logger.warning("Failed to parse quote data for %s", normalized_symbol)
                 return None
             
             # Validate parsed data format
@@ -126,7 +126,7 @@ class DataAdapter:
         except InvalidSymbolError:
             raise  # Re-raise validation errors
         except Exception as e:
-            self.logger.error(f"Error getting quote for {symbol}: {e}")
+            self.logger.error("Error getting quote for %s: %s", symbol, e)
             return None
     
     async def get_daily_data(self, symbol: str) -> list[Dict[str, Any]]:
@@ -144,18 +144,18 @@ class DataAdapter:
         """
         try:
             normalized_symbol = self._validate_symbol(symbol)
-            self.logger.debug(f"Getting daily data for {normalized_symbol}")
+            self.logger.debug("Getting daily data for %s", normalized_symbol)
             
             # Get raw data from provider
             raw_data = await self.provider.get_daily_data(normalized_symbol)
             if raw_data is None:
-                self.logger.warning(f"No raw daily data returned for {normalized_symbol}")
+                self.logger.warning("No raw daily data returned for %s", normalized_symbol)
                 return []
             
             # Parse the data using provider's parser
             parsed_data = self.provider.parse_daily_data(raw_data)
             if not parsed_data:
-                self.logger.warning(f"Failed to parse daily data for {normalized_symbol}")
+                self.logger.warning("Failed to parse daily data for %s", normalized_symbol)
                 return []
             
             # Validate and normalize each data point
@@ -166,16 +166,16 @@ class DataAdapter:
                     if validated_point:
                         validated_data.append(validated_point)
                 except Exception as e:
-                    self.logger.warning(f"Skipping invalid data point for {normalized_symbol}: {e}")
+                    self.logger.warning("Skipping invalid data point for %s: %s", normalized_symbol, e)
                     continue
             
-            self.logger.info(f"Retrieved {len(validated_data)} daily data points for {normalized_symbol}")
+            self.logger.info("Retrieved %s daily data points for %s", len(validated_data), normalized_symbol)
             return validated_data
             
         except InvalidSymbolError:
             raise  # Re-raise validation errors
         except Exception as e:
-            self.logger.error(f"Error getting daily data for {symbol}: {e}")
+            self.logger.error("Error getting daily data for %s: %s", symbol, e)
             return []
     
     def _validate_quote_data(self, data: Dict[str, Any], symbol: str) -> Dict[str, Any] | None:
@@ -212,7 +212,7 @@ class DataAdapter:
             
             # Validate price relationships
             if not (data['low'] <= data['price'] <= data['high']):
-                self.logger.warning(f"Price {data['price']} not between low {data['low']} and high {data['high']} for {symbol}")
+                self.logger.warning("Price %s not between low %s and high %s for %s", data['price'], data['low'], data['high'], symbol)
             
             # Ensure timestamp exists
             if 'timestamp' not in data or data['timestamp'] is None:
@@ -221,7 +221,7 @@ class DataAdapter:
             return data
             
         except DataParsingError as e:
-            self.logger.error(f"Quote data validation failed for {symbol}: {e}")
+            self.logger.error("Quote data validation failed for %s: %s", symbol, e)
             return None
     
     def _validate_daily_data_point(self, data: Dict[str, Any], symbol: str) -> Dict[str, Any] | None:
@@ -260,16 +260,16 @@ class DataAdapter:
             ohlc = [data['open'], data['high'], data['low'], data['close']]
             if not (data['low'] <= min(data['open'], data['close']) and 
                     data['high'] >= max(data['open'], data['close'])):
-                self.logger.warning(f"Invalid OHLC relationships for {symbol}: {ohlc}")
+                self.logger.warning("Invalid OHLC relationships for %s: %s", symbol, ohlc)
             
             # Validate timestamp
             if not isinstance(data['timestamp'], datetime):
-                self.logger.warning(f"Invalid timestamp type for {symbol}: {type(data['timestamp'])}")
+                self.logger.warning("Invalid timestamp type for %s: %s", symbol, type(data['timestamp']))
             
             return data
             
         except DataParsingError as e:
-            self.logger.error(f"Daily data point validation failed for {symbol}: {e}")
+            self.logger.error("Daily data point validation failed for %s: %s", symbol, e)
             return None
     
     def test_connection(self) -> bool:
@@ -288,7 +288,7 @@ class DataAdapter:
                 self.logger.warning("Provider connection test failed")
             return result
         except Exception as e:
-            self.logger.error(f"Provider connection test error: {e}")
+            self.logger.error("Provider connection test error: %s", e)
             return False
     
     async def get_latest_price(self, symbol: str) -> float | None:
@@ -307,5 +307,5 @@ class DataAdapter:
                 return float(quote_data['price'])
             return None
         except Exception as e:
-            self.logger.error(f"Error getting latest price for {symbol}: {e}")
+            self.logger.error("Error getting latest price for %s: %s", symbol, e)
             return None
\ No newline at end of file
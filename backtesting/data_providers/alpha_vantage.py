@@ -1,18 +1,46 @@
 """Alpha Vantage data provider for live market data."""
 
 import asyncio
+import json
 import logging
+import operator
+import time
 from datetime import datetime
 from typing import Any, Optional
 
 import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+
+from .parsing import DailyBar, normalize_symbol, parse_global_quote
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+# Returned by AlphaVantageDataProvider._fetch when the API throttles a request
+_RATE_LIMITED = object()
+
+# Seconds a successful connection test is reused before the API is probed again
+_CONNECTION_TEST_TTL = 60.0
+
+# Errors raised while decoding a response body
+_JSON_ERRORS = (ValueError, ijson.JSONError) if ijson else (ValueError,)
 
 
 class AlphaVantageDataProvider:
     """Data provider for Alpha Vantage API."""
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        max_concurrent_requests: int = 5,
+        max_retries: int = 4,
+        retry_min_wait: float = 12.0,
+        retry_max_wait: float = 60.0,
+    ):
         # Validate API key
         if not api_key or not isinstance(api_key, str):
             raise ValueError("API key must be a non-empty string")
@@ -21,7 +49,22 @@ class AlphaVantageDataProvider:
         
         self.api_key = api_key.strip()
         self.base_url = "https://www.alphavantage.co/query"
+        
+        # Request parameters shared by every call of each API function
+        self._daily_params = {"function": "TIME_SERIES_DAILY", "apikey": self.api_key}
+        self._intraday_params = {"function": "TIME_SERIES_INTRADAY", "apikey": self.api_key}
+        self._quote_params = {"function": "GLOBAL_QUOTE", "apikey": self.api_key}
         self.session: Optional[aiohttp.ClientSession] = None
+        self._sync_session: Optional[requests.Session] = None
+        self._connection_ok_until = 0.0
+        
+        # Rate-limit handling: cap in-flight requests and retry throttled
+        # ("Note") responses with exponential backoff
+        self.max_retries = max_retries
+        self.retry_min_wait = retry_min_wait
+        self.retry_max_wait = retry_max_wait
+        self.max_concurrent_requests = max_concurrent_requests
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
         
         # Setup logging
         self.logger = logging.getLogger("AlphaVantageDataProvider")
@@ -38,13 +81,50 @@ class AlphaVantageDataProvider:
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
+        await self.open_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
+        await self.close()
+
+    async def open_session(self) -> None:
+        """Open the pooled aiohttp session used for API requests.
+
+        Connections are kept alive and reused across requests, with the pool
+        sized to the request concurrency limit. Does nothing if a session is
+        already open.
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrent_requests,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
+            )
+            self.session = aiohttp.ClientSession(connector=connector)
+
+    async def close(self) -> None:
+        """Close any open HTTP sessions."""
         if self.session:
             await self.session.close()
+            self.session = None
+        if self._sync_session:
+            self._sync_session.close()
+            self._sync_session = None
+
+    def _get_sync_session(self) -> requests.Session:
+        """Return the pooled session used for synchronous requests, creating it on first use.
+
+        The adapter does not retry; throttled requests are retried by _request
+        without holding a concurrency slot.
+        """
+        if self._sync_session is None:
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._sync_session = session
+        return self._sync_session
 
     def _validate_symbol(self, symbol: str) -> str:
         """Validate and normalize symbol parameter."""
@@ -53,220 +133,161 @@ class AlphaVantageDataProvider:
         if not isinstance(symbol, str):
             raise ValueError("Symbol must be a string")
         
-        normalized = symbol.strip().upper()
-        if len(normalized) == 0:
-            raise ValueError("Symbol cannot be empty after trimming")
-        if len(normalized) > 10:
-            raise ValueError("Symbol is too long (max 10 characters)")
+        return normalize_symbol(symbol)
+
+    @staticmethod
+    async def _read_json(response: aiohttp.ClientResponse) -> Any:
+        """Decode a JSON response body.
+
+        With ijson installed the body is parsed incrementally as chunks arrive,
+        overlapping decoding with the download; otherwise it is read in full
+        and decoded afterwards.
+        """
+        if ijson is None:
+            return json.loads(await response.read())
+        async for document in ijson.items_async(response.content, "", use_float=True):
+            return document
+        raise ValueError("Empty response body")
+
+    async def _fetch(self, params: dict[str, str], description: str) -> Any:
+        """Issue a single API request.
+
+        Returns the decoded payload, None on failure, or _RATE_LIMITED when
+        the API answered with a throttling note.
+        """
+        symbol = params["symbol"]
+        data = None
+        try:
+            if self.session:
+                async with self.session.get(self.base_url, params=params, timeout=30) as response:
+                    status = response.status
+                    if status == 200:
+                        data = await self._read_json(response)
+            else:
+                # Fallback to a synchronous request, run in a worker thread so
+                # the event loop keeps running while it waits
+                response = await asyncio.to_thread(
+                    self._get_sync_session().get, self.base_url, params=params, timeout=30
+                )
+                status = response.status_code
+                if status == 200:
+                    data = json.loads(response.content)
+        except _JSON_ERRORS as json_error:
+            self.logger.error("JSON parsing error for %s: %s", symbol, json_error)
+            return None
+        except Exception as e:
+            self.logger.error("Exception fetching %s for %s: %s", description, symbol, e)
+            return None
+        
+        if status != 200:
+            self.logger.error("Error fetching %s for %s: HTTP %s", description, symbol, status)
+            return None
         
-        # Basic validation for alphanumeric with dots and dashes
-        if not all(c.isalnum() or c in '.-' for c in normalized):
-            raise ValueError("Symbol contains invalid characters")
+        # Check for API errors immediately
+        if "Error Message" in data:
+            self.logger.error("API Error for %s: %s", symbol, data['Error Message'])
+            return None
+        if "Note" in data:
+            self.logger.warning("API Note for %s: %s", symbol, data['Note'])
+            return _RATE_LIMITED
+        self.logger.info("Retrieved %s for %s", description, symbol)
+        return data
+
+    async def _request(self, params: dict[str, str], description: str) -> dict[str, Any] | None:
+        """Fetch from the API with bounded concurrency, backing off while rate limited."""
+        delay = self.retry_min_wait
+        for attempt in range(self.max_retries + 1):
+            async with self._semaphore:
+                data = await self._fetch(params, description)
+            if data is not _RATE_LIMITED:
+                return data
+            if attempt == self.max_retries:
+                break
+            self.logger.info(
+                "Rate limited fetching %s for %s, retrying in %.0fs (%d/%d)",
+                description, params["symbol"], delay, attempt + 1, self.max_retries,
+            )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.retry_max_wait)
         
-        return normalized
+        self.logger.error("Giving up on %s for %s: still rate limited", description, params['symbol'])
+        return None
 
     async def get_daily_data(self, symbol: str) -> dict[str, Any] | None:
         """Get daily time series data for a symbol."""
         try:
             normalized_symbol = self._validate_symbol(symbol)
         except ValueError as e:
-            self.logger.error(f"Invalid symbol '{symbol}': {e}")
+            self.logger.error("Invalid symbol '%s': %s", symbol, e)
             return None
         
-        params = {
-            "function": "TIME_SERIES_DAILY",
-            "symbol": normalized_symbol,
-            "apikey": self.api_key,
-        }
-        
-        try:
-            if self.session:
-                async with self.session.get(self.base_url, params=params, timeout=30) as response:
-                    if response.status == 200:
-                        try:
-                            data = await response.json()
-                            # Check for API errors immediately
-                            if "Error Message" in data:
-                                self.logger.error(f"API Error for {normalized_symbol}: {data['Error Message']}")
-                                return None
-                            if "Note" in data:
-                                self.logger.warning(f"API Note for {normalized_symbol}: {data['Note']}")
-                                return None
-                            self.logger.info(f"Retrieved daily data for {normalized_symbol}")
-                            return data
-                        except Exception as json_error:
-                            self.logger.error(f"JSON parsing error for {normalized_symbol}: {json_error}")
-                            return None
-                    else:
-                        self.logger.error(f"Error fetching data for {normalized_symbol}: HTTP {response.status}")
-                        return None
-            else:
-                # Fallback to synchronous request
-                response = requests.get(self.base_url, params=params, timeout=30)
-                if response.status_code == 200:
-                    try:
-                        data = response.json()
-                        # Check for API errors immediately
-                        if "Error Message" in data:
-                            self.logger.error(f"API Error for {normalized_symbol}: {data['Error Message']}")
-                            return None
-                        if "Note" in data:
-                            self.logger.warning(f"API Note for {normalized_symbol}: {data['Note']}")
-                            return None
-                        self.logger.info(f"Retrieved daily data for {normalized_symbol}")
-                        return data
-                    except Exception as json_error:
-                        self.logger.error(f"JSON parsing error for {normalized_symbol}: {json_error}")
-                        return None
-                else:
-                    self.logger.error(f"Error fetching data for {normalized_symbol}: HTTP {response.status_code}")
-                    return None
-                    
-        except Exception as e:
-            self.logger.error(f"Exception fetching data for {normalized_symbol}: {e}")
-            return None
+        params = {**self._daily_params, "symbol": normalized_symbol}
+        return await self._request(params, "daily data")
 
     async def get_intraday_data(self, symbol: str, interval: str = "5min") -> dict[str, Any] | None:
         """Get intraday time series data for a symbol."""
         try:
             normalized_symbol = self._validate_symbol(symbol)
         except ValueError as e:
-            self.logger.error(f"Invalid symbol '{symbol}': {e}")
+            self.logger.error("Invalid symbol '%s': %s", symbol, e)
             return None
         
         # Validate interval parameter
         valid_intervals = ["1min", "5min", "15min", "30min", "60min"]
         if interval not in valid_intervals:
-            self.logger.error(f"Invalid interval '{interval}'. Must be one of: {valid_intervals}")
+            self.logger.error("Invalid interval '%s'. Must be one of: %s", interval, valid_intervals)
             return None
         
-        params = {
-            "function": "TIME_SERIES_INTRADAY",
-            "symbol": normalized_symbol,
-            "interval": interval,
-            "apikey": self.api_key,
-        }
-        
-        try:
-            if self.session:
-                async with self.session.get(self.base_url, params=params, timeout=30) as response:
-                    if response.status == 200:
-                        try:
-                            data = await response.json()
-                            # Check for API errors immediately
-                            if "Error Message" in data:
-                                self.logger.error(f"API Error for {normalized_symbol}: {data['Error Message']}")
-                                return None
-                            if "Note" in data:
-                                self.logger.warning(f"API Note for {normalized_symbol}: {data['Note']}")
-                                return None
-                            self.logger.info(f"Retrieved intraday data for {normalized_symbol} ({interval})")
-                            return data
-                        except Exception as json_error:
-                            self.logger.error(f"JSON parsing error for {normalized_symbol}: {json_error}")
-                            return None
-                    else:
-                        self.logger.error(f"Error fetching intraday data for {normalized_symbol}: HTTP {response.status}")
-                        return None
-            else:
-                # Fallback to synchronous request
-                response = requests.get(self.base_url, params=params, timeout=30)
-                if response.status_code == 200:
-                    try:
-                        data = response.json()
-                        # Check for API errors immediately
-                        if "Error Message" in data:
-                            self.logger.error(f"API Error for {normalized_symbol}: {data['Error Message']}")
-                            return None
-                        if "Note" in data:
-                            self.logger.warning(f"API Note for {normalized_symbol}: {data['Note']}")
-                            return None
-                        self.logger.info(f"Retrieved intraday data for {normalized_symbol} ({interval})")
-                        return data
-                    except Exception as json_error:
-                        self.logger.error(f"JSON parsing error for {normalized_symbol}: {json_error}")
-                        return None
-                else:
-                    self.logger.error(f"Error fetching intraday data for {normalized_symbol}: HTTP {response.status_code}")
-                    return None
-                    
-        except Exception as e:
-            self.logger.error(f"Exception fetching intraday data for {normalized_symbol}: {e}")
-            return None
+        params = {**self._intraday_params, "symbol": normalized_symbol, "interval": interval}
+        return await self._request(params, f"intraday data ({interval})")
 
     async def get_quote(self, symbol: str) -> dict[str, Any] | None:
         """Get real-time quote for a symbol."""
         try:
             normalized_symbol = self._validate_symbol(symbol)
         except ValueError as e:
-            self.logger.error(f"Invalid symbol '{symbol}': {e}")
+            self.logger.error("Invalid symbol '%s': %s", symbol, e)
             return None
         
-        params = {
-            "function": "GLOBAL_QUOTE",
-            "symbol": normalized_symbol,
-            "apikey": self.api_key,
-        }
-        
-        try:
-            if self.session:
-                async with self.session.get(self.base_url, params=params, timeout=30) as response:
-                    if response.status == 200:
-                        try:
-                            data = await response.json()
-                            # Check for API errors immediately
-                            if "Error Message" in data:
-                                self.logger.error(f"API Error for {normalized_symbol}: {data['Error Message']}")
-                                return None
-                            if "Note" in data:
-                                self.logger.warning(f"API Note for {normalized_symbol}: {data['Note']}")
-                                return None
-                            self.logger.info(f"Retrieved quote for {normalized_symbol}")
-                            return data
-                        except Exception as json_error:
-                            self.logger.error(f"JSON parsing error for {normalized_symbol}: {json_error}")
-                            return None
-                    else:
-                        self.logger.error(f"Error fetching quote for {normalized_symbol}: HTTP {response.status}")
-                        return None
-            else:
-                # Fallback to synchronous request
-                response = requests.get(self.base_url, params=params, timeout=30)
-                if response.status_code == 200:
-                    try:
-                        data = response.json()
-                        # Check for API errors immediately
-                        if "Error Message" in data:
-                            self.logger.error(f"API Error for {normalized_symbol}: {data['Error Message']}")
-                            return None
-                        if "Note" in data:
-                            self.logger.warning(f"API Note for {normalized_symbol}: {data['Note']}")
-                            return None
-                        self.logger.info(f"Retrieved quote for {normalized_symbol}")
-                        return data
-                    except Exception as json_error:
-                        self.logger.error(f"JSON parsing error for {normalized_symbol}: {json_error}")
-                        return None
-                else:
-                    self.logger.error(f"Error fetching quote for {normalized_symbol}: HTTP {response.status_code}")
-                    return None
-                    
-        except Exception as e:
-            self.logger.error(f"Exception fetching quote for {normalized_symbol}: {e}")
-            return None
+        params = {**self._quote_params, "symbol": normalized_symbol}
+        return await self._request(params, "quote")
+
+    async def get_batch_quotes(self, symbols: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch and parse quotes for several symbols concurrently.
+
+        Alpha Vantage has no multi-symbol quote endpoint, so this issues the
+        per-symbol requests in parallel (bounded by the request semaphore). Symbols whose quote could not
+        be fetched or parsed are left out of the result.
+        """
+        raw_quotes = await asyncio.gather(
+            *(self.get_quote(symbol) for symbol in symbols), return_exceptions=True
+        )
+        quotes = {}
+        for symbol, raw_quote in zip(symbols, raw_quotes):
+            if isinstance(raw_quote, Exception):
+                self.logger.error("Error fetching quote for %s: %s", symbol, raw_quote)
+            elif raw_quote:
+                parsed_quote = self.parse_quote_data(raw_quote)
+                if parsed_quote:
+                    quotes[symbol] = parsed_quote
+        return quotes
 
     def parse_daily_data(self, raw_data: dict[str, Any]) -> list[dict[str, Any]]:
         """Parse daily data from Alpha Vantage response."""
+        return [bar.as_dict() for bar in self.parse_daily_bars(raw_data)]
+
+    def parse_daily_bars(self, raw_data: dict[str, Any]) -> list[DailyBar]:
+        """Parse daily data from Alpha Vantage response into DailyBar objects."""
         if not raw_data or not isinstance(raw_data, dict):
             self.logger.error("Invalid raw data: not a dictionary")
             return []
         
         if "Error Message" in raw_data:
-            self.logger.error(f"API Error: {raw_data['Error Message']}")
+            self.logger.error("API Error: %s", raw_data['Error Message'])
             return []
             
         if "Note" in raw_data:
-            self.logger.warning(f"API Note: {raw_data['Note']}")
+            self.logger.warning("API Note: %s", raw_data['Note'])
             return []
             
         time_series_key = "Time Series (Daily)"
@@ -280,11 +301,12 @@ class AlphaVantageDataProvider:
             return []
             
         parsed_data = []
+        newest_first = True
         
         for date_str, values in time_series.items():
             try:
                 if not isinstance(values, dict):
-                    self.logger.warning(f"Skipping invalid data for {date_str}: not a dictionary")
+                    self.logger.warning("Skipping invalid data for %s: not a dictionary", date_str)
                     continue
                 
                 # Validate required fields exist
@@ -297,7 +319,7 @@ class AlphaVantageDataProvider:
                 try:
                     timestamp = datetime.strptime(date_str, "%Y-%m-%d")
                 except ValueError as e:
-                    self.logger.warning(f"Invalid date format {date_str}: {e}")
+                    self.logger.warning("Invalid date format %s: %s", date_str, e)
                     continue
                 
                 # Parse and validate numeric values
@@ -308,40 +330,38 @@ class AlphaVantageDataProvider:
                     close_price = float(values["4. close"])
                     volume = int(values["5. volume"])
                 except (ValueError, TypeError) as e:
-                    self.logger.warning(f"Invalid numeric data for {date_str}: {e}")
+                    self.logger.warning("Invalid numeric data for %s: %s", date_str, e)
                     continue
                 
                 # Validate price ranges
                 if any(price <= 0 for price in [open_price, high_price, low_price, close_price]):
-                    self.logger.warning(f"Non-positive prices for {date_str}")
+                    self.logger.warning("Non-positive prices for %s", date_str)
                     continue
                 
                 if volume < 0:
-                    self.logger.warning(f"Negative volume for {date_str}: {volume}")
+                    self.logger.warning("Negative volume for %s: %s", date_str, volume)
                     continue
                 
                 # Validate OHLC relationships
                 if not (low_price <= min(open_price, close_price) and 
                         high_price >= max(open_price, close_price)):
-                    self.logger.warning(f"Invalid OHLC relationships for {date_str}")
+                    self.logger.warning("Invalid OHLC relationships for %s", date_str)
                     # Don't skip - just log warning
                 
-                parsed_data.append({
-                    "timestamp": timestamp,
-                    "open": open_price,
-                    "high": high_price,
-                    "low": low_price,
-                    "close": close_price,
-                    "volume": volume,
-                })
+                if parsed_data and timestamp > parsed_data[-1].timestamp:
+                    newest_first = False
+                parsed_data.append(
+                    DailyBar(timestamp, open_price, high_price, low_price, close_price, volume)
+                )
                 
             except Exception as e:
-                self.logger.error(f"Error parsing data for {date_str}: {e}")
+                self.logger.error("Error parsing data for %s: %s", date_str, e)
                 continue
                 
-        # Sort by timestamp (newest first by default from Alpha Vantage)
-        parsed_data.sort(key=lambda x: x["timestamp"], reverse=True)
-        self.logger.info(f"Successfully parsed {len(parsed_data)} daily data points")
+        # Alpha Vantage already returns newest first; only sort if a payload doesn't
+        if not newest_first:
+            parsed_data.sort(key=operator.attrgetter("timestamp"), reverse=True)
+        self.logger.info("Successfully parsed %s daily data points", len(parsed_data))
         return parsed_data
 
     def parse_quote_data(self, raw_data: dict[str, Any]) -> dict[str, Any] | None:
@@ -351,11 +371,11 @@ class AlphaVantageDataProvider:
             return None
         
         if "Error Message" in raw_data:
-            self.logger.error(f"API Error: {raw_data['Error Message']}")
+            self.logger.error("API Error: %s", raw_data['Error Message'])
             return None
             
         if "Note" in raw_data:
-            self.logger.warning(f"API Note: {raw_data['Note']}")
+            self.logger.warning("API Note: %s", raw_data['Note'])
             return None
             
         quote_key = "Global Quote"
@@ -369,58 +389,29 @@ class AlphaVantageDataProvider:
             return None
             
         try:
-            # Validate required fields exist
-            required_fields = [
-                "01. symbol", "05. price", "02. open", "03. high", "04. low",
-                "06. volume", "07. latest trading day", "08. previous close",
-                "09. change", "10. change percent"
-            ]
-            for field in required_fields:
-                if field not in quote:
-                    raise ValueError(f"Missing field: {field}")
+            parsed = parse_global_quote(quote)
             
-            # Parse and validate numeric values
-            try:
-                price = float(quote["05. price"])
-                open_price = float(quote["02. open"])
-                high_price = float(quote["03. high"])
-                low_price = float(quote["04. low"])
-                volume = int(quote["06. volume"])
-                previous_close = float(quote["08. previous close"])
-                change = float(quote["09. change"])
-            except (ValueError, TypeError) as e:
-                raise ValueError(f"Invalid numeric data: {e}")
+            price = parsed["price"]
+            low_price = parsed["low"]
+            high_price = parsed["high"]
+            volume = parsed["volume"]
             
             # Validate price ranges
-            if any(price_val <= 0 for price_val in [price, open_price, high_price, low_price, previous_close]):
+            if min(price, parsed["open"], high_price, low_price, parsed["previous_close"]) <= 0:
                 self.logger.warning("Non-positive prices detected")
             
             if volume < 0:
-                self.logger.warning(f"Negative volume detected: {volume}")
+                self.logger.warning("Negative volume detected: %s", volume)
             
             # Validate OHLC relationships
             if not (low_price <= price <= high_price):
-                self.logger.warning(f"Price {price} not between low {low_price} and high {high_price}")
-            
-            # Parse change percent (remove % sign)
-            change_percent_str = quote["10. change percent"].rstrip("%")
+                self.logger.warning("Price %s not between low %s and high %s", price, low_price, high_price)
             
-            return {
-                "symbol": quote["01. symbol"],
-                "price": price,
-                "open": open_price,
-                "high": high_price,
-                "low": low_price,
-                "volume": volume,
-                "latest_trading_day": quote["07. latest trading day"],
-                "previous_close": previous_close,
-                "change": change,
-                "change_percent": change_percent_str,
-                "timestamp": datetime.now(),
-            }
+            parsed["timestamp"] = datetime.now()
+            return parsed
             
         except (KeyError, ValueError) as e:
-            self.logger.error(f"Error parsing quote data: {e}")
+            self.logger.error("Error parsing quote data: %s", e)
             return None
 
     async def get_latest_price(self, symbol: str) -> float | None:
@@ -434,27 +425,46 @@ class AlphaVantageDataProvider:
 
     def test_connection(self) -> bool:
         """Test connection to Alpha Vantage API."""
+        if time.monotonic() < self._connection_ok_until:
+            return True
         try:
-            response = requests.get(
+            response = self._get_sync_session().get(
                 self.base_url,
-                params={
-                    "function": "GLOBAL_QUOTE",
-                    "symbol": "IBM",
-                    "apikey": self.api_key,
-                },
+                params={**self._quote_params, "symbol": "IBM"},
                 timeout=10,
             )
             if response.status_code == 200:
                 data = response.json()
                 if "Error Message" not in data and "Note" not in data:
                     self.logger.info("Alpha Vantage API connection test successful")
+                    self._connection_ok_until = time.monotonic() + _CONNECTION_TEST_TTL
                     return True
                 else:
-                    self.logger.error(f"API Error: {data.get('Error Message', data.get('Note', 'Unknown error'))}")
+                    self.logger.error("API Error: %s", data.get('Error Message', data.get('Note', 'Unknown error')))
                     return False
             else:
-                self.logger.error(f"HTTP Error: {response.status_code}")
+                self.logger.error("HTTP Error: %s", response.status_code)
                 return False
         except Exception as e:
-            self.logger.error(f"Connection test failed: {e}")
-            return False
\ No newline at end of file
+            self.logger.error("Connection test failed: %s", e)
+            return False
+
+    async def test_connection_async(self) -> bool:
+        """Test connection to Alpha Vantage API without blocking the event loop.
+
+        Uses the aiohttp session when one is open, otherwise runs
+        test_connection in a worker thread. Successful results are cached
+        for a minute, shared with test_connection.
+        """
+        if time.monotonic() < self._connection_ok_until:
+            return True
+        if not self.session:
+            return await asyncio.to_thread(self.test_connection)
+        
+        data = await self._fetch({**self._quote_params, "symbol": "IBM"}, "connection test quote")
+        if data is None or data is _RATE_LIMITED:
+            self.logger.error("Alpha Vantage API connection test failed")
+            return False
+        self.logger.info("Alpha Vantage API connection test successful")
+        self._connection_ok_until = time.monotonic() + _CONNECTION_TEST_TTL
+        return True
@@ -2,15 +2,59 @@
 
 import asyncio
 import logging
-import random
-from datetime import datetime
+import operator
+from datetime import datetime, timedelta
 from typing import Any
 
+import numpy as np
+
+from ..jit import njit
+from .parsing import DailyBar, normalize_symbol, parse_global_quote
+
+
+# Number of price-movement draws generated per symbol in one RNG call
+_NOISE_BATCH_SIZE = 4096
+
+# Bounds of the open/high/low/previous-close multipliers drawn for a quote
+_QUOTE_MULT_LOW = np.array([0.99, 1.0, 0.98, 0.98])
+_QUOTE_MULT_HIGH = np.array([1.01, 1.02, 1.0, 1.02])
+
+# Number of daily bars returned by get_daily_data
+_DAILY_BARS = 10
+
+
+@njit(cache=True)
+def _price_path(start_price, min_price, max_price, changes):
+    """Apply successive fractional price changes, clamping each step to the bounds."""
+    path = np.empty(changes.shape[0])
+    price = start_price
+    for i in range(changes.shape[0]):
+        price = price * (1.0 + changes[i])
+        if price > max_price:
+            price = max_price
+        elif price < min_price:
+            price = min_price
+        path[i] = price
+    return path
+
 
 class MockAlphaVantageDataProvider:
-    """Mock data provider that simulates Alpha Vantage API responses."""
+    """Mock data provider that simulates Alpha Vantage API responses.
 
-    def __init__(self, api_key: str):
+    By default daily bars carry native floats/ints instead of Alpha Vantage's
+    formatted strings, which parse_daily_data accepts without a string
+    round-trip. Pass ``strict=True`` to reproduce the exact wire format, e.g.
+    when exercising parsers. ``simulated_latency`` adds a per-request delay in
+    seconds (none by default) for tests that need realistic API timing.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        seed: int | None = None,
+        strict: bool = False,
+        simulated_latency: float = 0.0,
+    ):
         # Validate API key (even for mock)
         if not api_key or not isinstance(api_key, str):
             raise ValueError("API key must be a non-empty string")
@@ -20,6 +64,14 @@ class MockAlphaVantageDataProvider:
         self.api_key = api_key.strip()
         self.base_prices = {"IBM": 150.0, "AAPL": 175.0, "MSFT": 300.0}
         self.price_history = {}
+        self.strict = strict
+        self.simulated_latency = simulated_latency
+        self._price_bounds: dict[str, tuple[float, float]] = {}
+        
+        # Batched random draws; seed makes the generated data reproducible
+        self._rng = np.random.default_rng(seed)
+        self._noise_cache: dict[str, np.ndarray] = {}
+        self._noise_cursor: dict[str, int] = {}
         
         # Setup logging
         self.logger = logging.getLogger("MockAlphaVantageDataProvider")
@@ -49,59 +101,86 @@ class MockAlphaVantageDataProvider:
         if not isinstance(symbol, str):
             raise ValueError("Symbol must be a string")
         
-        normalized = symbol.strip().upper()
-        if len(normalized) == 0:
-            raise ValueError("Symbol cannot be empty after trimming")
-        if len(normalized) > 10:
-            raise ValueError("Symbol is too long (max 10 characters)")
-        
-        # Basic validation for alphanumeric with dots and dashes
-        if not all(c.isalnum() or c in '.-' for c in normalized):
-            raise ValueError("Symbol contains invalid characters")
-        
-        return normalized
+        return normalize_symbol(symbol)
+
+    def _next_price_change(self, symbol: str) -> float:
+        """Return the next pre-generated price change (-2% to +2%) for a symbol."""
+        noise = self._noise_cache.get(symbol)
+        cursor = self._noise_cursor.get(symbol, 0)
+        if noise is None or cursor >= len(noise):
+            noise = self._rng.uniform(-0.02, 0.02, size=_NOISE_BATCH_SIZE)
+            self._noise_cache[symbol] = noise
+            cursor = 0
+        self._noise_cursor[symbol] = cursor + 1
+        return float(noise[cursor])
+
+    def _get_price_bounds(self, symbol: str) -> tuple[float, float]:
+        """Return the (min, max) price band for a symbol, seeding its history on first use."""
+        bounds = self._price_bounds.get(symbol)
+        if bounds is None:
+            # Keep price within reasonable bounds (+/-20% of the base price)
+            base_price = self.base_prices.get(symbol, 100.0)
+            bounds = self._price_bounds[symbol] = (base_price * 0.8, base_price * 1.2)
+            self.price_history.setdefault(symbol, base_price)
+        return bounds
 
     def _generate_price(self, symbol: str) -> float:
         """Generate a realistic price with some random movement."""
-        base_price = self.base_prices.get(symbol, 100.0)
-        
-        if symbol not in self.price_history:
-            self.price_history[symbol] = base_price
+        min_price, max_price = self._get_price_bounds(symbol)
         
         # Add some random movement (-2% to +2%)
-        change_percent = random.uniform(-0.02, 0.02)
+        change_percent = self._next_price_change(symbol)
         new_price = self.price_history[symbol] * (1 + change_percent)
         
-        # Keep price within reasonable bounds
-        min_price = base_price * 0.8
-        max_price = base_price * 1.2
-        new_price = max(min_price, min(max_price, new_price))
+        if new_price > max_price:
+            new_price = max_price
+        elif new_price < min_price:
+            new_price = min_price
         
         self.price_history[symbol] = new_price
         return new_price
 
+    def generate_price_path(self, symbol: str, steps: int) -> np.ndarray:
+        """Advance a symbol's mock price ``steps`` times in a single call.
+
+        Follows the same random walk as repeated quotes (-2% to +2% per step,
+        clamped to +/-20% of the base price) and is meant for feeding large
+        backtests without per-tick overhead.
+        """
+        normalized_symbol = self._validate_symbol(symbol)
+        min_price, max_price = self._get_price_bounds(normalized_symbol)
+        changes = self._rng.uniform(-0.02, 0.02, size=steps)
+        path = _price_path(self.price_history[normalized_symbol], min_price, max_price, changes)
+        if steps > 0:
+            self.price_history[normalized_symbol] = float(path[-1])
+        return path
+
     async def get_quote(self, symbol: str) -> dict[str, Any]:
         """Get mock quote data."""
         try:
             normalized_symbol = self._validate_symbol(symbol)
         except ValueError as e:
-            self.logger.error(f"Invalid symbol '{symbol}': {e}")
+            self.logger.error("Invalid symbol '%s': %s", symbol, e)
             return {}
         
         try:
             # Simulate API delay
-            await asyncio.sleep(0.1)
+            if self.simulated_latency:
+                await asyncio.sleep(self.simulated_latency)
             
             price = self._generate_price(normalized_symbol)
-            open_price = price * random.uniform(0.99, 1.01)
-            high_price = max(price, open_price) * random.uniform(1.0, 1.02)
-            low_price = min(price, open_price) * random.uniform(0.98, 1.0)
-            volume = random.randint(100000, 5000000)
-            previous_close = price * random.uniform(0.98, 1.02)
+            open_mult, high_mult, low_mult, close_mult = self._rng.uniform(
+                _QUOTE_MULT_LOW, _QUOTE_MULT_HIGH
+            ).tolist()
+            open_price = price * open_mult
+            high_price = max(price, open_price) * high_mult
+            low_price = min(price, open_price) * low_mult
+            volume = int(self._rng.integers(100000, 5000000, endpoint=True))
+            previous_close = price * close_mult
             change = price - previous_close
             change_percent = f"{(change / previous_close * 100):+.2f}%"
             
-            self.logger.info(f"Generated mock quote for {normalized_symbol}: ${price:.2f}")
+            self.logger.info("Generated mock quote for %s: $%.2f", normalized_symbol, price)
             
             return {
                 "Global Quote": {
@@ -118,9 +197,29 @@ class MockAlphaVantageDataProvider:
                 }
             }
         except Exception as e:
-            self.logger.error(f"Error generating mock quote for {normalized_symbol}: {e}")
+            self.logger.error("Error generating mock quote for %s: %s", normalized_symbol, e)
             return {}
 
+    async def get_batch_quotes(self, symbols: list[str]) -> dict[str, dict[str, Any]]:
+        """Fetch and parse quotes for several symbols concurrently.
+
+        Mirrors AlphaVantageDataProvider.get_batch_quotes by generating the
+        per-symbol quotes concurrently. Symbols whose quote could not be
+        generated or parsed are left out of the result.
+        """
+        raw_quotes = await asyncio.gather(
+            *(self.get_quote(symbol) for symbol in symbols), return_exceptions=True
+        )
+        quotes = {}
+        for symbol, raw_quote in zip(symbols, raw_quotes):
+            if isinstance(raw_quote, Exception):
+                self.logger.error("Error generating quote for %s: %s", symbol, raw_quote)
+            elif raw_quote:
+                parsed_quote = self.parse_quote_data(raw_quote)
+                if parsed_quote:
+                    quotes[symbol] = parsed_quote
+        return quotes
+
     def parse_quote_data(self, raw_data: dict[str, Any]) -> dict[str, Any] | None:
         """Parse quote data from mock response."""
         if not raw_data or not isinstance(raw_data, dict):
@@ -138,54 +237,25 @@ class MockAlphaVantageDataProvider:
             return None
             
         try:
-            # Validate required fields exist
-            required_fields = [
-                "01. symbol", "05. price", "02. open", "03. high", "04. low",
-                "06. volume", "07. latest trading day", "08. previous close",
-                "09. change", "10. change percent"
-            ]
-            for field in required_fields:
-                if field not in quote:
-                    raise ValueError(f"Missing field: {field}")
+            parsed = parse_global_quote(quote)
             
-            # Parse and validate numeric values
-            try:
-                price = float(quote["05. price"])
-                open_price = float(quote["02. open"])
-                high_price = float(quote["03. high"])
-                low_price = float(quote["04. low"])
-                volume = int(quote["06. volume"])
-                previous_close = float(quote["08. previous close"])
-                change = float(quote["09. change"])
-            except (ValueError, TypeError) as e:
-                raise ValueError(f"Invalid numeric data: {e}")
+            price = parsed["price"]
+            low_price = parsed["low"]
+            high_price = parsed["high"]
+            volume = parsed["volume"]
             
             # Validate price ranges
-            if any(price_val <= 0 for price_val in [price, open_price, high_price, low_price, previous_close]):
+            if min(price, parsed["open"], high_price, low_price, parsed["previous_close"]) <= 0:
                 self.logger.warning("Non-positive prices detected")
             
             if volume < 0:
-                self.logger.warning(f"Negative volume detected: {volume}")
+                self.logger.warning("Negative volume detected: %s", volume)
             
-            # Parse change percent (remove % sign)
-            change_percent_str = quote["10. change percent"].rstrip("%")
-            
-            return {
-                "symbol": quote["01. symbol"],
-                "price": price,
-                "open": open_price,
-                "high": high_price,
-                "low": low_price,
-                "volume": volume,
-                "latest_trading_day": quote["07. latest trading day"],
-                "previous_close": previous_close,
-                "change": change,
-                "change_percent": change_percent_str,
-                "timestamp": datetime.now(),
-            }
+            parsed["timestamp"] = datetime.now()
+            return parsed
             
         except (KeyError, ValueError) as e:
-            self.logger.error(f"Error parsing quote data: {e}")
+            self.logger.error("Error parsing quote data: %s", e)
             return None
 
     def test_connection(self) -> bool:
@@ -193,65 +263,93 @@ class MockAlphaVantageDataProvider:
         self.logger.info("Mock Alpha Vantage API connection test successful")
         return True
 
+    async def test_connection_async(self) -> bool:
+        """Async variant of test_connection (always returns True for mock)."""
+        return self.test_connection()
+
     async def get_daily_data(self, symbol: str) -> dict[str, Any]:
         """Get mock daily data."""
         try:
             normalized_symbol = self._validate_symbol(symbol)
         except ValueError as e:
-            self.logger.error(f"Invalid symbol '{symbol}': {e}")
+            self.logger.error("Invalid symbol '%s': %s", symbol, e)
             return {}
         
         try:
-            await asyncio.sleep(0.1)
+            if self.simulated_latency:
+                await asyncio.sleep(self.simulated_latency)
             
-            # Generate some mock daily data
-            time_series = {}
+            today = datetime.now().date()
+            
+            # Generate OHLCV data with realistic relationships in one batch;
+            # each day opens relative to the previous day's close
+            rng = self._rng
             base_price = self.base_prices.get(normalized_symbol, 100.0)
+            open_mults = rng.uniform(0.98, 1.02, _DAILY_BARS)
+            close_mults = rng.uniform(0.97, 1.03, _DAILY_BARS)
+            day_mults = open_mults * close_mults
+            bases = base_price * np.concatenate(([1.0], np.cumprod(day_mults[:-1])))
+            opens = bases * open_mults
+            closes = opens * close_mults
+            highs = np.maximum(opens, closes) * rng.uniform(1.0, 1.02, _DAILY_BARS)
+            lows = np.minimum(opens, closes) * rng.uniform(0.98, 1.0, _DAILY_BARS)
+            volumes = rng.integers(500000, 10000000, _DAILY_BARS, endpoint=True)
             
-            for i in range(10):  # Last 10 days
-                date = datetime.now().date()
-                date_str = date.strftime("%Y-%m-%d")
-                
-                # Generate OHLCV data with realistic relationships
-                open_price = base_price * random.uniform(0.98, 1.02)
-                close_price = open_price * random.uniform(0.97, 1.03)
-                high_price = max(open_price, close_price) * random.uniform(1.0, 1.02)
-                low_price = min(open_price, close_price) * random.uniform(0.98, 1.0)
-                volume = random.randint(500000, 10000000)
+            # Bars are generated oldest first (ending today) and emitted newest
+            # first, matching Alpha Vantage's ordering
+            time_series = {}
+            bars = list(zip(
+                opens.tolist(), highs.tolist(), lows.tolist(), closes.tolist(), volumes.tolist()
+            ))
+            for days_ago, (open_price, high_price, low_price, close_price, volume) in enumerate(
+                reversed(bars)
+            ):
+                date_str = (today - timedelta(days=days_ago)).strftime("%Y-%m-%d")
                 
                 # Ensure prices are positive
-                if any(price <= 0 for price in [open_price, close_price, high_price, low_price]):
-                    self.logger.warning(f"Generated non-positive price for {normalized_symbol} on {date_str}")
+                if low_price <= 0:
+                    self.logger.warning("Generated non-positive price for %s on %s", normalized_symbol, date_str)
                     continue
                 
-                time_series[date_str] = {
-                    "1. open": f"{open_price:.4f}",
-                    "2. high": f"{high_price:.4f}",
-                    "3. low": f"{low_price:.4f}",
-                    "4. close": f"{close_price:.4f}",
-                    "5. volume": str(volume),
-                }
-                
-                base_price = close_price  # For next day
+                if self.strict:
+                    time_series[date_str] = {
+                        "1. open": f"{open_price:.4f}",
+                        "2. high": f"{high_price:.4f}",
+                        "3. low": f"{low_price:.4f}",
+                        "4. close": f"{close_price:.4f}",
+                        "5. volume": str(volume),
+                    }
+                else:
+                    time_series[date_str] = {
+                        "1. open": open_price,
+                        "2. high": high_price,
+                        "3. low": low_price,
+                        "4. close": close_price,
+                        "5. volume": volume,
+                    }
             
-            self.logger.info(f"Generated mock daily data for {normalized_symbol}")
+            self.logger.info("Generated mock daily data for %s", normalized_symbol)
             
             return {
                 "Meta Data": {
                     "1. Information": "Daily Prices (open, high, low, close) and Volumes",
                     "2. Symbol": normalized_symbol,
-                    "3. Last Refreshed": datetime.now().strftime("%Y-%m-%d"),
+                    "3. Last Refreshed": today.strftime("%Y-%m-%d"),
                     "4. Output Size": "Compact",
                     "5. Time Zone": "US/Eastern"
                 },
                 "Time Series (Daily)": time_series
             }
         except Exception as e:
-            self.logger.error(f"Error generating mock daily data for {normalized_symbol}: {e}")
+            self.logger.error("Error generating mock daily data for %s: %s", normalized_symbol, e)
             return {}
 
     def parse_daily_data(self, raw_data: dict[str, Any]) -> list[dict[str, Any]]:
         """Parse daily data from mock response."""
+        return [bar.as_dict() for bar in self.parse_daily_bars(raw_data)]
+
+    def parse_daily_bars(self, raw_data: dict[str, Any]) -> list[DailyBar]:
+        """Parse daily data from mock response into DailyBar objects."""
         if not raw_data or not isinstance(raw_data, dict):
             self.logger.error("Invalid raw data: not a dictionary")
             return []
@@ -267,11 +365,12 @@ class MockAlphaVantageDataProvider:
             return []
             
         parsed_data = []
+        newest_first = True
         
         for date_str, values in time_series.items():
             try:
                 if not isinstance(values, dict):
-                    self.logger.warning(f"Skipping invalid data for {date_str}: not a dictionary")
+                    self.logger.warning("Skipping invalid data for %s: not a dictionary", date_str)
                     continue
                 
                 # Validate required fields exist
@@ -284,7 +383,7 @@ class MockAlphaVantageDataProvider:
                 try:
                     timestamp = datetime.strptime(date_str, "%Y-%m-%d")
                 except ValueError as e:
-                    self.logger.warning(f"Invalid date format {date_str}: {e}")
+                    self.logger.warning("Invalid date format %s: %s", date_str, e)
                     continue
                 
                 # Parse and validate numeric values
@@ -295,32 +394,30 @@ class MockAlphaVantageDataProvider:
                     close_price = float(values["4. close"])
                     volume = int(values["5. volume"])
                 except (ValueError, TypeError) as e:
-                    self.logger.warning(f"Invalid numeric data for {date_str}: {e}")
+                    self.logger.warning("Invalid numeric data for %s: %s", date_str, e)
                     continue
                 
                 # Validate price ranges
                 if any(price <= 0 for price in [open_price, high_price, low_price, close_price]):
-                    self.logger.warning(f"Non-positive prices for {date_str}")
+                    self.logger.warning("Non-positive prices for %s", date_str)
                     continue
                 
                 if volume < 0:
-                    self.logger.warning(f"Negative volume for {date_str}: {volume}")
+                    self.logger.warning("Negative volume for %s: %s", date_str, volume)
                     continue
                 
-                parsed_data.append({
-                    "timestamp": timestamp,
-                    "open": open_price,
-                    "high": high_price,
-                    "low": low_price,
-                    "close": close_price,
-                    "volume": volume,
-                })
+                if parsed_data and timestamp > parsed_data[-1].timestamp:
+                    newest_first = False
+                parsed_data.append(
+                    DailyBar(timestamp, open_price, high_price, low_price, close_price, volume)
+                )
                 
             except Exception as e:
-                self.logger.error(f"Error parsing data for {date_str}: {e}")
+                self.logger.error("Error parsing data for %s: %s", date_str, e)
                 continue
                 
-        # Sort by timestamp (newest first)
-        parsed_data.sort(key=lambda x: x["timestamp"], reverse=True)
-        self.logger.info(f"Successfully parsed {len(parsed_data)} daily data points")
+        # Alpha Vantage already returns newest first; only sort if a payload doesn't
+        if not newest_first:
+            parsed_data.sort(key=operator.attrgetter("timestamp"), reverse=True)
+        self.logger.info("Successfully parsed %s daily data points", len(parsed_data))
         return parsed_data
\ No newline at end of file
@@ -0,0 +1,88 @@
+"""Validation and parsing helpers shared by the Alpha Vantage providers."""
+
+import functools
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+
+# Alphanumeric tickers with dots and dashes
+_SYMBOL_RE = re.compile(r"[A-Z0-9.\-]+")
+
+
+@functools.lru_cache(maxsize=1024)
+def normalize_symbol(symbol: str) -> str:
+    """Trim, upper-case and validate a symbol string.
+
+    Raises:
+        ValueError: If the symbol is empty, too long or has invalid characters
+    """
+    normalized = symbol.strip().upper()
+    if len(normalized) == 0:
+        raise ValueError("Symbol cannot be empty after trimming")
+    if len(normalized) > 10:
+        raise ValueError("Symbol is too long (max 10 characters)")
+    if not _SYMBOL_RE.fullmatch(normalized):
+        raise ValueError("Symbol contains invalid characters")
+    return normalized
+
+
+def _strip_percent(value: str) -> str:
+    """Drop the trailing percent sign from a change-percent string."""
+    return value.rstrip("%")
+
+
+# (parsed key, Global Quote key, converter), in the order of the parsed quote
+QUOTE_FIELDS = (
+    ("symbol", "01. symbol", str),
+    ("price", "05. price", float),
+    ("open", "02. open", float),
+    ("high", "03. high", float),
+    ("low", "04. low", float),
+    ("volume", "06. volume", int),
+    ("latest_trading_day", "07. latest trading day", str),
+    ("previous_close", "08. previous close", float),
+    ("change", "09. change", float),
+    ("change_percent", "10. change percent", _strip_percent),
+)
+
+
+def parse_global_quote(quote: dict[str, Any]) -> dict[str, Any]:
+    """Convert a raw "Global Quote" mapping into typed quote fields.
+
+    Raises:
+        ValueError: If a field is missing or holds non-numeric data
+    """
+    # Validate required fields exist
+    for _, field, _ in QUOTE_FIELDS:
+        if field not in quote:
+            raise ValueError(f"Missing field: {field}")
+
+    try:
+        return {name: convert(quote[field]) for name, field, convert in QUOTE_FIELDS}
+    except (ValueError, TypeError, AttributeError) as e:
+        raise ValueError(f"Invalid numeric data: {e}")
+
+
+@dataclass(slots=True, frozen=True)
+class DailyBar:
+    """A single parsed daily OHLCV bar."""
+
+    timestamp: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: int
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the bar in the dictionary form used by parse_daily_data."""
+        return {
+            "timestamp": self.timestamp,
+            "open": self.open,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "volume": self.volume,
+        }
@@ -1,6 +1,9 @@
 """Bridge utility to transfer backtest configurations to live trading."""
 
+import io
 import logging
+import time
+import weakref
 from typing import Any, Dict, Optional
 from datetime import datetime
 
@@ -11,11 +14,18 @@ from ..data_providers.mock_alpha_vantage import MockAlphaVantageDataProvider
 from ..execution.live_engine import LiveTradingEngine
 from ..core.engine import BacktestResults
 from ..metrics.calculator import MetricsCalculator
+from ..metrics.performance import PerformanceMetrics
+
+
+# time.strftime template for paper trading account ids
+_ACCOUNT_ID_FORMAT = "PAPER_LIVE_%Y%m%d_%H%M%S"
 
 
 class BacktestToLiveBridge:
     """Bridge to help transition from backtest to live trading."""
     
+    __slots__ = ("alpha_vantage_api_key", "logger", "_metrics_cache")
+    
     def __init__(self, alpha_vantage_api_key: str):
         self.alpha_vantage_api_key = alpha_vantage_api_key
         self.logger = logging.getLogger("BacktestToLiveBridge")
@@ -27,6 +37,11 @@ class BacktestToLiveBridge:
             handler.setFormatter(formatter)
             self.logger.addHandler(handler)
             self.logger.setLevel(logging.INFO)
+        
+        # Metrics per results object; entries go away with the results
+        self._metrics_cache: weakref.WeakKeyDictionary[BacktestResults, PerformanceMetrics] = (
+            weakref.WeakKeyDictionary()
+        )
     
     def create_paper_trading_setup(
         self,
@@ -54,7 +69,7 @@ class BacktestToLiveBridge:
             data_provider = MockAlphaVantageDataProvider(self.alpha_vantage_api_key)
         
         # Create paper broker
-        account_id = f"PAPER_LIVE_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        account_id = time.strftime(_ACCOUNT_ID_FORMAT)
         broker = PaperBroker(account_id, initial_cash)
         
         # Create live trading engine
@@ -76,7 +91,10 @@ class BacktestToLiveBridge:
             'update_interval': update_interval
         }
         
-        self.logger.info(f"Created paper trading setup with {len(symbols)} symbols and ${initial_cash:,.2f} initial cash")
+        self.logger.info(
+            "Created paper trading setup with %d symbols and $%s initial cash",
+            len(symbols), f"{initial_cash:,.2f}",
+        )
         
         return setup_info
     
@@ -86,8 +104,11 @@ class BacktestToLiveBridge:
             return {}
         
         try:
-            # Calculate comprehensive metrics
-            metrics = MetricsCalculator.calculate(backtest_results)
+            # Calculate comprehensive metrics once per results object
+            metrics = self._metrics_cache.get(backtest_results)
+            if metrics is None:
+                metrics = MetricsCalculator.calculate(backtest_results)
+                self._metrics_cache[backtest_results] = metrics
             
             # Extract key insights for live trading
             analysis = {
@@ -107,14 +128,15 @@ class BacktestToLiveBridge:
             recommendations = self._generate_live_trading_recommendations(analysis)
             analysis['recommendations'] = recommendations
             
-            self.logger.info(f"Analyzed backtest: {metrics.total_trades} trades, "
-                           f"{metrics.sharpe_ratio:.2f} Sharpe ratio, "
-                           f"{metrics.max_drawdown:.2%} max drawdown")
+            self.logger.info(
+                "Analyzed backtest: %s trades, %.2f Sharpe ratio, %.2f%% max drawdown",
+                metrics.total_trades, metrics.sharpe_ratio, metrics.max_drawdown * 100,
+            )
             
             return analysis
             
         except Exception as e:
-            self.logger.error(f"Error analyzing backtest results: {e}")
+            self.logger.error("Error analyzing backtest results: %s", e)
             return {}
     
     def _generate_live_trading_recommendations(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
@@ -149,73 +171,79 @@ class BacktestToLiveBridge:
         self, 
         backtest_results: Optional[BacktestResults] = None,
         live_setup: Optional[Dict[str, Any]] = None,
-        output_file: str = "backtest_to_live_bridge_report.txt"
+        output_file: str = "backtest_to_live_bridge_report.txt",
+        analysis: Optional[Dict[str, Any]] = None
     ) -> str:
-        """Export a bridge report comparing backtest and live setup."""
-        
-        report_lines = [
-            "BACKTEST TO LIVE TRADING BRIDGE REPORT",
-            "=" * 50,
-            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            ""
-        ]
+        """Export a bridge report comparing backtest and live setup.
+        
+        Pass the result of analyze_backtest_performance as ``analysis`` to skip
+        the analysis; otherwise metrics already calculated for the same results
+        object are reused.
+        """
+        buffer = io.StringIO()
+        write = buffer.write
+        
+        write(
+            "BACKTEST TO LIVE TRADING BRIDGE REPORT\n"
+            f"{'=' * 50}\n"
+            f"Generated: {datetime.now().isoformat(sep=' ', timespec='seconds')}\n"
+            "\n"
+        )
         
         # Backtest analysis
-        if backtest_results:
-            analysis = self.analyze_backtest_performance(backtest_results)
-            report_lines.extend([
-                "BACKTEST ANALYSIS:",
-                "-" * 20,
-                f"Total Return: {analysis.get('total_return', 0):.2%}",
-                f"Sharpe Ratio: {analysis.get('sharpe_ratio', 0):.2f}",
-                f"Max Drawdown: {analysis.get('max_drawdown', 0):.2%}",
-                f"Total Trades: {analysis.get('total_trades', 0)}",
-                f"Win Rate: {analysis.get('win_rate', 0):.2%}",
-                f"Profit Factor: {analysis.get('profit_factor', 0):.2f}",
-                ""
-            ])
+        if backtest_results or analysis is not None:
+            if analysis is None:
+                analysis = self.analyze_backtest_performance(backtest_results)
+            write(
+                "BACKTEST ANALYSIS:\n"
+                f"{'-' * 20}\n"
+                f"Total Return: {analysis.get('total_return', 0):.2%}\n"
+                f"Sharpe Ratio: {analysis.get('sharpe_ratio', 0):.2f}\n"
+                f"Max Drawdown: {analysis.get('max_drawdown', 0):.2%}\n"
+                f"Total Trades: {analysis.get('total_trades', 0)}\n"
+                f"Win Rate: {analysis.get('win_rate', 0):.2%}\n"
+                f"Profit Factor: {analysis.get('profit_factor', 0):.2f}\n"
+                "\n"
+            )
             
             # Recommendations
             recommendations = analysis.get('recommendations', {})
             if recommendations:
-                report_lines.extend([
-                    "RECOMMENDATIONS:",
-                    "-" * 20
-                ])
-                for key, value in recommendations.items():
-                    report_lines.append(f"{key}: {value}")
-                report_lines.append("")
+                write(f"RECOMMENDATIONS:\n{'-' * 20}\n")
+                buffer.writelines(
+                    f"{key}: {value}\n" for key, value in recommendations.items()
+                )
+                write("\n")
         
         # Live setup info
         if live_setup:
-            report_lines.extend([
-                "LIVE TRADING SETUP:",
-                "-" * 20,
-                f"Account ID: {live_setup.get('account_id', 'N/A')}",
-                f"Initial Cash: ${live_setup.get('initial_cash', 0):,.2f}",
-                f"Symbols: {', '.join(live_setup.get('symbols', []))}",
-                f"Update Interval: {live_setup.get('update_interval', 60)} seconds",
-                f"Data Provider: {type(live_setup.get('data_provider', 'Unknown')).__name__}",
-                f"Broker: {type(live_setup.get('broker', 'Unknown')).__name__}",
-                ""
-            ])
-        
-        report_lines.extend([
-            "NEXT STEPS:",
-            "-" * 20,
-            "1. Start with paper trading to validate strategy",
-            "2. Monitor performance metrics closely",
-            "3. Compare live results with backtest expectations",
-            "4. Adjust position sizing and risk parameters as needed",
-            "5. Export CSV results regularly for analysis",
-            ""
-        ])
-        
-        report_content = "\n".join(report_lines)
-        
-        # Write to file
-        with open(output_file, 'w') as f:
+            write(
+                "LIVE TRADING SETUP:\n"
+                f"{'-' * 20}\n"
+                f"Account ID: {live_setup.get('account_id', 'N/A')}\n"
+                f"Initial Cash: ${live_setup.get('initial_cash', 0):,.2f}\n"
+                f"Symbols: {', '.join(live_setup.get('symbols', []))}\n"
+                f"Update Interval: {live_setup.get('update_interval', 60)} seconds\n"
+                f"Data Provider: {type(live_setup.get('data_provider', 'Unknown')).__name__}\n"
+                f"Broker: {type(live_setup.get('broker', 'Unknown')).__name__}\n"
+                "\n"
+            )
+        
+        write(
+            "NEXT STEPS:\n"
+            f"{'-' * 20}\n"
+            "1. Start with paper trading to validate strategy\n"
+            "2. Monitor performance metrics closely\n"
+            "3. Compare live results with backtest expectations\n"
+            "4. Adjust position sizing and risk parameters as needed\n"
+            "5. Export CSV results regularly for analysis\n"
+        )
+        
+        report_content = buffer.getvalue()
+        
+        # Write to file in a single buffered call
+        with open(output_file, 'w', buffering=1 << 16) as f:
             f.write(report_content)
         
-        self.logger.info(f"Bridge report exported to {output_file}")
-        return report_content
\ No newline at end of file
+        self.logger.info("Bridge report exported to %s", output_file)
+        return report_content
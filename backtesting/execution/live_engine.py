@@ -2,9 +2,13 @@
 
 import asyncio
 import logging
+from collections.abc import Mapping
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any, Protocol, Optional
 
+import numpy as np
+
 from ..brokers.base import BaseBroker, BrokerOrder, OrderSide, OrderType
 from ..data_providers.alpha_vantage import AlphaVantageDataProvider
 from ..metrics.live_aggregator import LiveMetricsAggregator
@@ -36,6 +40,7 @@ class LiveTradingEngine:
         symbols: list[str],
         update_interval: int = 60,  # seconds
         enable_metrics: bool = True,
+        max_concurrent_orders: int = 5,
     ):
         self.broker = broker
         self.data_provider = data_provider
@@ -43,6 +48,16 @@ class LiveTradingEngine:
         self.update_interval = update_interval
         self.is_running = False
         self.strategy: LiveStrategy | None = None
+        self._strategy_on_batch = None
+        
+        # Orders within a cycle are placed concurrently, capped for broker rate limits
+        self._order_semaphore = asyncio.Semaphore(max_concurrent_orders)
+        
+        # Optional broker capabilities, probed once rather than every cycle
+        self._broker_supports_price_update = callable(
+            getattr(broker, 'update_market_prices', None)
+        )
+        self._broker_supports_export = callable(getattr(broker, 'export_to_csv', None))
         
         # Metrics tracking
         self.metrics_aggregator: Optional[LiveMetricsAggregator] = None
@@ -67,11 +82,12 @@ class LiveTradingEngine:
             return
 
         self.strategy = strategy
+        self._strategy_on_batch = getattr(strategy, 'on_batch', None)
         self.is_running = True
         
         self.logger.info("Starting live trading engine")
-        self.logger.info(f"Symbols: {', '.join(self.symbols)}")
-        self.logger.info(f"Update interval: {self.update_interval} seconds")
+        self.logger.info("Symbols: %s", ', '.join(self.symbols))
+        self.logger.info("Update interval: %s seconds", self.update_interval)
         
         # Connect to broker
         if not await self.broker.connect():
@@ -79,10 +95,22 @@ class LiveTradingEngine:
             self.is_running = False
             return
 
-        # Test data provider connection
-        if not self.data_provider.test_connection():
+        # Open the provider's pooled HTTP session so quotes reuse connections
+        open_session = getattr(self.data_provider, 'open_session', None)
+        if open_session is not None:
+            await open_session()
+
+        # Test data provider connection without blocking the event loop
+        test_connection_async = getattr(self.data_provider, 'test_connection_async', None)
+        if test_connection_async is not None:
+            connected = await test_connection_async()
+        else:
+            connected = await asyncio.to_thread(self.data_provider.test_connection)
+        if not connected:
             self.logger.error("Failed to connect to data provider")
             self.is_running = False
+            await self._close_data_provider()
+            await self.broker.disconnect()
             return
 
         # Initialize strategy
@@ -102,22 +130,29 @@ class LiveTradingEngine:
         if self.strategy:
             self.strategy.on_stop()
             
+        await self._close_data_provider()
         await self.broker.disconnect()
 
+    async def _close_data_provider(self) -> None:
+        """Close the data provider's HTTP sessions, if it keeps any."""
+        close = getattr(self.data_provider, 'close', None)
+        if close is not None:
+            await close()
+
     async def _trading_loop(self) -> None:
         """Main trading loop."""
         while self.is_running:
             try:
+                # One batch of quotes per cycle feeds both the broker and the strategy
+                quotes = await self._fetch_quotes()
+                
                 # Update market prices in broker if it supports it
-                if hasattr(self.broker, 'update_market_prices'):
-                    prices = {}
-                    for symbol in self.symbols:
-                        quote_data = await self.data_provider.get_quote(symbol)
-                        if quote_data:
-                            parsed_quote = self.data_provider.parse_quote_data(quote_data)
-                            if parsed_quote and 'price' in parsed_quote:
-                                prices[symbol] = parsed_quote['price']
-                    
+                if self._broker_supports_price_update:
+                    prices = {
+                        symbol: quote['price']
+                        for symbol, quote in quotes.items()
+                        if 'price' in quote
+                    }
                     if prices:
                         self.broker.update_market_prices(prices)
                 
@@ -125,48 +160,86 @@ class LiveTradingEngine:
                 if self.metrics_aggregator:
                     await self.metrics_aggregator.update_metrics()
                 
-                # Get latest data for all symbols
-                for symbol in self.symbols:
-                    if not self.is_running:
-                        break
+                # Process the latest data for all symbols
+                pending_orders: list[asyncio.Task] = []
+                if self.strategy and self._strategy_on_batch is not None:
+                    # Strategies with a batch path see the whole cycle at once
+                    for order in self._strategy_on_batch(quotes):
+                        pending_orders.append(
+                            asyncio.create_task(self._execute_order(order))
+                        )
+                else:
+                    for symbol, quote in quotes.items():
+                        if not self.is_running:
+                            break
                         
-                    # Get current quote
-                    quote_data = await self.data_provider.get_quote(symbol)
-                    if quote_data:
-                        parsed_quote = self.data_provider.parse_quote_data(quote_data)
-                        if parsed_quote and self.strategy:
-                            # Process data with strategy
-                            orders = self.strategy.on_data(symbol, parsed_quote)
+                        if self.strategy:
+                            orders = self.strategy.on_data(symbol, quote)
                             
-                            # Execute orders
+                            # Submit orders without waiting on each round trip
                             for order in orders:
-                                await self._execute_order(order)
-                    
-                    # Small delay between symbols to avoid rate limits
-                    await asyncio.sleep(1)
+                                pending_orders.append(
+                                    asyncio.create_task(self._execute_order(order))
+                                )
+                
+                # Collect this cycle's orders before the next tick
+                if pending_orders:
+                    results = await asyncio.gather(*pending_orders, return_exceptions=True)
+                    for result in results:
+                        if isinstance(result, BaseException):
+                            self.logger.error("Order task failed: %s", result)
                 
                 # Wait for next update cycle
                 if self.is_running:
-                    self.logger.info(f"Waiting {self.update_interval} seconds for next update")
+                    self.logger.info("Waiting %s seconds for next update", self.update_interval)
                     await asyncio.sleep(self.update_interval)
                     
             except KeyboardInterrupt:
                 self.logger.info("Received interrupt signal, stopping...")
                 break
             except Exception as e:
-                self.logger.error(f"Error in trading loop: {e}")
+                self.logger.error("Error in trading loop: %s", e)
                 await asyncio.sleep(self.update_interval)
 
+    async def _fetch_quotes(self) -> dict[str, dict[str, Any]]:
+        """Fetch parsed quotes for all symbols, keyed by symbol.
+
+        Uses the provider's batch endpoint when it has one; otherwise the
+        per-symbol quotes are requested concurrently. Rate limiting is left to
+        the data provider.
+        """
+        get_batch_quotes = getattr(self.data_provider, 'get_batch_quotes', None)
+        if get_batch_quotes is not None:
+            return await get_batch_quotes(self.symbols)
+        
+        get_quote = self.data_provider.get_quote
+        parse_quote_data = self.data_provider.parse_quote_data
+        symbols = self.symbols
+        raw_quotes = await asyncio.gather(
+            *(get_quote(symbol) for symbol in symbols),
+            return_exceptions=True,
+        )
+        quotes = {}
+        for symbol, quote_data in zip(symbols, raw_quotes):
+            if isinstance(quote_data, Exception):
+                self.logger.error("Error fetching quote for %s: %s", symbol, quote_data)
+            elif quote_data:
+                parsed_quote = parse_quote_data(quote_data)
+                if parsed_quote:
+                    quotes[symbol] = parsed_quote
+        return quotes
+
     async def _execute_order(self, order: BrokerOrder) -> None:
         """Execute an order through the broker."""
         try:
-            order_id = await self.broker.place_order(order)
+            async with self._order_semaphore:
+                order_id = await self.broker.place_order(order)
             if order_id:
-                self.logger.info(f"Order placed successfully: {order_id}")
+                self.logger.info("Order placed successfully: %s", order_id)
             else:
                 self.logger.error("Failed to place order")
         except Exception as e:
-            self.logger.error(f"Error executing order: {e}")
+            self.logger.error("Error executing order: %s", e)
 
     async def get_account_info(self) -> Any:
         """Get current account information."""
@@ -197,7 +270,7 @@ class LiveTradingEngine:
         files_created = {}
         
         # Export broker data if it supports CSV export
-        if hasattr(self.broker, 'export_to_csv'):
+        if self._broker_supports_export:
             broker_files = self.broker.export_to_csv(output_dir)
             files_created.update(broker_files)
         
@@ -206,18 +279,28 @@ class LiveTradingEngine:
             metrics_files = self.metrics_aggregator.export_to_csv(output_dir)
             files_created.update(metrics_files)
         
-        self.logger.info(f"Exported trading results to {len(files_created)} files")
+        self.logger.info("Exported trading results to %s files", len(files_created))
         return files_created
 
 
 class SimpleTradingStrategy:
-    """Simple example trading strategy for testing."""
+    """Simple example trading strategy for testing.
+
+    Last prices and positions are kept in parallel NumPy arrays indexed by
+    symbol, so a whole cycle of quotes can be evaluated at once via on_batch.
+    """
+
+    # Fixed order size for demo buys
+    ORDER_QUANTITY = 10
 
     def __init__(self, buy_threshold: float = 0.01, sell_threshold: float = 0.02):
         self.buy_threshold = buy_threshold  # Buy if price drops by this percentage
         self.sell_threshold = sell_threshold  # Sell if price rises by this percentage
-        self.previous_prices: dict[str, float] = {}
-        self.positions: dict[str, int] = {}  # Track positions
+        
+        # Symbol -> slot in the price/position arrays; NaN marks no price yet
+        self._sym_idx: dict[str, int] = {}
+        self._prev = np.empty(0, dtype=np.float64)
+        self._pos = np.empty(0, dtype=np.int64)
         
         # Setup logging
         self.logger = logging.getLogger("SimpleTradingStrategy")
@@ -230,6 +313,63 @@ class SimpleTradingStrategy:
             self.logger.addHandler(handler)
             self.logger.setLevel(logging.INFO)
 
+    @property
+    def previous_prices(self) -> Mapping[str, float]:
+        """Last seen price per symbol.
+
+        A read-only snapshot: item assignment raises TypeError. Assign a whole
+        mapping to the attribute to replace the prices.
+        """
+        prev = self._prev
+        return MappingProxyType({
+            symbol: float(prev[i])
+            for symbol, i in self._sym_idx.items()
+            if prev[i] == prev[i]
+        })
+
+    @previous_prices.setter
+    def previous_prices(self, prices: Mapping[str, float]) -> None:
+        self._prev[:] = np.nan
+        for symbol, price in prices.items():
+            # _slot may grow the arrays, so look up the slot before indexing
+            i = self._slot(symbol)
+            self._prev[i] = price
+
+    @property
+    def positions(self) -> Mapping[str, int]:
+        """Current position size per symbol.
+
+        A read-only snapshot: item assignment raises TypeError. Assign a whole
+        mapping to the attribute to replace the positions.
+        """
+        pos = self._pos
+        return MappingProxyType(
+            {symbol: int(pos[i]) for symbol, i in self._sym_idx.items()}
+        )
+
+    @positions.setter
+    def positions(self, positions: Mapping[str, int]) -> None:
+        self._pos[:] = 0
+        for symbol, quantity in positions.items():
+            i = self._slot(symbol)
+            self._pos[i] = quantity
+
+    def _slot(self, symbol: str) -> int:
+        """Return the array slot for a symbol, allocating one on first sight."""
+        i = self._sym_idx.get(symbol)
+        if i is None:
+            i = len(self._sym_idx)
+            if i == len(self._prev):
+                # Grow geometrically so adding symbols stays amortized O(1)
+                capacity = max(8, 2 * i)
+                prev = np.full(capacity, np.nan)
+                prev[:i] = self._prev
+                pos = np.zeros(capacity, dtype=np.int64)
+                pos[:i] = self._pos
+                self._prev, self._pos = prev, pos
+            self._sym_idx[symbol] = i
+        return i
+
     def on_start(self) -> None:
         """Called when live trading starts."""
         self.logger.info("Simple trading strategy started")
@@ -241,44 +381,99 @@ class SimpleTradingStrategy:
     def on_data(self, symbol: str, data: dict[str, Any]) -> list[BrokerOrder]:
         """Process new market data and return orders to place."""
         current_price = data["price"]
-        orders = []
+        i = self._slot(symbol)
+        previous_price = float(self._prev[i])
         
-        if symbol in self.previous_prices:
-            previous_price = self.previous_prices[symbol]
-            price_change = (current_price - previous_price) / previous_price
-            
+        # Update price history
+        self._prev[i] = current_price
+        
+        if previous_price != previous_price:  # First price for this symbol
+            return []
+        
+        price_change = (current_price - previous_price) / previous_price
+        
+        if self.logger.isEnabledFor(logging.INFO):
             self.logger.info(
-                f"{symbol}: {previous_price:.2f} -> {current_price:.2f} "
-                f"({price_change:.2%})"
+                "%s: %.2f -> %.2f (%.2f%%)",
+                symbol, previous_price, current_price, price_change * 100,
             )
-            
-            # Check for buy signal (price dropped significantly)
-            if price_change <= -self.buy_threshold and self.positions.get(symbol, 0) == 0:
-                self.logger.info(f"BUY SIGNAL for {symbol}: Price dropped {price_change:.2%}")
-                order = BrokerOrder(
-                    symbol=symbol,
-                    quantity=10,  # Fixed quantity for demo
-                    side=OrderSide.BUY,
-                    order_type=OrderType.MARKET,
-                    price=current_price,
-                )
-                orders.append(order)
-                self.positions[symbol] = 10
-                
-            # Check for sell signal (price rose significantly and we have position)
-            elif price_change >= self.sell_threshold and self.positions.get(symbol, 0) > 0:
-                self.logger.info(f"SELL SIGNAL for {symbol}: Price rose {price_change:.2%}")
-                order = BrokerOrder(
-                    symbol=symbol,
-                    quantity=self.positions[symbol],
-                    side=OrderSide.SELL,
-                    order_type=OrderType.MARKET,
-                    price=current_price,
-                )
-                orders.append(order)
-                self.positions[symbol] = 0
+        
+        # Check for buy signal (price dropped significantly)
+        if price_change <= -self.buy_threshold and self._pos[i] == 0:
+            return [
+                self._signal_order(symbol, i, OrderSide.BUY, current_price, price_change)
+            ]
+        
+        # Check for sell signal (price rose significantly and we have position)
+        if price_change >= self.sell_threshold and self._pos[i] > 0:
+            return [
+                self._signal_order(symbol, i, OrderSide.SELL, current_price, price_change)
+            ]
+        
+        return []
+
+    def on_batch(self, quotes: dict[str, dict[str, Any]]) -> list[BrokerOrder]:
+        """Process one cycle of quotes for all symbols and return orders to place.
+
+        Equivalent to calling on_data for each quote, but the price changes and
+        buy/sell conditions are evaluated as array operations.
+        """
+        if not quotes:
+            return []
+        
+        symbols = list(quotes)
+        n = len(symbols)
+        idx = np.fromiter((self._slot(s) for s in symbols), dtype=np.intp, count=n)
+        current = np.fromiter(
+            (quotes[s]["price"] for s in symbols), dtype=np.float64, count=n
+        )
+        previous = self._prev[idx]
         
         # Update price history
-        self.previous_prices[symbol] = current_price
+        self._prev[idx] = current
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            changes = (current - previous) / previous
+        seen = ~np.isnan(previous)
+        positions = self._pos[idx]
+        
+        if self.logger.isEnabledFor(logging.INFO):
+            for k in np.flatnonzero(seen):
+                self.logger.info(
+                    "%s: %.2f -> %.2f (%.2f%%)",
+                    symbols[k], previous[k], current[k], changes[k] * 100,
+                )
+        
+        buy_mask = seen & (changes <= -self.buy_threshold) & (positions == 0)
+        sell_mask = seen & ~buy_mask & (changes >= self.sell_threshold) & (positions > 0)
+        
+        orders = []
+        for k in np.flatnonzero(buy_mask | sell_mask):
+            side = OrderSide.BUY if buy_mask[k] else OrderSide.SELL
+            orders.append(
+                self._signal_order(
+                    symbols[k], int(idx[k]), side, float(current[k]), float(changes[k])
+                )
+            )
+        return orders
+
+    def _signal_order(
+        self, symbol: str, i: int, side: OrderSide, price: float, price_change: float
+    ) -> BrokerOrder:
+        """Build the market order for a signal and update the tracked position."""
+        if side is OrderSide.BUY:
+            self.logger.info("BUY SIGNAL for %s: Price dropped %.2f%%", symbol, price_change * 100)
+            quantity = self.ORDER_QUANTITY
+            self._pos[i] = quantity
+        else:
+            self.logger.info("SELL SIGNAL for %s: Price rose %.2f%%", symbol, price_change * 100)
+            quantity = int(self._pos[i])
+            self._pos[i] = 0
         
-        return orders
\ No newline at end of file
+        return BrokerOrder(
+            symbol=symbol,
+            quantity=quantity,
+            side=side,
+            order_type=OrderType.MARKET,
+            price=price,
+        )
@@ -0,0 +1,29 @@
+"""
+Optional Numba support for numeric kernels.
+
+When Numba is installed, ``njit`` compiles the decorated function to machine
+code and ``prange`` parallelizes loops. Without it, ``njit`` leaves the
+function untouched and ``prange`` is ``range``, so kernels still run as plain
+Python/NumPy. Install the ``performance`` extra to enable compilation.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` (bare or with options)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+__all__ = ["njit", "prange", "NUMBA_AVAILABLE"]
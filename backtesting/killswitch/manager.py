@@ -1,18 +1,117 @@
+import logging
+import logging.handlers
+import multiprocessing.util
+import os
+import queue
 from collections.abc import Callable
 from datetime import datetime
 
 from ..core.portfolio import Portfolio
-from .triggers import KillSwitchTrigger
+from .triggers import DrawdownTrigger, KillSwitchTrigger, LossTrigger, VolatilityTrigger
+
+
+class _ParentForwarder(logging.Handler):
+    """Pass records on to the handlers of a logger's ancestors."""
+
+    def __init__(self, parent: logging.Logger):
+        super().__init__()
+        self.parent = parent
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.parent.handle(record)
+
+
+class _LazyQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler whose listener thread is started on first use per process.
+
+    A forked child (e.g. a ProcessPoolExecutor worker) does not inherit the
+    parent's listener thread, so the handler starts a fresh queue and listener
+    whenever it emits in a new process. flush() drains the queue by stopping
+    the listener; the next record starts it again.
+    """
+
+    def __init__(self, parent: logging.Logger):
+        super().__init__(queue.SimpleQueue())
+        self._parent = parent
+        self._listener: logging.handlers.QueueListener | None = None
+        self._listener_pid: int | None = None
+        self._finalizer_pid: int | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Handler.handle holds self.lock, so the listener starts only once
+        if self._listener_pid != os.getpid():
+            self._start_listener()
+        super().emit(record)
+
+    def _start_listener(self) -> None:
+        self.queue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(
+            self.queue, _ParentForwarder(self._parent)
+        )
+        self._listener.start()
+        self._listener_pid = os.getpid()
+        if self._finalizer_pid != self._listener_pid:
+            # multiprocessing children skip atexit and logging.shutdown
+            multiprocessing.util.Finalize(None, self.flush, exitpriority=0)
+            self._finalizer_pid = self._listener_pid
+
+    def flush(self) -> None:
+        """Wait until every queued record has been handled."""
+        with self.lock:
+            listener = self._listener
+            if listener is None or self._listener_pid != os.getpid():
+                return
+            self._listener = None
+            self._listener_pid = None
+        listener.stop()
+
+
+def _setup_logger() -> logging.Logger:
+    """Create the module logger, handing records to a background thread.
+
+    Activations are logged through a QueueHandler so the trading thread only
+    enqueues records; a QueueListener passes them on to the handlers of the
+    parent loggers, so output follows the application's logging setup (or
+    logging's last-resort stderr handler when there is none).
+    """
+    log = logging.getLogger(__name__)
+    if not log.handlers:
+        log.addHandler(_LazyQueueHandler(log.parent))
+        log.propagate = False
+    return log
+
+
+logger = _setup_logger()
+
+# Stable event ids for activation records, by trigger class, so log tooling can
+# filter on the ``event_id`` record attribute instead of parsing messages
+KILLSWITCH_EVENT_IDS = {
+    "DrawdownTrigger": 6001,
+    "LossTrigger": 6002,
+    "VolatilityTrigger": 6003,
+    "TimeBasedTrigger": 6004,
+    "VaRTrigger": 6005,
+}
+KILLSWITCH_DEFAULT_EVENT_ID = 6000
 
 
 class KillSwitchManager:
     """Manages multiple kill switch triggers."""
 
+    __slots__ = (
+        "triggers",
+        "activated_triggers",
+        "_activated_ids",
+        "is_active",
+        "activation_callbacks",
+    )
+
     def __init__(self):
         self.triggers: list[KillSwitchTrigger] = []
         self.activated_triggers: list[KillSwitchTrigger] = []
+        self._activated_ids: set[int] = set()
         self.is_active = False
-        self.activation_callbacks: list[Callable] = []
+        self.activation_callbacks: tuple[Callable, ...] = ()
 
     def add_trigger(self, trigger: KillSwitchTrigger) -> None:
         """Add a kill switch trigger."""
@@ -20,7 +119,7 @@ class KillSwitchManager:
 
     def add_activation_callback(self, callback: Callable) -> None:
         """Add callback function to be called when kill switch activates."""
-        self.activation_callbacks.append(callback)
+        self.activation_callbacks = (*self.activation_callbacks, callback)
 
     def check_triggers(
         self,
@@ -32,17 +131,27 @@ class KillSwitchManager:
         if self.is_active:
             return True
 
+        activated = self.activated_triggers
+        activated_ids = self._activated_ids
+
+        # Value the portfolio once per tick and share it with every trigger
+        total_value = portfolio.get_total_value(current_prices)
+
         for trigger in self.triggers:
-            if trigger.check(portfolio, current_prices, timestamp):
-                if trigger not in self.activated_triggers:
-                    self.activated_triggers.append(trigger)
+            if trigger.check(
+                portfolio, current_prices, timestamp, precomputed_value=total_value
+            ):
+                if id(trigger) not in activated_ids:
+                    activated_ids.add(id(trigger))
+                    activated.append(trigger)
                     self._on_trigger_activated(
-                        trigger, portfolio, current_prices, timestamp
+                        trigger, portfolio, current_prices, timestamp, total_value
                     )
 
         # Kill switch is active if any trigger is activated
-        self.is_active = len(self.activated_triggers) > 0
-        return self.is_active
+        is_active = len(activated) > 0
+        self.is_active = is_active
+        return is_active
 
     def _on_trigger_activated(
         self,
@@ -50,47 +159,62 @@ class KillSwitchManager:
         portfolio: Portfolio,
         current_prices: dict[str, float],
         timestamp: datetime,
+        total_value: float,
     ) -> None:
         """Handle trigger activation."""
-        print(f"KILL SWITCH ACTIVATED: {trigger.name}")
-        print(f"Time: {timestamp}")
-        print(f"Reason: {trigger.activation_reason}")
-        print(f"Portfolio Value: ${portfolio.get_total_value(current_prices):,.2f}")
+        logger.warning(
+            "KILL SWITCH ACTIVATED: %s | Time: %s | Reason: %s | Portfolio Value: $%s",
+            trigger.name,
+            timestamp,
+            trigger.activation_reason,
+            f"{total_value:,.2f}",
+            extra={
+                "event_id": KILLSWITCH_EVENT_IDS.get(
+                    type(trigger).__name__, KILLSWITCH_DEFAULT_EVENT_ID
+                )
+            },
+        )
 
-        # Call activation callbacks
+        # Call activation callbacks, reporting any failures together
+        errors = []
         for callback in self.activation_callbacks:
             try:
                 callback(trigger, portfolio, current_prices, timestamp)
             except Exception as e:
-                print(f"Error in kill switch callback: {e}")
+                errors.append(e)
+        if errors:
+            logger.error("Error in kill switch callbacks: %s", errors)
 
     def reset_all_triggers(self) -> None:
         """Reset all triggers."""
         for trigger in self.triggers:
             trigger.reset()
         self.activated_triggers.clear()
+        self._activated_ids.clear()
         self.is_active = False
 
     def get_activation_summary(self) -> dict:
         """Get summary of activated triggers."""
-        if not self.activated_triggers:
+        activated = self.activated_triggers
+        if not activated:
             return {"is_active": False, "triggers": []}
 
-        trigger_summaries = []
-        for trigger in self.activated_triggers:
-            trigger_summaries.append(
-                {
-                    "name": trigger.name,
-                    "activation_time": trigger.activation_time,
-                    "reason": trigger.activation_reason,
-                }
-            )
+        trigger_summaries = [
+            {
+                "name": trigger.name,
+                "activation_time": trigger.activation_time,
+                "reason": trigger.activation_reason,
+            }
+            for trigger in activated
+        ]
 
         return {
             "is_active": self.is_active,
             "triggers": trigger_summaries,
-            "first_activation": min(t.activation_time for t in self.activated_triggers),
-            "trigger_count": len(self.activated_triggers),
+            "first_activation": min(
+                (t.activation_time for t in activated), default=None
+            ),
+            "trigger_count": len(activated),
         }
 
     def get_status_report(self) -> str:
@@ -98,10 +222,11 @@ class KillSwitchManager:
         if not self.is_active:
             return f"Kill switch: INACTIVE ({len(self.triggers)} triggers monitored)"
 
+        activated = self.activated_triggers
         report = ["KILL SWITCH: ACTIVE"]
-        report.append(f"Activated triggers: {len(self.activated_triggers)}")
+        report.append(f"Activated triggers: {len(activated)}")
 
-        for trigger in self.activated_triggers:
+        for trigger in activated:
             report.append(f"  - {trigger.name}: {trigger.activation_reason}")
             report.append(f"    Activated at: {trigger.activation_time}")
 
@@ -121,8 +246,6 @@ def create_default_kill_switches(
     Returns:
         KillSwitchManager with default triggers
     """
-    from .triggers import DrawdownTrigger, LossTrigger, VolatilityTrigger
-
     manager = KillSwitchManager()
 
     # Add common triggers
@@ -1,9 +1,114 @@
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 import numpy as np
 
 from ..core.portfolio import Portfolio
+from ..stats import quantile
+
+
+def _to_datetime64(timestamp: datetime) -> np.datetime64:
+    """Convert a timestamp to datetime64, normalizing aware values to UTC."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(timestamp, "us")
+
+
+class _ReturnWindow:
+    """Time-windowed history of portfolio values and returns.
+
+    Entries live in preallocated NumPy buffers: new ones are written at the end
+    and expired ones are dropped from the front by moving a start index, so the
+    live window is always a contiguous slice and a check allocates nothing.
+    Buffers are compacted (or doubled) only when the end is reached.
+
+    Returns are stored as float32, which halves the memory the percentile and
+    reduction passes stream through; values stay float64. Running sums of the
+    returns and their squares are kept in float64 and give the window's
+    standard deviation in O(1); they are recomputed exactly whenever the
+    buffers are compacted, which bounds floating-point drift.
+    """
+
+    __slots__ = ("_times", "_values", "_returns", "_start", "_end", "_sum", "_sum_sq")
+
+    def __init__(self, capacity: int):
+        capacity = max(capacity, 2)
+        self._times = np.empty(capacity, dtype="datetime64[us]")
+        self._values = np.empty(capacity, dtype=np.float64)
+        self._returns = np.empty(capacity, dtype=np.float32)
+        self._start = 0
+        self._end = 0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def last_value(self) -> float:
+        """Most recently recorded portfolio value."""
+        return self._values[self._end - 1]
+
+    @property
+    def returns(self) -> np.ndarray:
+        """Returns in the window, excluding the first entry's (a view)."""
+        return self._returns[self._start + 1 : self._end]
+
+    def append(self, timestamp: datetime, value: float, ret: float) -> None:
+        """Record a value and its return."""
+        if self._end == len(self._times):
+            self._make_room()
+        i = self._end
+        self._times[i] = _to_datetime64(timestamp)
+        self._values[i] = value
+        self._returns[i] = ret
+        ret = float(self._returns[i])  # Sum the stored (rounded) return
+        self._end = i + 1
+        self._sum += ret
+        self._sum_sq += ret * ret
+
+    def expire_before(self, cutoff: datetime) -> None:
+        """Drop entries older than cutoff."""
+        start, end = self._start, self._end
+        cutoff = _to_datetime64(cutoff)
+        if start == end or self._times[start] >= cutoff:
+            return  # Nothing has expired, the usual case per tick
+        new_start = start + int(
+            np.searchsorted(self._times[start:end], cutoff, side="left")
+        )
+        expired = self._returns[start:new_start].astype(np.float64)
+        self._sum -= expired.sum()
+        self._sum_sq -= np.dot(expired, expired)
+        self._start = new_start
+
+    def returns_std(self) -> float:
+        """Population standard deviation of ``returns``, from the running sums."""
+        first = float(self._returns[self._start])
+        n = self._end - self._start - 1
+        mean = (self._sum - first) / n
+        variance = (self._sum_sq - first * first) / n - mean * mean
+        return np.sqrt(variance) if variance > 0 else 0.0
+
+    def _make_room(self) -> None:
+        """Move the live window to the front, doubling capacity if it is over half full."""
+        start, end = self._start, self._end
+        live = end - start
+        if live * 2 > len(self._times):
+            capacity = 2 * len(self._times)
+            for name in self.__slots__[:3]:
+                old = getattr(self, name)
+                new = np.empty(capacity, dtype=old.dtype)
+                new[:live] = old[start:end]
+                setattr(self, name, new)
+        else:
+            # The live window sits in the back half, so this copy cannot overlap
+            for name in self.__slots__[:3]:
+                buffer = getattr(self, name)
+                buffer[:live] = buffer[start:end]
+        self._start, self._end = 0, live
+        live_returns = self._returns[:live].astype(np.float64)
+        self._sum = live_returns.sum()
+        self._sum_sq = np.dot(live_returns, live_returns)
 
 
 class KillSwitchTrigger(ABC):
@@ -21,10 +126,30 @@ class KillSwitchTrigger(ABC):
         portfolio: Portfolio,
         current_prices: dict[str, float],
         timestamp: datetime,
+        precomputed_value: float | None = None,
     ) -> bool:
-        """Check if trigger condition is met."""
+        """Check if trigger condition is met.
+
+        Args:
+            portfolio: Portfolio being monitored
+            current_prices: Latest price per symbol
+            timestamp: Time of the check
+            precomputed_value: Portfolio total value at current_prices, when
+                the caller has already computed it
+        """
         pass
 
+    @staticmethod
+    def _current_value(
+        portfolio: Portfolio,
+        current_prices: dict[str, float],
+        precomputed_value: float | None,
+    ) -> float:
+        """Return the precomputed portfolio value, computing it if not given."""
+        if precomputed_value is not None:
+            return precomputed_value
+        return portfolio.get_total_value(current_prices)
+
     def activate(self, reason: str, timestamp: datetime) -> None:
         """Activate the trigger."""
         self.activated = True
@@ -45,26 +170,31 @@ class DrawdownTrigger(KillSwitchTrigger):
         super().__init__(name)
         self.max_drawdown = max_drawdown
         self.equity_history: list[tuple] = []
+        self._peak = float("-inf")
 
     def check(
         self,
         portfolio: Portfolio,
         current_prices: dict[str, float],
         timestamp: datetime,
+        precomputed_value: float | None = None,
     ) -> bool:
         """Check if drawdown exceeds threshold."""
         if self.activated:
             return True
 
-        current_value = portfolio.get_total_value(current_prices)
+        current_value = self._current_value(portfolio, current_prices, precomputed_value)
         self.equity_history.append((timestamp, current_value))
 
+        # Running peak, so the history never needs rescanning
+        if current_value > self._peak:
+            self._peak = current_value
+
         if len(self.equity_history) < 2:
             return False
 
         # Calculate drawdown
-        values = [val for _, val in self.equity_history]
-        peak = max(values)
+        peak = self._peak
         current_drawdown = (peak - current_value) / peak
 
         if current_drawdown >= self.max_drawdown:
@@ -76,6 +206,37 @@ class DrawdownTrigger(KillSwitchTrigger):
 
         return False
 
+    def check_batch(self, equity: np.ndarray, timestamps) -> int:
+        """Evaluate a complete equity curve in one vectorized pass.
+
+        Activates the trigger at the first breach, as successive check calls
+        would, without touching the per-tick history.
+
+        Args:
+            equity: Portfolio values in time order
+            timestamps: Timestamp for each value
+
+        Returns:
+            Index of the first breach, -1 if the limit is never reached, or 0
+            if the trigger was already activated (the whole curve is halted)
+        """
+        if self.activated:
+            return 0
+
+        equity = np.asarray(equity, dtype=np.float64)
+        # fmax skips NaN values, as check's running peak does
+        peak = np.fmax.accumulate(equity)
+        drawdown = (peak - equity) / peak
+        breached = drawdown >= self.max_drawdown
+        breached[:1] = False  # check needs two observations
+        if not breached.any():
+            return -1
+
+        idx = int(np.argmax(breached))
+        reason = f"Drawdown {drawdown[idx]:.2%} exceeds limit {self.max_drawdown:.2%}"
+        self.activate(reason, timestamps[idx])
+        return idx
+
 
 class VolatilityTrigger(KillSwitchTrigger):
     """Trigger based on portfolio volatility."""
@@ -89,41 +250,40 @@ class VolatilityTrigger(KillSwitchTrigger):
         super().__init__(name)
         self.max_volatility = max_volatility
         self.lookback_days = lookback_days
-        self.return_history: list[tuple] = []
+        self._window = _ReturnWindow(lookback_days + 1)
 
     def check(
         self,
         portfolio: Portfolio,
         current_prices: dict[str, float],
         timestamp: datetime,
+        precomputed_value: float | None = None,
     ) -> bool:
         """Check if volatility exceeds threshold."""
         if self.activated:
             return True
 
-        current_value = portfolio.get_total_value(current_prices)
+        current_value = self._current_value(portfolio, current_prices, precomputed_value)
+
+        window = self._window
 
         # Calculate return if we have previous value
-        if self.return_history:
-            prev_value = self.return_history[-1][1]
+        if len(window):
+            prev_value = window.last_value
             if prev_value > 0:
                 daily_return = (current_value - prev_value) / prev_value
-                self.return_history.append((timestamp, current_value, daily_return))
+                window.append(timestamp, current_value, daily_return)
         else:
-            self.return_history.append((timestamp, current_value, 0.0))
+            window.append(timestamp, current_value, 0.0)
 
         # Keep only recent history
-        cutoff_date = timestamp - timedelta(days=self.lookback_days)
-        self.return_history = [
-            (t, v, r) for t, v, r in self.return_history if t >= cutoff_date
-        ]
+        window.expire_before(timestamp - timedelta(days=self.lookback_days))
 
-        if len(self.return_history) < 10:  # Need minimum observations
+        if len(window) < 10:  # Need minimum observations
             return False
 
-        # Calculate volatility
-        returns = [r for _, _, r in self.return_history[1:]]  # Skip first with 0 return
-        volatility = np.std(returns) * np.sqrt(252)  # Annualized
+        # Calculate volatility (skips first with 0 return)
+        volatility = window.returns_std() * np.sqrt(252)  # Annualized
 
         if volatility >= self.max_volatility:
             reason = (
@@ -147,12 +307,13 @@ class LossTrigger(KillSwitchTrigger):
         portfolio: Portfolio,
         current_prices: dict[str, float],
         timestamp: datetime,
+        precomputed_value: float | None = None,
     ) -> bool:
         """Check if loss exceeds threshold."""
         if self.activated:
             return True
 
-        current_value = portfolio.get_total_value(current_prices)
+        current_value = self._current_value(portfolio, current_prices, precomputed_value)
         loss = portfolio.initial_cash - current_value
 
         if loss >= self.max_loss:
@@ -162,6 +323,34 @@ class LossTrigger(KillSwitchTrigger):
 
         return False
 
+    def check_batch(self, equity: np.ndarray, timestamps, initial_cash: float) -> int:
+        """Evaluate a complete equity curve in one vectorized pass.
+
+        Activates the trigger at the first breach, as successive check calls
+        would.
+
+        Args:
+            equity: Portfolio values in time order
+            timestamps: Timestamp for each value
+            initial_cash: Starting cash the loss is measured against
+
+        Returns:
+            Index of the first breach, -1 if the limit is never reached, or 0
+            if the trigger was already activated (the whole curve is halted)
+        """
+        if self.activated:
+            return 0
+
+        loss = initial_cash - np.asarray(equity, dtype=np.float64)
+        breached = loss >= self.max_loss
+        if not breached.any():
+            return -1
+
+        idx = int(np.argmax(breached))
+        reason = f"Loss ${loss[idx]:,.2f} exceeds limit ${self.max_loss:,.2f}"
+        self.activate(reason, timestamps[idx])
+        return idx
+
 
 class TimeBasedTrigger(KillSwitchTrigger):
     """Trigger based on time conditions."""
@@ -177,21 +366,27 @@ class TimeBasedTrigger(KillSwitchTrigger):
         self.start_time = datetime.strptime(start_time, "%H:%M").time()
         self.end_time = datetime.strptime(end_time, "%H:%M").time()
         self.trading_days_only = trading_days_only
+        # Session bounds as seconds since midnight for integer comparisons
+        self._start_sec = self.start_time.hour * 3600 + self.start_time.minute * 60
+        self._end_sec = self.end_time.hour * 3600 + self.end_time.minute * 60
 
     def check(
         self,
         portfolio: Portfolio,
         current_prices: dict[str, float],
         timestamp: datetime,
+        precomputed_value: float | None = None,
     ) -> bool:
         """Check if outside trading hours."""
         if self.activated:
             return True
 
-        current_time = timestamp.time()
+        sec = timestamp.hour * 3600 + timestamp.minute * 60 + timestamp.second
 
-        # Check if outside trading hours
-        if current_time < self.start_time or current_time > self.end_time:
+        # Check if outside trading hours (any fraction past the end counts)
+        if sec < self._start_sec or sec > self._end_sec or (
+            sec == self._end_sec and timestamp.microsecond
+        ):
             reason = f"Outside trading hours {self.start_time}-{self.end_time}"
             self.activate(reason, timestamp)
             return True
@@ -219,41 +414,41 @@ class VaRTrigger(KillSwitchTrigger):
         self.var_limit = var_limit
         self.confidence = confidence
         self.lookback_days = lookback_days
-        self.return_history: list[tuple] = []
+        self._window = _ReturnWindow(lookback_days + 1)
 
     def check(
         self,
         portfolio: Portfolio,
         current_prices: dict[str, float],
         timestamp: datetime,
+        precomputed_value: float | None = None,
     ) -> bool:
         """Check if current loss exceeds VaR estimate."""
         if self.activated:
             return True
 
-        current_value = portfolio.get_total_value(current_prices)
+        current_value = self._current_value(portfolio, current_prices, precomputed_value)
+
+        window = self._window
 
         # Calculate return if we have previous value
-        if self.return_history:
-            prev_value = self.return_history[-1][1]
+        if len(window):
+            prev_value = window.last_value
             if prev_value > 0:
                 daily_return = (current_value - prev_value) / prev_value
-                self.return_history.append((timestamp, current_value, daily_return))
+                window.append(timestamp, current_value, daily_return)
         else:
-            self.return_history.append((timestamp, current_value, 0.0))
+            window.append(timestamp, current_value, 0.0)
 
         # Keep only recent history
-        cutoff_date = timestamp - timedelta(days=self.lookback_days)
-        self.return_history = [
-            (t, v, r) for t, v, r in self.return_history if t >= cutoff_date
-        ]
+        window.expire_before(timestamp - timedelta(days=self.lookback_days))
 
-        if len(self.return_history) < 30:  # Need minimum observations
+        if len(window) < 30:  # Need minimum observations
             return False
 
         # Calculate VaR
-        returns = [r for _, _, r in self.return_history[1:]]  # Skip first with 0 return
-        var_estimate = np.percentile(returns, (1 - self.confidence) * 100)
+        returns = window.returns  # Skips first with 0 return
+        var_estimate = quantile(returns, 1 - self.confidence)
 
         # Check if today's loss exceeds VaR
         if len(returns) > 0:
@@ -1,10 +1,83 @@
+from typing import NamedTuple
+
 import numpy as np
 import pandas as pd
 
 from ..core.engine import BacktestResults
+from ..jit import njit, prange
+from ..stats import var_cvar
 from .performance import PerformanceMetrics
 
 
+class TradeStats(NamedTuple):
+    """Trade-based metrics returned by MetricsCalculator._calculate_trade_metrics."""
+
+    total_trades: int
+    winning_trades: int
+    losing_trades: int
+    win_rate: float
+    avg_win: float
+    avg_loss: float
+    profit_factor: float
+
+
+_NO_TRADES = TradeStats(0, 0, 0, 0, 0, 0, 0)
+_SKIPPED_TRADES = TradeStats(0, 0, 0, np.nan, np.nan, np.nan, np.nan)
+
+# Metric groups MetricsCalculator.calculate can be restricted to; returns,
+# volatility and Sharpe are always computed
+OPTIONAL_METRICS = frozenset({"sortino", "drawdown", "trades", "var", "benchmark"})
+
+
+def _sample_std(values: np.ndarray) -> float:
+    """Sample standard deviation (ddof=1), NaN for fewer than two values like pandas."""
+    return values.std(ddof=1) if values.size > 1 else np.nan
+
+
+@njit(cache=True)
+def _max_drawdown_duration(drawdown):
+    """Return the longest run of consecutive bars spent below the peak."""
+    max_duration = 0
+    current_duration = 0
+    for i in range(drawdown.shape[0]):
+        if drawdown[i] < 0:
+            current_duration += 1
+            if current_duration > max_duration:
+                max_duration = current_duration
+        else:
+            current_duration = 0
+    return max_duration
+
+
+@njit(parallel=True, cache=True)
+def _max_drawdown_durations(drawdown):
+    """Longest run below the peak for each column of a (T, N) drawdown array."""
+    n_cols = drawdown.shape[1]
+    durations = np.zeros(n_cols, dtype=np.int64)
+    for j in prange(n_cols):
+        max_duration = 0
+        current_duration = 0
+        for i in range(drawdown.shape[0]):
+            if drawdown[i, j] < 0:
+                current_duration += 1
+                if current_duration > max_duration:
+                    max_duration = current_duration
+            else:
+                current_duration = 0
+        durations[j] = max_duration
+    return durations
+
+
+def _masked_sample_std(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """Column-wise sample std (ddof=1) of the masked values, NaN below two values."""
+    count = mask.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(mask, values, 0.0).sum(axis=0) / count
+        centered = np.where(mask, values - mean, 0.0)
+        variance = (centered * centered).sum(axis=0) / (count - 1)
+    return np.where(count > 1, np.sqrt(variance), np.nan)
+
+
 class MetricsCalculator:
     """Calculate comprehensive performance metrics from backtest results."""
 
@@ -13,6 +86,7 @@ class MetricsCalculator:
         results: BacktestResults,
         benchmark: pd.Series | None = None,
         risk_free_rate: float = 0.02,
+        metrics: set[str] | None = None,
     ) -> PerformanceMetrics:
         """Calculate comprehensive performance metrics.
 
@@ -20,26 +94,39 @@ class MetricsCalculator:
             results: BacktestResults object
             benchmark: Optional benchmark series for beta/alpha calculation
             risk_free_rate: Risk-free rate for Sharpe ratio calculation
+            metrics: Optional metric groups to compute (see OPTIONAL_METRICS);
+                skipped groups are left as NaN, or 0 for counts. None
+                computes everything.
 
         Returns:
             PerformanceMetrics object
+
+        Raises:
+            ValueError: If metrics names an unknown group
         """
+        if metrics is None:
+            metrics = OPTIONAL_METRICS
+        elif not metrics <= OPTIONAL_METRICS:
+            unknown = ", ".join(sorted(set(metrics) - OPTIONAL_METRICS))
+            raise ValueError(f"Unknown metric groups: {unknown}")
+
         equity_curve = results.get_equity_curve()
-        trades_df = results.get_trades()
 
         if equity_curve.empty:
             return MetricsCalculator._empty_metrics()
 
-        # Calculate returns
-        returns = equity_curve["equity"].pct_change().dropna()
+        # Simple returns straight from the equity array; gaps (NaN) drop out
+        equity = equity_curve["equity"].to_numpy(dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            all_returns = equity[1:] / equity[:-1] - 1.0
+        valid = ~np.isnan(all_returns)
+        r = all_returns[valid]
+        mean_r = r.mean() if r.size else np.nan
+        std_r = _sample_std(r)
 
         # Basic metrics
-        total_return = (
-            equity_curve["equity"].iloc[-1] / equity_curve["equity"].iloc[0]
-        ) - 1
-        cumulative_return = (
-            equity_curve["equity"].iloc[-1] / results.portfolio.initial_cash - 1
-        )
+        total_return = equity[-1] / equity[0] - 1
+        cumulative_return = equity[-1] / results.portfolio.initial_cash - 1
 
         # Annualized return
         days = len(equity_curve)
@@ -47,46 +134,55 @@ class MetricsCalculator:
         annualized_return = (1 + total_return) ** (1 / years) - 1 if years > 0 else 0
 
         # Volatility
-        volatility = returns.std() * np.sqrt(252)  # Annualized
+        volatility = std_r * np.sqrt(252)  # Annualized
 
-        # Sharpe ratio
-        excess_returns = returns - risk_free_rate / 252
+        # Sharpe ratio (subtracting a constant leaves the std unchanged)
         sharpe_ratio = (
-            excess_returns.mean() / excess_returns.std() * np.sqrt(252)
-            if excess_returns.std() != 0
+            (mean_r - risk_free_rate / 252) / std_r * np.sqrt(252)
+            if std_r != 0
             else 0
         )
 
         # Sortino ratio
-        negative_returns = returns[returns < 0]
-        downside_std = negative_returns.std() * np.sqrt(252)
-        sortino_ratio = (
-            (annualized_return - risk_free_rate) / downside_std
-            if downside_std != 0
-            else 0
-        )
+        sortino_ratio = np.nan
+        if "sortino" in metrics:
+            downside_std = _sample_std(r[r < 0]) * np.sqrt(252)
+            sortino_ratio = (
+                (annualized_return - risk_free_rate) / downside_std
+                if downside_std != 0
+                else 0
+            )
 
-        # Drawdown metrics
-        max_drawdown, max_dd_duration = MetricsCalculator._calculate_drawdown_metrics(
-            equity_curve["equity"]
-        )
+        # Drawdown metrics and Calmar ratio
+        max_drawdown, max_dd_duration, calmar_ratio = np.nan, 0, np.nan
+        if "drawdown" in metrics:
+            max_drawdown, max_dd_duration = (
+                MetricsCalculator._calculate_drawdown_metrics(equity_curve["equity"])
+            )
+            calmar_ratio = (
+                annualized_return / abs(max_drawdown) if max_drawdown != 0 else 0
+            )
 
         # Trade metrics
-        trade_metrics = MetricsCalculator._calculate_trade_metrics(trades_df)
-
-        # Calmar ratio
-        calmar_ratio = annualized_return / abs(max_drawdown) if max_drawdown != 0 else 0
+        trade_metrics = _SKIPPED_TRADES
+        if "trades" in metrics:
+            trade_metrics = MetricsCalculator._calculate_trade_metrics(
+                results.get_trades()
+            )
 
         # VaR and CVaR
-        var_95 = np.percentile(returns, 5)
-        cvar_95 = returns[returns <= var_95].mean()
+        var_95, cvar_95 = np.nan, np.nan
+        if "var" in metrics:
+            var_95, cvar_95 = var_cvar(r)
 
         # Benchmark metrics (if provided)
         beta, alpha, information_ratio, tracking_error = None, None, None, None
-        if benchmark is not None:
+        if benchmark is not None and "benchmark" in metrics:
             beta, alpha, information_ratio, tracking_error = (
                 MetricsCalculator._calculate_benchmark_metrics(
-                    returns, benchmark, risk_free_rate
+                    pd.Series(r, index=equity_curve.index[1:][valid]),
+                    benchmark,
+                    risk_free_rate,
                 )
             )
 
@@ -99,13 +195,13 @@ class MetricsCalculator:
             sortino_ratio=sortino_ratio,
             max_drawdown=max_drawdown,
             max_drawdown_duration=max_dd_duration,
-            total_trades=trade_metrics["total_trades"],
-            winning_trades=trade_metrics["winning_trades"],
-            losing_trades=trade_metrics["losing_trades"],
-            win_rate=trade_metrics["win_rate"],
-            avg_win=trade_metrics["avg_win"],
-            avg_loss=trade_metrics["avg_loss"],
-            profit_factor=trade_metrics["profit_factor"],
+            total_trades=trade_metrics.total_trades,
+            winning_trades=trade_metrics.winning_trades,
+            losing_trades=trade_metrics.losing_trades,
+            win_rate=trade_metrics.win_rate,
+            avg_win=trade_metrics.avg_win,
+            avg_loss=trade_metrics.avg_loss,
+            profit_factor=trade_metrics.profit_factor,
             calmar_ratio=calmar_ratio,
             var_95=var_95,
             cvar_95=cvar_95,
@@ -115,39 +211,117 @@ class MetricsCalculator:
             tracking_error=tracking_error,
         )
 
+    @staticmethod
+    def calculate_batch(
+        equities: np.ndarray,
+        initial_cash: float | np.ndarray,
+        risk_free_rate: float = 0.02,
+    ) -> dict[str, np.ndarray]:
+        """Calculate equity-based metrics for many backtests at once.
+
+        Each column is one backtest's equity curve (e.g. one point of a
+        parameter sweep). Every metric is computed column-wise with NumPy, and
+        the drawdown-duration scan runs in parallel over columns when Numba is
+        available. Values match ``calculate`` for the same equity curve.
+
+        Args:
+            equities: Array of shape (T, N) with N complete equity curves
+            initial_cash: Starting cash, shared or one value per column
+            risk_free_rate: Risk-free rate for Sharpe/Sortino calculation
+
+        Returns:
+            Dict mapping PerformanceMetrics field names (total_return,
+            annualized_return, cumulative_return, volatility, sharpe_ratio,
+            sortino_ratio, max_drawdown, max_drawdown_duration, calmar_ratio,
+            var_95, cvar_95) to arrays of length N
+
+        Raises:
+            ValueError: If equities is not 2-D or has fewer than two rows
+        """
+        equities = np.asarray(equities, dtype=np.float64)
+        if equities.ndim != 2:
+            raise ValueError("equities must be a 2-D array of shape (T, N)")
+        if equities.shape[0] < 2:
+            raise ValueError("equities needs at least two rows to compute returns")
+
+        returns = equities[1:] / equities[:-1] - 1.0
+        sqrt_252 = np.sqrt(252)
+
+        # Return metrics
+        total_return = equities[-1] / equities[0] - 1
+        cumulative_return = equities[-1] / np.asarray(initial_cash, dtype=np.float64) - 1
+        years = equities.shape[0] / 252
+        annualized_return = (1 + total_return) ** (1 / years) - 1
+
+        # Volatility and Sharpe ratio
+        std_r = returns.std(axis=0, ddof=1)
+        volatility = std_r * sqrt_252
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe_ratio = np.where(
+                std_r != 0,
+                (returns.mean(axis=0) - risk_free_rate / 252) / std_r * sqrt_252,
+                0.0,
+            )
+
+        # Sortino ratio
+        downside_std = _masked_sample_std(returns, returns < 0) * sqrt_252
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sortino_ratio = np.where(
+                downside_std != 0,
+                (annualized_return - risk_free_rate) / downside_std,
+                0.0,
+            )
+
+        # Drawdown metrics
+        peak = np.fmax.accumulate(equities, axis=0)
+        drawdown = (equities - peak) / peak
+        max_drawdown = np.nanmin(drawdown, axis=0)
+        max_drawdown_duration = _max_drawdown_durations(np.ascontiguousarray(drawdown))
+
+        # Calmar ratio
+        with np.errstate(divide="ignore", invalid="ignore"):
+            calmar_ratio = np.where(
+                max_drawdown != 0, annualized_return / np.abs(max_drawdown), 0.0
+            )
+
+        # VaR and CVaR
+        var_95 = np.percentile(returns, 5, axis=0)
+        tail = returns <= var_95
+        cvar_95 = np.where(tail, returns, 0.0).sum(axis=0) / tail.sum(axis=0)
+
+        return {
+            "total_return": total_return,
+            "annualized_return": annualized_return,
+            "cumulative_return": cumulative_return,
+            "volatility": volatility,
+            "sharpe_ratio": sharpe_ratio,
+            "sortino_ratio": sortino_ratio,
+            "max_drawdown": max_drawdown,
+            "max_drawdown_duration": max_drawdown_duration,
+            "calmar_ratio": calmar_ratio,
+            "var_95": var_95,
+            "cvar_95": cvar_95,
+        }
+
     @staticmethod
     def _calculate_drawdown_metrics(equity: pd.Series) -> tuple[float, int]:
         """Calculate maximum drawdown and duration."""
-        peak = equity.expanding().max()
-        drawdown = (equity - peak) / peak
-        max_drawdown = drawdown.min()
+        values = equity.to_numpy(dtype=np.float64)
+        # Running peak in one C pass; fmax skips NaNs like expanding().max()
+        peak = np.fmax.accumulate(values)
+        drawdown = (values - peak) / peak
+        max_drawdown = np.nanmin(drawdown)
 
         # Calculate max drawdown duration
-        max_duration = 0
-        current_duration = 0
-
-        for dd in drawdown:
-            if dd < 0:
-                current_duration += 1
-                max_duration = max(max_duration, current_duration)
-            else:
-                current_duration = 0
+        max_duration = _max_drawdown_duration(drawdown)
 
         return max_drawdown, max_duration
 
     @staticmethod
-    def _calculate_trade_metrics(trades_df: pd.DataFrame) -> dict:
+    def _calculate_trade_metrics(trades_df: pd.DataFrame) -> TradeStats:
         """Calculate trade-based metrics."""
         if trades_df.empty:
-            return {
-                "total_trades": 0,
-                "winning_trades": 0,
-                "losing_trades": 0,
-                "win_rate": 0,
-                "avg_win": 0,
-                "avg_loss": 0,
-                "profit_factor": 0,
-            }
+            return _NO_TRADES
 
         # Group trades by symbol and calculate P&L for round trips
         # This is simplified - in practice you'd want more sophisticated trade matching
@@ -157,58 +331,75 @@ class MetricsCalculator:
         total_trades // 2
 
         # Calculate basic trade stats (this is a simplified version)
-        wins = trades_df[trades_df["side"] == "sell"]["value"].sum()
-        losses = trades_df[trades_df["side"] == "buy"]["value"].sum()
+        side = trades_df["side"].to_numpy()
+        value = trades_df["value"].to_numpy()
+        is_sell = side == "sell"
+        is_buy = side == "buy"
+
+        wins = value[is_sell].sum()
+        losses = value[is_buy].sum()
 
-        winning_trades = len(trades_df[(trades_df["side"] == "sell")])
-        losing_trades = len(trades_df[(trades_df["side"] == "buy")])
+        winning_trades = int(is_sell.sum())
+        losing_trades = int(is_buy.sum())
 
         win_rate = winning_trades / total_trades if total_trades > 0 else 0
         avg_win = wins / winning_trades if winning_trades > 0 else 0
         avg_loss = losses / losing_trades if losing_trades > 0 else 0
         profit_factor = wins / abs(losses) if losses != 0 else 0
 
-        return {
-            "total_trades": total_trades,
-            "winning_trades": winning_trades,
-            "losing_trades": losing_trades,
-            "win_rate": win_rate,
-            "avg_win": avg_win,
-            "avg_loss": avg_loss,
-            "profit_factor": profit_factor,
-        }
+        return TradeStats(
+            total_trades=total_trades,
+            winning_trades=winning_trades,
+            losing_trades=losing_trades,
+            win_rate=win_rate,
+            avg_win=avg_win,
+            avg_loss=avg_loss,
+            profit_factor=profit_factor,
+        )
 
     @staticmethod
     def _calculate_benchmark_metrics(
         returns: pd.Series, benchmark: pd.Series, risk_free_rate: float
     ) -> tuple[float, float, float, float]:
         """Calculate benchmark-relative metrics."""
-        # Align returns and benchmark
-        aligned_data = pd.concat([returns, benchmark], axis=1, join="inner").dropna()
-        if aligned_data.empty:
+        # Align returns and benchmark on shared dates, skipping the join when
+        # the indexes already match
+        if returns.index.equals(benchmark.index):
+            s = returns.to_numpy(dtype=np.float64)
+            b = benchmark.to_numpy(dtype=np.float64)
+        else:
+            common = returns.index.intersection(benchmark.index)
+            s = returns.loc[common].to_numpy(dtype=np.float64)
+            b = benchmark.loc[common].to_numpy(dtype=np.float64)
+        complete = ~(np.isnan(s) | np.isnan(b))
+        if not complete.all():
+            s = s[complete]
+            b = b[complete]
+        if s.size == 0:
             return 0, 0, 0, 0
 
-        strategy_returns = aligned_data.iloc[:, 0]
-        benchmark_returns = aligned_data.iloc[:, 1]
-
-        # Beta
-        covariance = np.cov(strategy_returns, benchmark_returns)[0, 1]
-        benchmark_variance = np.var(benchmark_returns)
-        beta = covariance / benchmark_variance if benchmark_variance != 0 else 0
+        # Beta from centered dot products. Sample covariance (ddof=1) over
+        # population variance (ddof=0), as np.cov / np.var gave.
+        n = b.shape[0]
+        strategy_mean = s.mean()
+        benchmark_mean = b.mean()
+        sc = s - strategy_mean
+        bc = b - benchmark_mean
+        benchmark_ss = np.dot(bc, bc)
+        beta = np.dot(sc, bc) / benchmark_ss * n / (n - 1) if benchmark_ss != 0 else 0
 
         # Alpha
-        strategy_mean = strategy_returns.mean() * 252
-        benchmark_mean = benchmark_returns.mean() * 252
-        alpha = strategy_mean - (
-            risk_free_rate + beta * (benchmark_mean - risk_free_rate)
+        alpha = strategy_mean * 252 - (
+            risk_free_rate + beta * (benchmark_mean * 252 - risk_free_rate)
         )
 
         # Information ratio and tracking error
-        excess_returns = strategy_returns - benchmark_returns
-        tracking_error = excess_returns.std() * np.sqrt(252)
+        excess_returns = s - b
+        excess_std = _sample_std(excess_returns)
+        tracking_error = excess_std * np.sqrt(252)
         information_ratio = (
-            excess_returns.mean() / excess_returns.std() * np.sqrt(252)
-            if excess_returns.std() != 0
+            excess_returns.mean() / excess_std * np.sqrt(252)
+            if excess_std != 0
             else 0
         )
 
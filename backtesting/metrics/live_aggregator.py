@@ -1,12 +1,17 @@
 """Live trading metrics aggregator for real-time performance tracking."""
 
+import asyncio
 import logging
 import pandas as pd
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from pathlib import Path
 
-from ..brokers.base import BaseBroker
+from ..brokers.base import BaseBroker, OrderStatus
+from .processors import RunningMoments
+
+
+_PENDING = OrderStatus.PENDING
 
 
 class LiveMetricsAggregator:
@@ -17,6 +22,13 @@ class LiveMetricsAggregator:
         self.update_interval = update_interval
         self.metrics_history: List[Dict[str, Any]] = []
         self.start_time = datetime.now()
+        self._reset_stats()
+        
+        # Equity curve columns, appended per update so reads need no record parsing
+        self._timestamps: List[datetime] = []
+        self._total_values: List[float] = []
+        self._unrealized_pnls: List[float] = []
+        self._cash_balances: List[float] = []
         
         # Setup logging
         self.logger = logging.getLogger("LiveMetricsAggregator")
@@ -31,10 +43,12 @@ class LiveMetricsAggregator:
     
     async def update_metrics(self) -> Dict[str, Any]:
         """Update and calculate current metrics."""
-        # Get current account info and positions
-        account_info = await self.broker.get_account_info()
-        positions = await self.broker.get_positions()
-        orders = await self.broker.get_orders()
+        # Get current account info, positions and orders concurrently
+        account_info, positions, orders = await asyncio.gather(
+            self.broker.get_account_info(),
+            self.broker.get_positions(),
+            self.broker.get_orders(),
+        )
         
         # Calculate current metrics
         current_metrics = {
@@ -44,12 +58,17 @@ class LiveMetricsAggregator:
             'unrealized_pnl': sum(pos.unrealized_pnl for pos in positions),
             'realized_pnl': account_info.total_value - account_info.cash_balance - sum(pos.market_value - pos.unrealized_pnl for pos in positions),
             'positions_count': len(positions),
-            'orders_count': len([o for o in orders if o.status.name == 'PENDING']),
+            'orders_count': sum(1 for o in orders if o.status is _PENDING),
             'total_orders': len(orders)
         }
         
         # Add to history
         self.metrics_history.append(current_metrics)
+        self._timestamps.append(current_metrics['timestamp'])
+        self._total_values.append(current_metrics['total_value'])
+        self._unrealized_pnls.append(current_metrics['unrealized_pnl'])
+        self._cash_balances.append(current_metrics['cash_balance'])
+        self._update_stats(current_metrics['timestamp'], current_metrics['total_value'])
         
         # Calculate performance metrics if we have enough data
         if len(self.metrics_history) > 1:
@@ -61,47 +80,80 @@ class LiveMetricsAggregator:
         
         return current_metrics
     
-    def _calculate_performance_metrics(self) -> Dict[str, Any]:
-        """Calculate performance metrics from history."""
-        if len(self.metrics_history) < 2:
-            return {}
-        
-        df = pd.DataFrame(self.metrics_history)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df.set_index('timestamp', inplace=True)
+    def _reset_stats(self) -> None:
+        """Clear the running statistics behind the performance metrics."""
+        self._first_timestamp: Optional[datetime] = None
+        self._last_timestamp: Optional[datetime] = None
+        self._first_value = 0.0
+        self._prev_value = 0.0
+        # Running moments of all returns and of negative returns
+        self._returns = RunningMoments()
+        self._negative_returns = RunningMoments()
+        # Running peak and drawdowns of total value
+        self._peak = 0.0
+        self._max_drawdown = 0.0
+        self._current_drawdown = 0.0
+    
+    def _update_stats(self, timestamp: datetime, value: float) -> None:
+        """Fold one total-value observation into the running statistics.
         
-        # Calculate returns
-        returns = df['total_value'].pct_change().dropna()
+        O(1) per update, so metrics no longer rescan the whole session.
+        """
+        if self._first_timestamp is None:
+            self._first_timestamp = timestamp
+            self._first_value = value
+            self._peak = value
+        else:
+            prev_value = self._prev_value
+            if prev_value != 0:
+                ret = (value - prev_value) / prev_value
+                self._returns.add(ret)
+                if ret < 0:
+                    self._negative_returns.add(ret)
+            
+            if value > self._peak:
+                self._peak = value
         
-        if len(returns) == 0:
+        self._last_timestamp = timestamp
+        self._prev_value = value
+        # No drawdown is measured until the account has a positive peak
+        if self._peak > 0:
+            self._current_drawdown = (value - self._peak) / self._peak
+            if self._current_drawdown < self._max_drawdown:
+                self._max_drawdown = self._current_drawdown
+    
+    def _calculate_performance_metrics(self) -> Dict[str, Any]:
+        """Calculate performance metrics from the running statistics."""
+        if len(self.metrics_history) < 2 or self._returns.count == 0:
             return {}
         
         # Basic performance metrics
-        initial_value = df['total_value'].iloc[0]
-        current_value = df['total_value'].iloc[-1]
-        total_return = (current_value - initial_value) / initial_value
+        initial_value = self._first_value
+        current_value = self._prev_value
+        if initial_value != 0:
+            total_return = (current_value - initial_value) / initial_value
+        else:
+            total_return = float('nan')  # unfunded start, no return baseline
         
         # Risk metrics
-        if len(returns) > 1:
+        if self._returns.count > 1:
             # Annualized metrics (assuming we update every minute for live trading)
             periods_per_year = 525600  # Minutes in a year
             update_periods_per_year = periods_per_year / self.update_interval
             
-            mean_return = returns.mean()
-            volatility = returns.std()
+            mean_return = self._returns.mean
+            volatility = self._returns.sample_std()
             
             # Annualized Sharpe ratio (assuming 0% risk-free rate for simplicity)
             sharpe_ratio = (mean_return * update_periods_per_year) / (volatility * (update_periods_per_year ** 0.5)) if volatility > 0 else 0
             
             # Drawdown calculation
-            peak = df['total_value'].expanding().max()
-            drawdown = (df['total_value'] - peak) / peak
-            max_drawdown = drawdown.min()
-            current_drawdown = drawdown.iloc[-1]
+            max_drawdown = self._max_drawdown
+            current_drawdown = self._current_drawdown
             
-            # Sortino ratio (downside deviation)
-            negative_returns = returns[returns < 0]
-            downside_deviation = negative_returns.std() if len(negative_returns) > 0 else 0
+            # Sortino ratio (downside deviation; undefined for a single loss)
+            negative_returns = self._negative_returns
+            downside_deviation = negative_returns.sample_std() if negative_returns.count > 1 else 0
             sortino_ratio = (mean_return * update_periods_per_year) / (downside_deviation * (update_periods_per_year ** 0.5)) if downside_deviation > 0 else 0
         else:
             sharpe_ratio = 0
@@ -111,7 +163,7 @@ class LiveMetricsAggregator:
             volatility = 0
         
         # Calculate session duration
-        session_duration = (df.index[-1] - df.index[0]).total_seconds() / 3600  # Hours
+        session_duration = (self._last_timestamp - self._first_timestamp).total_seconds() / 3600  # Hours
         
         return {
             'total_return': total_return,
@@ -129,12 +181,15 @@ class LiveMetricsAggregator:
     
     def get_equity_curve(self) -> pd.DataFrame:
         """Get equity curve as DataFrame."""
-        if not self.metrics_history:
+        if not self._timestamps:
             return pd.DataFrame()
         
-        df = pd.DataFrame(self.metrics_history)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        return df[['timestamp', 'total_value', 'unrealized_pnl', 'cash_balance']].copy()
+        return pd.DataFrame({
+            'timestamp': pd.to_datetime(self._timestamps),
+            'total_value': self._total_values,
+            'unrealized_pnl': self._unrealized_pnls,
+            'cash_balance': self._cash_balances,
+        })
     
     def get_current_metrics(self) -> Dict[str, Any]:
         """Get the latest metrics."""
@@ -142,8 +197,18 @@ class LiveMetricsAggregator:
             return {}
         return self.metrics_history[-1].copy()
     
-    def export_to_csv(self, output_dir: str = "live_trading_results") -> Dict[str, str]:
-        """Export live trading metrics to CSV files."""
+    def export_to_csv(
+        self,
+        output_dir: str = "live_trading_results",
+        export_format: Literal["csv", "parquet"] = "csv",
+    ) -> Dict[str, str]:
+        """Export live trading metrics to CSV files.
+        
+        With ``export_format="parquet"`` the same tables are written as
+        zstd-compressed Parquet files instead (requires pyarrow).
+        """
+        if export_format not in ("csv", "parquet"):
+            raise ValueError(f"Unsupported export format: {export_format}")
         if not self.metrics_history:
             return {}
         
@@ -153,11 +218,17 @@ class LiveMetricsAggregator:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         files_created = {}
         
+        def write(df: pd.DataFrame, name: str) -> str:
+            path = output_path / f"{name}_{timestamp}.{export_format}"
+            if export_format == "parquet":
+                df.to_parquet(path, index=False, compression="zstd")
+            else:
+                df.to_csv(path, index=False)
+            return str(path)
+        
         # Export metrics history (equity curve and performance)
         metrics_df = pd.DataFrame(self.metrics_history)
-        metrics_file = output_path / f"live_metrics_{timestamp}.csv"
-        metrics_df.to_csv(metrics_file, index=False)
-        files_created['live_metrics'] = str(metrics_file)
+        files_created['live_metrics'] = write(metrics_df, "live_metrics")
         
         # Export current performance summary
         if len(self.metrics_history) > 1:
@@ -169,15 +240,18 @@ class LiveMetricsAggregator:
                 **{k: v for k, v in latest_metrics.items() if k != 'timestamp'}
             }
             summary_df = pd.DataFrame([summary_data])
-            summary_file = output_path / f"session_summary_{timestamp}.csv"
-            summary_df.to_csv(summary_file, index=False)
-            files_created['session_summary'] = str(summary_file)
+            files_created['session_summary'] = write(summary_df, "session_summary")
         
-        self.logger.info(f"Exported live trading metrics to {len(files_created)} files")
+        self.logger.info("Exported live trading metrics to %d files", len(files_created))
         return files_created
     
     def reset(self) -> None:
         """Reset the aggregator for a new session."""
         self.metrics_history.clear()
+        self._timestamps.clear()
+        self._total_values.clear()
+        self._unrealized_pnls.clear()
+        self._cash_balances.clear()
         self.start_time = datetime.now()
+        self._reset_stats()
         self.logger.info("Metrics aggregator reset for new session")
\ No newline at end of file
@@ -1,5 +1,20 @@
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any, Callable
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+from numpy.typing import DTypeLike
+
+from ..stats import var_cvar
+from .calculator import _sample_std
+from .performance import PerformanceMetrics
+from .processors import (
+    DrawdownProcessor,
+    EquityBuffer,
+    EquityCurveProcessor,
+    MetricProcessor,
+    ReturnsStatsProcessor,
+    TradeListProcessor,
+)
 
 class Metric:
     """
@@ -17,60 +32,336 @@ class Metric:
     def result(self):
         raise NotImplementedError
 
-class EquityCurveMetric(Metric):
-    def __init__(self):
-        self.equity_curve = []
+class MetricsPipeline:
+    """
+    Pipeline that feeds bars and trades to a set of metric processors.
 
-    def process_bar(self, bar: Dict[str, Any]):
-        self.equity_curve.append(bar['equity'])
+    The pipeline records every bar once in a shared EquityBuffer and hands it
+    to the processors at initialization, so the equity curve and drawdown
+    processors read one copy of the equity data instead of each keeping
+    their own.
 
-    def result(self):
-        return pd.Series(self.equity_curve, name='equity')
+    Metric queries are cached until the next bar, trade or processor change,
+    so repeated queries between updates do not recompute anything; treat the
+    returned DataFrames and Series as read-only.
 
-class DrawdownMetric(Metric):
-    def __init__(self):
-        self.equity_curve = []
-        self.drawdown = None
+    ``dtype`` sets the value dtype of the shared buffer; np.float32 halves the
+    memory of long or many concurrent runs, at about seven significant digits.
+    """
+    def __init__(self, processors: Optional[List[MetricProcessor]] = None,
+                 dtype: DTypeLike = np.float64):
+        if processors is None:
+            processors = [
+                EquityCurveProcessor(),
+                DrawdownProcessor(),
+                TradeListProcessor(),
+            ]
+        self._processors: Dict[str, MetricProcessor] = {}
+        for processor in processors:
+            self._processors[processor.name] = processor
+        self._buffer = EquityBuffer(dtype=dtype)
+        self._initial_cash = 0.0
+        self._initialized = False
+        self._init_kwargs: Dict[str, Any] = {}
+        # Bumped on every state change; cached results carry the version
+        # they were computed at
+        self._version = 0
+        self._metrics_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self._summary_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._refresh_dispatch()
 
-    def process_bar(self, bar: Dict[str, Any]):
-        self.equity_curve.append(bar['equity'])
+    @property
+    def processor_names(self) -> List[str]:
+        """Names of the registered processors, in dispatch order."""
+        return list(self._processors)
 
-    def finalize(self):
-        equity = pd.Series(self.equity_curve)
-        peak = equity.expanding().max()
-        self.drawdown = (equity - peak) / peak
+    @property
+    def is_initialized(self) -> bool:
+        """Check if the pipeline is initialized."""
+        return self._initialized
 
-    def result(self):
-        return self.drawdown
+    def add_processor(self, processor: MetricProcessor) -> None:
+        """Register a processor, initializing it if the pipeline already is.
 
-class TradeListMetric(Metric):
-    def __init__(self):
-        self.trades = []
+        Args:
+            processor: Processor to add; replaces one with the same name
+        """
+        self._processors[processor.name] = processor
+        self._version += 1
+        self._refresh_dispatch()
+        if self._initialized:
+            self._initialize_processor(processor)
 
-    def process_trade(self, trade: Dict[str, Any]):
-        self.trades.append(trade)
+    def remove_processor(self, name: str) -> bool:
+        """Remove a processor by name.
 
-    def result(self):
-        return pd.DataFrame(self.trades)
+        Returns:
+            True if a processor was removed
+        """
+        self._version += 1
+        removed = self._processors.pop(name, None) is not None
+        self._refresh_dispatch()
+        return removed
 
-class MetricsPipeline:
-    """
-    Pipeline to process and aggregate metrics. Extensible for new metrics.
-    """
-    def __init__(self, metrics: List[Metric]):
-        self.metrics = metrics
+    def _refresh_dispatch(self) -> None:
+        """Cache the built-in processors so per-bar dispatch skips the loop."""
+        processors = self._processors
+        self._equity_proc = processors.get("equity_curve")
+        self._drawdown_proc = processors.get("drawdown")
+        self._trade_proc = processors.get("trade_list")
+        roles = ("equity_curve", "drawdown", "trade_list")
+        self._extra_procs = [
+            processor for name, processor in processors.items() if name not in roles
+        ]
 
-    def process_bar(self, bar: Dict[str, Any]):
-        for metric in self.metrics:
-            metric.process_bar(bar)
+    def get_processor(self, name: str) -> Optional[MetricProcessor]:
+        """Get a processor by name, or None if it is not registered."""
+        return self._processors.get(name)
 
-    def process_trade(self, trade: Dict[str, Any]):
-        for metric in self.metrics:
-            metric.process_trade(trade)
+    def initialize(self, initial_cash: float, n_bars: Optional[int] = None,
+                   **kwargs) -> None:
+        """Initialize the pipeline and all processors.
 
-    def finalize(self):
-        for metric in self.metrics:
-            metric.finalize()
+        Args:
+            initial_cash: Starting cash amount
+            n_bars: Expected number of bars; sizes the equity buffer up front
+                so recording never reallocates, and is passed on to processors
+            **kwargs: Additional parameters passed to every processor
+        """
+        if n_bars is not None:
+            kwargs['n_bars'] = n_bars
+            self._buffer.reserve(n_bars)
+        self._initial_cash = initial_cash
+        self._init_kwargs = kwargs
+        self._version += 1
+        self._buffer.clear()
+        for processor in self._processors.values():
+            self._initialize_processor(processor)
+        self._initialized = True
+
+    def _initialize_processor(self, processor: MetricProcessor) -> None:
+        """Initialize one processor against the shared equity buffer."""
+        processor.initialize(
+            self._initial_cash, equity_buffer=self._buffer, **self._init_kwargs
+        )
+
+    def process_bar(self, timestamp: datetime, portfolio_value: float,
+                    bar_data: Optional[Dict[str, Any]] = None) -> None:
+        """Record a bar and pass it to every processor.
+
+        Args:
+            timestamp: Current timestamp
+            portfolio_value: Current total portfolio value
+            bar_data: Additional bar data (prices, volume, etc.)
+        """
+        if not self._initialized:
+            raise RuntimeError("MetricsPipeline not initialized")
+        if bar_data is None:
+            bar_data = {}
+
+        self._version += 1
+        self._buffer.append(timestamp, portfolio_value)
+        # Built-in roles are called directly; only extra processors loop
+        if self._equity_proc is not None:
+            self._equity_proc.process_bar(timestamp, portfolio_value, bar_data)
+        if self._drawdown_proc is not None:
+            self._drawdown_proc.process_bar(timestamp, portfolio_value, bar_data)
+        if self._trade_proc is not None:
+            self._trade_proc.process_bar(timestamp, portfolio_value, bar_data)
+        for processor in self._extra_procs:
+            processor.process_bar(timestamp, portfolio_value, bar_data)
+
+    def process_bars_bulk(self, timestamps, portfolio_values) -> None:
+        """Record many bars at once, for replays whose equity curve is known.
+
+        The bars are written to the shared buffer in one copy and each
+        processor gets the whole batch through its process_bars; the built-in
+        processors update in bulk (the drawdown state in one compiled loop),
+        leaving the same state as calling process_bar per bar.
+
+        Args:
+            timestamps: Bar timestamps (datetime64 array or datetimes)
+            portfolio_values: Portfolio value per bar
+        """
+        if not self._initialized:
+            raise RuntimeError("MetricsPipeline not initialized")
+        timestamps = np.asarray(timestamps, dtype="datetime64[ns]")
+        portfolio_values = np.asarray(portfolio_values, dtype=np.float64)
+        if timestamps.shape != portfolio_values.shape:
+            raise ValueError("timestamps and values must have the same length")
+        if portfolio_values.shape[0] == 0:
+            return
+
+        self._version += 1
+        self._buffer.extend(timestamps, portfolio_values)
+        for processor in self._processors.values():
+            processor.process_bars(timestamps, portfolio_values)
+
+    def process_trade(self, trade: Dict[str, Any]) -> None:
+        """Pass a completed trade to every processor.
+
+        Args:
+            trade: Trade data containing symbol, side, quantity, price, pnl, etc.
+        """
+        if not self._initialized:
+            raise RuntimeError("MetricsPipeline not initialized")
+
+        self._version += 1
+        for processor in self._processors.values():
+            processor.process_trade(trade)
+
+    def _cached_metrics(self, name: str, processor: MetricProcessor) -> Dict[str, Any]:
+        """Return a processor's metrics, recomputing them only after a change."""
+        cached = self._metrics_cache.get(name)
+        if cached is None or cached[0] != self._version:
+            cached = (self._version, processor.get_metrics())
+            self._metrics_cache[name] = cached
+        return dict(cached[1])
+
+    def get_all_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Get the metrics of every processor, keyed by processor name."""
+        return {
+            name: self._cached_metrics(name, processor)
+            for name, processor in self._processors.items()
+        }
+
+    def get_processor_metrics(self, name: str) -> Dict[str, Any]:
+        """Get the metrics of one processor, or an empty dict if not registered."""
+        processor = self._processors.get(name)
+        if processor is None:
+            return {}
+        return self._cached_metrics(name, processor)
+
+    def get_summary_metrics(self) -> Dict[str, Any]:
+        """Get the scalar metrics of the built-in processors in one dictionary."""
+        cached = self._summary_cache
+        if cached is None or cached[0] != self._version:
+            cached = (self._version, self._compute_summary_metrics())
+            self._summary_cache = cached
+        return dict(cached[1])
+
+    def _compute_summary_metrics(self) -> Dict[str, Any]:
+        """Collect the built-in processors' scalar metrics."""
+        summary: Dict[str, Any] = {}
+        for name in ("equity_curve", "drawdown", "trade_list"):
+            processor = self._processors.get(name)
+            if processor is None:
+                continue
+            # Processors that can report scalars alone skip their table build
+            get_scalars = getattr(processor, "get_scalar_metrics", None)
+            if get_scalars is not None:
+                summary.update(get_scalars())
+                continue
+            for key, value in self._cached_metrics(name, processor).items():
+                if not isinstance(value, (pd.DataFrame, pd.Series)):
+                    summary[key] = value
+        return summary
+
+    def get_equity_curve(self) -> pd.DataFrame:
+        """Get the equity curve in the BacktestResults.get_equity_curve format."""
+        buffer = self._buffer
+        if buffer.n == 0:
+            return pd.DataFrame()
+        return pd.DataFrame(
+            {'equity': buffer.values.copy()},
+            index=pd.DatetimeIndex(buffer.timestamps, name='timestamp', copy=True),
+        )
+
+    def get_trades(self) -> pd.DataFrame:
+        """Get completed trades in the BacktestResults.get_trades format."""
+        processor = self._processors.get("trade_list")
+        if processor is None:
+            return pd.DataFrame()
+        return processor.get_trades_dataframe()
+
+    def to_performance_metrics(
+        self, risk_free_rate: float = 0.02
+    ) -> PerformanceMetrics:
+        """Convert the pipeline state to a PerformanceMetrics object.
+
+        Args:
+            risk_free_rate: Annual risk-free rate for the Sharpe and Sortino ratios
+
+        Returns:
+            PerformanceMetrics computed like MetricsCalculator.calculate
+        """
+        summary = self.get_summary_metrics()
+        # The initial cash is the baseline point before the recorded bars
+        equity = self._buffer.values.astype(np.float64, copy=False)
+
+        initial_value = self._initial_cash
+        current_value = summary.get('current_value', initial_value)
+        total_return = (
+            (current_value - initial_value) / initial_value if initial_value else 0.0
+        )
+
+        # Annualized return
+        years = (equity.shape[0] + 1) / 252  # Assuming 252 trading days per year
+        annualized_return = (1 + total_return) ** (1 / years) - 1 if years > 0 else 0
+
+        # Return-based risk metrics, from one returns array
+        volatility, sharpe_ratio, sortino_ratio = 0.0, 0.0, 0.0
+        var_95, cvar_95 = 0.0, 0.0
+        returns = np.empty(equity.shape[0])
+        if equity.shape[0]:
+            returns[0] = equity[0] - initial_value
+            np.subtract(equity[1:], equity[:-1], out=returns[1:])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                returns[0] /= np.float64(initial_value)
+                # In place, no temporary
+                np.divide(returns[1:], equity[:-1], out=returns[1:])
+        returns = returns[~np.isnan(returns)]
+        if returns.shape[0] > 1:
+            # Running statistics, when tracked, replace the std passes
+            stats_processor = self._processors.get("returns_stats")
+            if isinstance(stats_processor, ReturnsStatsProcessor):
+                stats = self._cached_metrics("returns_stats", stats_processor)
+                mean, std = stats["mean_return"], stats["return_std"]
+                downside_std = stats["downside_std"] * np.sqrt(252)
+            else:
+                mean, std = returns.mean(), returns.std(ddof=1)
+                downside_std = _sample_std(returns[returns < 0]) * np.sqrt(252)
+            # Subtracting the risk-free rate leaves the std unchanged
+            volatility = std * np.sqrt(252)
+            if std != 0:
+                sharpe_ratio = (mean - risk_free_rate / 252) / std * np.sqrt(252)
+            if downside_std > 0:
+                sortino_ratio = (annualized_return - risk_free_rate) / downside_std
+        if returns.shape[0] > 0:
+            var_95, cvar_95 = var_cvar(returns)
+
+        max_drawdown = summary.get('max_drawdown', 0.0)
+        calmar_ratio = annualized_return / abs(max_drawdown) if max_drawdown != 0 else 0
+
+        return PerformanceMetrics(
+            total_return=total_return,
+            annualized_return=annualized_return,
+            cumulative_return=total_return,
+            volatility=volatility,
+            sharpe_ratio=sharpe_ratio,
+            sortino_ratio=sortino_ratio,
+            max_drawdown=max_drawdown,
+            max_drawdown_duration=summary.get('max_drawdown_duration', 0),
+            total_trades=summary.get('total_trades', 0),
+            winning_trades=summary.get('winning_trades', 0),
+            losing_trades=summary.get('losing_trades', 0),
+            win_rate=summary.get('win_rate', 0.0),
+            avg_win=summary.get('avg_win', 0.0),
+            avg_loss=summary.get('avg_loss', 0.0),
+            profit_factor=summary.get('profit_factor', 0.0),
+            calmar_ratio=calmar_ratio,
+            var_95=var_95,
+            cvar_95=cvar_95,
+        )
 
-    def results(self) -> Dict[str, Any]:
-        return {metric.__class__.__name__: metric.result() for metric in self.metrics}
+    def reset(self) -> None:
+        """Reset the pipeline and all processors."""
+        for processor in self._processors.values():
+            processor.reset()
+        self._buffer.clear()
+        self._initial_cash = 0.0
+        self._init_kwargs = {}
+        self._version += 1
+        self._metrics_cache.clear()
+        self._summary_cache = None
+        self._initialized = False
@@ -1,13 +1,18 @@
 """Metric processors for the MetricsPipeline."""
 
 from .base import MetricProcessor
+from .buffer import EquityBuffer
 from .equity import EquityCurveProcessor
 from .drawdown import DrawdownProcessor
 from .trades import TradeListProcessor
+from .returns import ReturnsStatsProcessor, RunningMoments
 
 __all__ = [
     'MetricProcessor',
+    'EquityBuffer',
     'EquityCurveProcessor',
     'DrawdownProcessor',
-    'TradeListProcessor'
+    'TradeListProcessor',
+    'ReturnsStatsProcessor',
+    'RunningMoments'
 ]
\ No newline at end of file
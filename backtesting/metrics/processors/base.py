@@ -40,6 +40,21 @@ class MetricProcessor(ABC):
         """
         pass
     
+    def process_bars(self, timestamps, portfolio_values) -> None:
+        """Process many bars at once.
+        
+        The default calls process_bar per bar with empty bar data; processors
+        override it with a vectorized update.
+        
+        Args:
+            timestamps: Bar timestamps (datetime64 array or datetimes)
+            portfolio_values: Portfolio value per bar
+        """
+        for timestamp, value in zip(
+            pd.DatetimeIndex(timestamps).to_pydatetime(), portfolio_values
+        ):
+            self.process_bar(timestamp, float(value), {})
+    
     @abstractmethod
     def process_trade(self, trade: Dict[str, Any]) -> None:
         """Process a completed trade.
@@ -1,34 +1,128 @@
 """Drawdown processor for tracking portfolio drawdowns."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 import pandas as pd
 import numpy as np
 from datetime import datetime
+from numpy.typing import DTypeLike
+from ...jit import NUMBA_AVAILABLE, njit
 from .base import MetricProcessor
+from .buffer import EquityBuffer
+
+
+@njit(cache=True)
+def _fused_drawdown(equity, initial_peak):
+    """Drawdown from the running peak in one pass, writing only the result.
+
+    Matches ``(equity - peak) / peak`` with ``peak`` the running maximum of
+    ``initial_peak`` and the equity, including NaN propagating to every later
+    peak.
+    """
+    n = equity.shape[0]
+    out = np.empty(n)
+    peak = initial_peak
+    for i in range(n):
+        value = equity[i]
+        if peak == peak and not value <= peak:
+            peak = value
+        out[i] = (value - peak) / peak
+    return out
+
+
+def _drawdown(equity: np.ndarray, initial_peak: float) -> np.ndarray:
+    """Drawdown series of an equity array starting from initial_peak.
+
+    Fused into one loop when compiled.
+    """
+    if NUMBA_AVAILABLE:
+        return _fused_drawdown(equity, initial_peak)
+    peak = np.maximum.accumulate(equity)
+    np.maximum(peak, initial_peak, out=peak)
+    return (equity - peak) / peak
+
+
+@njit(cache=True)
+def _drawdown_scan(values, peak, max_drawdown, duration, max_duration):
+    """Apply DrawdownProcessor.process_bar's update to each value in turn.
+
+    Returns the updated (peak, max_drawdown, duration, max_duration) plus the
+    index of the value that opened the drawdown still running at the end, or
+    -1 if none opened within ``values``.
+    """
+    start = -1
+    for i in range(values.shape[0]):
+        value = values[i]
+        if value > peak:
+            peak = value
+            if duration > 0:
+                if duration > max_duration:
+                    max_duration = duration
+                duration = 0
+                start = -1
+        else:
+            drawdown = (value - peak) / peak
+            if drawdown < max_drawdown:
+                max_drawdown = drawdown
+            if duration == 0:
+                start = i
+            duration += 1
+    return peak, max_drawdown, duration, max_duration, start
 
 
 class DrawdownProcessor(MetricProcessor):
-    """Processor for calculating drawdown metrics."""
+    """Processor for calculating drawdown metrics.
+    
+    Peak, maximum drawdown and durations are updated per bar, starting from
+    the initial cash as the peak; the equity points behind the drawdown
+    series come from an EquityBuffer, either the processor's own or one
+    shared through MetricsPipeline.
+    
+    Args:
+        store_series: Record equity points of its own so get_metrics can
+            return the full drawdown series. With False and no shared buffer
+            only the running scalars are kept (O(1) memory) and
+            ``drawdown_series`` is None.
+        dtype: Value dtype of the processor's own buffer; np.float32 halves
+            its memory. Running scalars stay float64.
+    """
     
-    def __init__(self):
+    def __init__(self, store_series: bool = True, dtype: DTypeLike = np.float64):
         super().__init__("drawdown")
-        self._equity_values = []
-        self._timestamps = []
+        self.store_series = store_series
+        self.dtype = np.dtype(dtype)
+        self._own_buffer = EquityBuffer(dtype=self.dtype) if store_series else None
+        self._buffer = self._own_buffer
+        self._records = store_series
+        self._initial_cash = 0.0
+        self._current_value = 0.0
         self._current_peak = 0.0
         self._max_drawdown = 0.0
         self._max_drawdown_duration = 0
         self._current_drawdown_start = None
         self._current_drawdown_duration = 0
     
-    def initialize(self, initial_cash: float, **kwargs) -> None:
+    def initialize(self, initial_cash: float,
+                   equity_buffer: Optional[EquityBuffer] = None,
+                   n_bars: Optional[int] = None, **kwargs) -> None:
         """Initialize with starting cash.
         
         Args:
             initial_cash: Starting cash amount
+            equity_buffer: Shared buffer written by the caller; when omitted
+                the processor records its own
+            n_bars: Expected number of bars, to size the own buffer up front
         """
+        self._initial_cash = initial_cash
         self._current_peak = initial_cash
-        self._equity_values = [initial_cash]
-        self._timestamps = [datetime.now()]
+        self._current_value = initial_cash
+        self._records = equity_buffer is None and self.store_series
+        if self._records:
+            self._buffer = self._own_buffer
+            self._buffer.clear()
+            if n_bars is not None:
+                self._buffer.reserve(n_bars)
+        else:
+            self._buffer = equity_buffer
         self._initialized = True
     
     def process_bar(self, timestamp: datetime, portfolio_value: float, 
@@ -43,8 +137,9 @@ class DrawdownProcessor(MetricProcessor):
         if not self._initialized:
             raise RuntimeError("DrawdownProcessor not initialized")
         
-        self._equity_values.append(portfolio_value)
-        self._timestamps.append(timestamp)
+        if self._records:
+            self._buffer.append(timestamp, portfolio_value)
+        self._current_value = portfolio_value
         
         # Update peak
         if portfolio_value > self._current_peak:
@@ -72,6 +167,44 @@ class DrawdownProcessor(MetricProcessor):
             else:
                 self._current_drawdown_duration += 1
     
+    def process_bars(self, timestamps, portfolio_values) -> None:
+        """Process many bars at once; same result as calling process_bar per bar.
+        
+        The per-bar update runs as one compiled loop over the values (see
+        backtesting.jit), so long histories avoid a Python call per bar.
+        
+        Args:
+            timestamps: Bar timestamps (datetime64 array or datetimes)
+            portfolio_values: Portfolio value per bar
+        """
+        if not self._initialized:
+            raise RuntimeError("DrawdownProcessor not initialized")
+        
+        values = np.asarray(portfolio_values, dtype=np.float64)
+        if values.shape[0] == 0:
+            return
+        if self._records:
+            self._buffer.extend(timestamps, values)
+        self._current_value = float(values[-1])
+        
+        peak, max_dd, duration, max_duration, start = _drawdown_scan(
+            values,
+            float(self._current_peak),
+            float(self._max_drawdown),
+            self._current_drawdown_duration,
+            self._max_drawdown_duration,
+        )
+        self._current_peak = float(peak)
+        self._max_drawdown = float(max_dd)
+        self._max_drawdown_duration = int(max_duration)
+        self._current_drawdown_duration = int(duration)
+        if duration == 0:
+            self._current_drawdown_start = None
+        elif start >= 0:
+            self._current_drawdown_start = pd.Timestamp(
+                np.asarray(timestamps, dtype="datetime64[ns]")[start]
+            ).to_pydatetime()
+    
     def process_trade(self, trade: Dict[str, Any]) -> None:
         """Process a trade (drawdown updates on bar basis).
         
@@ -87,23 +220,38 @@ class DrawdownProcessor(MetricProcessor):
         Returns:
             Dictionary containing drawdown metrics
         """
-        if len(self._equity_values) < 2:
+        buffer = self._buffer
+        if buffer is not None and buffer.n == 0:
+            return {**self.get_scalar_metrics(), "drawdown_series": pd.Series(dtype=float)}
+        
+        # Calculate full drawdown series from the running peak
+        drawdown_series = None
+        if buffer is not None:
+            drawdown_series = pd.Series(
+                _drawdown(buffer.values, self._initial_cash),
+                index=pd.DatetimeIndex(buffer.timestamps, copy=True),
+            )
+        
+        return {**self.get_scalar_metrics(), "drawdown_series": drawdown_series}
+    
+    def get_scalar_metrics(self) -> Dict[str, Any]:
+        """Get the drawdown statistics without building the drawdown series.
+        
+        Returns:
+            Dictionary containing drawdown metrics other than the series
+        """
+        buffer = self._buffer
+        if buffer is not None and buffer.n == 0:
             return {
                 "max_drawdown": 0.0,
                 "max_drawdown_duration": 0,
                 "current_drawdown": 0.0,
                 "current_drawdown_duration": 0,
-                "drawdown_series": pd.Series(dtype=float)
             }
         
-        # Calculate full drawdown series
-        equity_series = pd.Series(self._equity_values, index=self._timestamps)
-        peak_series = equity_series.expanding().max()
-        drawdown_series = (equity_series - peak_series) / peak_series
-        
         # Current drawdown info
-        current_value = self._equity_values[-1]
-        current_drawdown = (current_value - self._current_peak) / self._current_peak
+        peak_value = self._current_peak
+        current_drawdown = (self._current_value - peak_value) / peak_value
         
         # If we're still in a drawdown, use current duration
         current_dd_duration = self._current_drawdown_duration
@@ -115,14 +263,17 @@ class DrawdownProcessor(MetricProcessor):
             "max_drawdown_duration": max(self._max_drawdown_duration, current_dd_duration),
             "current_drawdown": current_drawdown,
             "current_drawdown_duration": current_dd_duration,
-            "drawdown_series": drawdown_series
         }
     
     def reset(self) -> None:
         """Reset the processor."""
         super().reset()
-        self._equity_values = []
-        self._timestamps = []
+        if self._own_buffer is not None:
+            self._own_buffer.clear()
+        self._buffer = self._own_buffer
+        self._records = self.store_series
+        self._initial_cash = 0.0
+        self._current_value = 0.0
         self._current_peak = 0.0
         self._max_drawdown = 0.0
         self._max_drawdown_duration = 0
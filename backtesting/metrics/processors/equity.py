@@ -1,27 +1,56 @@
 """Equity curve processor for tracking portfolio value over time."""
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Optional
+import numpy as np
 import pandas as pd
+from numpy.typing import DTypeLike
 from datetime import datetime
 from .base import MetricProcessor
+from .buffer import EquityBuffer
 
 
 class EquityCurveProcessor(MetricProcessor):
-    """Processor for tracking equity curve over time."""
+    """Processor for tracking equity curve over time.
     
-    def __init__(self):
+    Points are kept in an EquityBuffer, one per bar; the initial cash is the
+    baseline for returns rather than a point of the curve. Standalone the processor records into
+    its own buffer; inside MetricsPipeline it reads the pipeline's shared
+    buffer, which the pipeline has already written by the time process_bar
+    runs.
+    
+    Args:
+        dtype: Value dtype of the processor's own buffer; np.float32 halves
+            its memory. A shared buffer keeps the dtype it was created with.
+    """
+    
+    def __init__(self, dtype: DTypeLike = np.float64):
         super().__init__("equity_curve")
-        self._equity_data: List[Tuple[datetime, float]] = []
+        self.dtype = np.dtype(dtype)
+        self._own_buffer = EquityBuffer(dtype=self.dtype)
+        self._buffer = self._own_buffer
+        self._records = True
         self._initial_cash = 0.0
     
-    def initialize(self, initial_cash: float, **kwargs) -> None:
+    def initialize(self, initial_cash: float,
+                   equity_buffer: Optional[EquityBuffer] = None,
+                   n_bars: Optional[int] = None, **kwargs) -> None:
         """Initialize with starting cash.
         
         Args:
             initial_cash: Starting cash amount
+            equity_buffer: Shared buffer written by the caller; when omitted
+                the processor records its own
+            n_bars: Expected number of bars, to size the own buffer up front
         """
         self._initial_cash = initial_cash
-        self._equity_data = [(datetime.now(), initial_cash)]
+        self._records = equity_buffer is None
+        if self._records:
+            self._buffer = self._own_buffer
+            self._buffer.clear()
+            if n_bars is not None:
+                self._buffer.reserve(n_bars)
+        else:
+            self._buffer = equity_buffer
         self._initialized = True
     
     def process_bar(self, timestamp: datetime, portfolio_value: float, 
@@ -36,7 +65,21 @@ class EquityCurveProcessor(MetricProcessor):
         if not self._initialized:
             raise RuntimeError("EquityCurveProcessor not initialized")
         
-        self._equity_data.append((timestamp, portfolio_value))
+        if self._records:
+            self._buffer.append(timestamp, portfolio_value)
+    
+    def process_bars(self, timestamps, portfolio_values) -> None:
+        """Record many bars at once.
+        
+        Args:
+            timestamps: Bar timestamps (datetime64 array or datetimes)
+            portfolio_values: Portfolio value per bar
+        """
+        if not self._initialized:
+            raise RuntimeError("EquityCurveProcessor not initialized")
+        
+        if self._records:
+            self._buffer.extend(timestamps, portfolio_values)
     
     def process_trade(self, trade: Dict[str, Any]) -> None:
         """Process a trade (equity curve updates on bar basis, not trade basis).
@@ -53,23 +96,32 @@ class EquityCurveProcessor(MetricProcessor):
         Returns:
             Dictionary containing equity curve data and basic metrics
         """
-        if not self._equity_data:
-            return {"equity_curve": pd.DataFrame(), "total_return": 0.0}
+        buffer = self._buffer
+        if buffer.n == 0:
+            return {"equity_curve": pd.DataFrame(), **self.get_scalar_metrics()}
         
         # Create DataFrame
-        timestamps, values = zip(*self._equity_data)
-        equity_df = pd.DataFrame({
-            'timestamp': timestamps,
-            'equity': values
-        }).set_index('timestamp')
+        equity_df = pd.DataFrame(
+            {'equity': buffer.values.copy()},
+            index=pd.DatetimeIndex(buffer.timestamps, name='timestamp', copy=True),
+        )
         
-        # Calculate basic metrics
-        total_return = (values[-1] / values[0]) - 1 if values[0] != 0 else 0.0
+        return {"equity_curve": equity_df, **self.get_scalar_metrics()}
+    
+    def get_scalar_metrics(self) -> Dict[str, Any]:
+        """Get the basic metrics without building the equity DataFrame.
+        
+        Returns:
+            Dictionary containing total return, current and initial value
+        """
+        values = self._buffer.values
+        initial = self._initial_cash
+        last = float(values[-1]) if values.shape[0] else initial
+        total_return = (last / initial) - 1 if initial != 0 else 0.0
         
         return {
-            "equity_curve": equity_df,
             "total_return": total_return,
-            "current_value": values[-1] if values else self._initial_cash,
+            "current_value": last,
             "initial_value": self._initial_cash
         }
     
@@ -79,14 +131,19 @@ class EquityCurveProcessor(MetricProcessor):
         Returns:
             Equity values as a time-indexed Series
         """
-        if not self._equity_data:
+        buffer = self._buffer
+        if buffer.n == 0:
             return pd.Series(dtype=float)
         
-        timestamps, values = zip(*self._equity_data)
-        return pd.Series(values, index=timestamps, name='equity')
+        return pd.Series(
+            buffer.values.copy(), index=pd.DatetimeIndex(buffer.timestamps, copy=True),
+            name='equity',
+        )
     
     def reset(self) -> None:
         """Reset the processor."""
         super().reset()
-        self._equity_data = []
-        self._initial_cash = 0.0
\ No newline at end of file
+        self._own_buffer.clear()
+        self._buffer = self._own_buffer
+        self._records = True
+        self._initial_cash = 0.0
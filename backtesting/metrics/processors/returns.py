@@ -0,0 +1,163 @@
+"""Returns statistics processor with O(1) volatility queries."""
+
+import math
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+
+from .base import MetricProcessor
+
+
+class RunningMoments:
+    """Count, mean and sum of squared deviations (M2) of a stream of values.
+
+    Single values are added with Welford's algorithm and batches merged with
+    Chan et al.'s pairwise update, so the variance is available in O(1)
+    without storing the values.
+    """
+
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float) -> None:
+        """Add one value."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, values: np.ndarray) -> None:
+        """Add a batch of values."""
+        batch_count = values.shape[0]
+        if batch_count == 0:
+            return
+        batch_mean = float(values.mean())
+        batch_m2 = float(np.square(values - batch_mean).sum())
+        total = self.count + batch_count
+        delta = batch_mean - self.mean
+        self.mean += delta * batch_count / total
+        self.m2 += batch_m2 + delta * delta * self.count * batch_count / total
+        self.count = total
+
+    def sample_std(self) -> float:
+        """Sample standard deviation (ddof=1), NaN below two values."""
+        if self.count < 2:
+            return math.nan
+        return math.sqrt(self.m2 / (self.count - 1))
+
+
+class ReturnsStatsProcessor(MetricProcessor):
+    """Processor keeping running statistics of per-bar returns.
+
+    Mean and variance of all returns, and of the negative returns for the
+    Sortino downside deviation, are kept as RunningMoments, so volatility is
+    available in O(1) without storing or rescanning returns.
+    MetricsPipeline.to_performance_metrics uses these statistics when this
+    processor is registered.
+    """
+
+    def __init__(self):
+        super().__init__("returns_stats")
+        self._reset_stats(0.0)
+
+    def _reset_stats(self, initial_value: float) -> None:
+        """Clear the accumulators and set the value returns start from."""
+        self._prev_value = initial_value
+        self._returns = RunningMoments()
+        self._downside = RunningMoments()
+
+    def initialize(self, initial_cash: float, **kwargs) -> None:
+        """Initialize with starting cash, the base of the first return.
+
+        Args:
+            initial_cash: Starting cash amount
+        """
+        self._reset_stats(initial_cash)
+        self._initialized = True
+
+    def process_bar(
+        self, timestamp: datetime, portfolio_value: float, bar_data: dict[str, Any]
+    ) -> None:
+        """Update the running statistics with the bar's return.
+
+        Args:
+            timestamp: Current timestamp
+            portfolio_value: Current total portfolio value
+            bar_data: Additional bar data (not used)
+        """
+        if not self._initialized:
+            raise RuntimeError("ReturnsStatsProcessor not initialized")
+
+        prev_value = self._prev_value
+        self._prev_value = portfolio_value
+        if prev_value == 0:
+            return
+        ret = (portfolio_value - prev_value) / prev_value
+        if ret != ret:
+            return  # NaN values carry no return
+
+        self._returns.add(ret)
+        if ret < 0:
+            self._downside.add(ret)
+
+    def process_bars(self, timestamps, portfolio_values) -> None:
+        """Update the statistics with many bars at once.
+
+        The batch's returns are reduced with numpy and merged into the
+        running moments.
+
+        Args:
+            timestamps: Bar timestamps (not used)
+            portfolio_values: Portfolio value per bar
+        """
+        if not self._initialized:
+            raise RuntimeError("ReturnsStatsProcessor not initialized")
+
+        values = np.asarray(portfolio_values, dtype=np.float64)
+        if values.shape[0] == 0:
+            return
+        bases = np.concatenate(([self._prev_value], values[:-1]))
+        self._prev_value = float(values[-1])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = (values - bases) / bases
+        returns = returns[(bases != 0) & ~np.isnan(returns)]
+
+        self._returns.merge(returns)
+        self._downside.merge(returns[returns < 0])
+
+    def process_trade(self, trade: dict[str, Any]) -> None:
+        """Process a trade (returns are tracked per bar).
+
+        Args:
+            trade: Trade data (not used)
+        """
+        pass
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get returns statistics.
+
+        Returns:
+            Dictionary with the return count, mean, sample standard deviation
+            (ddof=1, NaN below two returns), the same for negative returns,
+            and annualized volatility
+        """
+        returns = self._returns
+        std = returns.sample_std()
+        return {
+            "returns_count": returns.count,
+            "mean_return": returns.mean if returns.count else math.nan,
+            "return_std": std,
+            "downside_count": self._downside.count,
+            "downside_std": self._downside.sample_std(),
+            "volatility": std * math.sqrt(252) if returns.count > 1 else 0.0,
+        }
+
+    def reset(self) -> None:
+        """Reset the processor."""
+        super().reset()
+        self._reset_stats(0.0)
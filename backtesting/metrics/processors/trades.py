@@ -1,23 +1,31 @@
 """Trade list processor for tracking individual trades."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from .base import MetricProcessor
 
 
 class TradeListProcessor(MetricProcessor):
-    """Processor for maintaining a list of completed trades."""
+    """Processor for maintaining a list of completed trades.
+    
+    Trades are stored column-wise, one list per trade field, so the trades
+    DataFrame is built from ready-made columns instead of re-parsing a dict
+    per trade. Fields missing from a trade are filled with NaN, as
+    pd.DataFrame does for a list of records.
+    
+    Win/loss statistics are reduced from the pnl column when queried rather
+    than updated per trade; a trade without a pnl counts as zero.
+    """
     
     def __init__(self):
         super().__init__("trade_list")
-        self._trades: List[Dict[str, Any]] = []
+        self._columns: Dict[str, List[Any]] = {}
         self._trade_count = 0
-        self._winning_trades = 0
-        self._losing_trades = 0
-        self._total_pnl = 0.0
-        self._gross_wins = 0.0
-        self._gross_losses = 0.0
+        # Trades DataFrame, valid while _df_cache_count matches _trade_count
+        self._df_cache: Optional[pd.DataFrame] = None
+        self._df_cache_count = -1
     
     def initialize(self, initial_cash: float, **kwargs) -> None:
         """Initialize the trade list processor.
@@ -25,13 +33,10 @@ class TradeListProcessor(MetricProcessor):
         Args:
             initial_cash: Starting cash amount (not used for trade tracking)
         """
-        self._trades = []
+        self._columns = {}
         self._trade_count = 0
-        self._winning_trades = 0
-        self._losing_trades = 0
-        self._total_pnl = 0.0
-        self._gross_wins = 0.0
-        self._gross_losses = 0.0
+        self._df_cache = None
+        self._df_cache_count = -1
         self._initialized = True
     
     def process_bar(self, timestamp: datetime, portfolio_value: float, 
@@ -46,6 +51,10 @@ class TradeListProcessor(MetricProcessor):
         # Trade list is updated per trade, not per bar
         pass
     
+    def process_bars(self, timestamps, portfolio_values) -> None:
+        """Process many bars (trade list updates on trade basis)."""
+        pass
+    
     def process_trade(self, trade: Dict[str, Any]) -> None:
         """Process a completed trade.
         
@@ -55,22 +64,26 @@ class TradeListProcessor(MetricProcessor):
         if not self._initialized:
             raise RuntimeError("TradeListProcessor not initialized")
         
-        # Add trade to list
-        trade_copy = trade.copy()
-        trade_copy['trade_id'] = self._trade_count
-        self._trades.append(trade_copy)
-        self._trade_count += 1
-        
-        # Update statistics
-        pnl = trade.get('pnl', 0.0)
-        self._total_pnl += pnl
-        
-        if pnl > 0:
-            self._winning_trades += 1
-            self._gross_wins += pnl
-        elif pnl < 0:
-            self._losing_trades += 1
-            self._gross_losses += abs(pnl)
+        # Add trade to the columns
+        columns = self._columns
+        count = self._trade_count
+        written = 1
+        for key, value in trade.items():
+            if key == 'trade_id':
+                continue
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [np.nan] * count
+            column.append(value)
+            written += 1
+        columns.setdefault('trade_id', []).append(count)
+        count += 1
+        if written < len(columns):
+            # Pad the fields this trade did not have
+            for column in columns.values():
+                if len(column) < count:
+                    column.append(np.nan)
+        self._trade_count = count
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get trade list metrics.
@@ -78,9 +91,16 @@ class TradeListProcessor(MetricProcessor):
         Returns:
             Dictionary containing trade list and summary statistics
         """
-        if not self._trades:
+        return {"trades_df": self.get_trades_dataframe(), **self.get_scalar_metrics()}
+    
+    def get_scalar_metrics(self) -> Dict[str, Any]:
+        """Get the summary statistics without building the trades DataFrame.
+        
+        Returns:
+            Dictionary containing trade summary statistics
+        """
+        if self._trade_count == 0:
             return {
-                "trades_df": pd.DataFrame(),
                 "total_trades": 0,
                 "winning_trades": 0,
                 "losing_trades": 0,
@@ -91,46 +111,54 @@ class TradeListProcessor(MetricProcessor):
                 "total_pnl": 0.0
             }
         
-        # Create DataFrame
-        trades_df = pd.DataFrame(self._trades)
+        # Reduce the pnl column; padding for trades without a pnl is NaN
+        pnl = np.asarray(self._columns.get('pnl', ()), dtype=np.float64)
+        wins = pnl[pnl > 0]
+        losses = pnl[pnl < 0]
+        winning_trades = wins.shape[0]
+        losing_trades = losses.shape[0]
+        gross_wins = float(wins.sum())
+        gross_losses = 0.0 - float(losses.sum())
         
         # Calculate metrics
-        win_rate = self._winning_trades / self._trade_count if self._trade_count > 0 else 0.0
-        avg_win = self._gross_wins / self._winning_trades if self._winning_trades > 0 else 0.0
-        avg_loss = self._gross_losses / self._losing_trades if self._losing_trades > 0 else 0.0
-        profit_factor = self._gross_wins / self._gross_losses if self._gross_losses > 0 else float('inf')
+        win_rate = winning_trades / self._trade_count
+        avg_win = gross_wins / winning_trades if winning_trades > 0 else 0.0
+        avg_loss = gross_losses / losing_trades if losing_trades > 0 else 0.0
+        profit_factor = gross_wins / gross_losses if gross_losses > 0 else float('inf')
         
         return {
-            "trades_df": trades_df,
             "total_trades": self._trade_count,
-            "winning_trades": self._winning_trades,
-            "losing_trades": self._losing_trades,
+            "winning_trades": winning_trades,
+            "losing_trades": losing_trades,
             "win_rate": win_rate,
             "avg_win": avg_win,
             "avg_loss": avg_loss,
             "profit_factor": profit_factor,
-            "total_pnl": self._total_pnl,
-            "gross_wins": self._gross_wins,
-            "gross_losses": self._gross_losses
+            "total_pnl": float(np.nansum(pnl)),
+            "gross_wins": gross_wins,
+            "gross_losses": gross_losses
         }
     
     def get_trades_dataframe(self) -> pd.DataFrame:
         """Get trades as a DataFrame.
         
+        The DataFrame is built once per new trade count and reused until
+        another trade arrives, so treat it as read-only.
+        
         Returns:
             DataFrame containing all trades
         """
-        if not self._trades:
+        if self._trade_count == 0:
             return pd.DataFrame()
-        return pd.DataFrame(self._trades)
+        if self._df_cache_count != self._trade_count:
+            self._df_cache = pd.DataFrame(self._columns)
+            self._df_cache_count = self._trade_count
+        return self._df_cache
     
     def reset(self) -> None:
         """Reset the processor."""
         super().reset()
-        self._trades = []
+        self._columns = {}
         self._trade_count = 0
-        self._winning_trades = 0
-        self._losing_trades = 0
-        self._total_pnl = 0.0
-        self._gross_wins = 0.0
-        self._gross_losses = 0.0
\ No newline at end of file
+        self._df_cache = None
+        self._df_cache_count = -1
\ No newline at end of file
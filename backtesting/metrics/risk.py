@@ -3,6 +3,36 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
+from ..jit import njit
+from ..stats import var_cvar
+
+
+@njit(cache=True)
+def _downside_deviation(returns, target):
+    """Root mean square shortfall below target, over the returns below it.
+
+    One pass with no masked or squared temporaries; NaN returns are skipped
+    and no return below target gives NaN.
+    """
+    total = 0.0
+    count = 0
+    for i in range(returns.shape[0]):
+        shortfall = returns[i] - target
+        if shortfall < 0:
+            total += shortfall * shortfall
+            count += 1
+    if count == 0:
+        return np.nan
+    return np.sqrt(total / count)
+
+
+def _tail_stats(returns, confidence_level: float) -> tuple[float, float]:
+    """VaR and CVaR like np.percentile and a masked mean; NaN if any is NaN."""
+    arr = np.asarray(returns, dtype=np.float64)
+    if np.isnan(arr).any():
+        return np.nan, np.nan
+    return var_cvar(arr, 1 - confidence_level)
+
 
 @dataclass
 class RiskMetrics:
@@ -33,28 +63,37 @@ class RiskCalculator:
     @staticmethod
     def calculate_var(returns: pd.Series, confidence_level: float = 0.95) -> float:
         """Calculate Value at Risk."""
-        return np.percentile(returns, (1 - confidence_level) * 100)
+        return _tail_stats(returns, confidence_level)[0]
 
     @staticmethod
     def calculate_cvar(returns: pd.Series, confidence_level: float = 0.95) -> float:
         """Calculate Conditional Value at Risk (Expected Shortfall)."""
-        var = RiskCalculator.calculate_var(returns, confidence_level)
-        return returns[returns <= var].mean()
+        return _tail_stats(returns, confidence_level)[1]
+
+    @staticmethod
+    def calculate_drawdown(equity_curve: pd.Series) -> pd.Series:
+        """Calculate the drawdown from the running peak at every point.
+
+        The peak is an accumulated fmax, which skips NaN like
+        ``expanding().max()`` without its per-window machinery.
+        """
+        equity = equity_curve.to_numpy(dtype=np.float64)
+        peak = np.fmax.accumulate(equity)
+        return pd.Series((equity - peak) / peak, index=equity_curve.index)
 
     @staticmethod
     def calculate_maximum_drawdown(equity_curve: pd.Series) -> float:
         """Calculate maximum drawdown."""
-        peak = equity_curve.expanding().max()
-        drawdown = (equity_curve - peak) / peak
-        return drawdown.min()
+        return RiskCalculator.calculate_drawdown(equity_curve).min()
 
     @staticmethod
     def calculate_downside_deviation(
         returns: pd.Series, target_return: float = 0
     ) -> float:
         """Calculate downside deviation."""
-        downside_returns = returns[returns < target_return] - target_return
-        return np.sqrt(np.mean(downside_returns**2))
+        return _downside_deviation(
+            np.asarray(returns, dtype=np.float64), float(target_return)
+        )
 
     @staticmethod
     def calculate_rolling_var(
@@ -66,12 +105,30 @@ class RiskCalculator:
     @staticmethod
     def calculate_stress_scenarios(returns: pd.Series) -> dict[str, float]:
         """Calculate returns under various stress scenarios."""
+        arr = returns.to_numpy(dtype=np.float64)
+        valid = ~np.isnan(arr)
+
+        # Every window sum is a difference of one prefix sum; windows holding
+        # a NaN are dropped like rolling().sum() leaves them NaN
+        csum = np.concatenate(([0.0], np.cumsum(np.where(valid, arr, 0.0))))
+        nan_count = np.concatenate(([0], np.cumsum(~valid)))
+
+        def worst_window(window: int) -> float:
+            sums = csum[window:] - csum[:-window]
+            sums = sums[nan_count[window:] == nan_count[:-window]]
+            return sums.min() if sums.size else np.nan
+
+        # Tail means from a partition of the valid returns, not a sort + mask
+        clean = arr[valid]
+        tail_1pct = var_cvar(clean, 0.01)[1] if clean.size else np.nan
+        tail_5pct = var_cvar(clean, 0.05)[1] if clean.size else np.nan
+
         scenarios = {
             "worst_day": returns.min(),
-            "worst_week": returns.rolling(5).sum().min(),
-            "worst_month": returns.rolling(21).sum().min(),
-            "worst_quarter": returns.rolling(63).sum().min(),
-            "tail_expectation_1pct": returns[returns <= returns.quantile(0.01)].mean(),
-            "tail_expectation_5pct": returns[returns <= returns.quantile(0.05)].mean(),
+            "worst_week": worst_window(5),
+            "worst_month": worst_window(21),
+            "worst_quarter": worst_window(63),
+            "tail_expectation_1pct": tail_1pct,
+            "tail_expectation_5pct": tail_5pct,
         }
         return scenarios
@@ -4,16 +4,26 @@ import pandas as pd
 
 class SortinoMetric(Metric):
     def __init__(self, risk_free_rate: float = 0.0):
-        self.returns = []
+        # Growable float buffer, doubled when full, instead of a list of floats
+        self._buf = np.empty(1024, dtype=np.float64)
+        self._n = 0
         self.risk_free_rate = risk_free_rate
         self.sortino = None
 
+    @property
+    def returns(self) -> np.ndarray:
+        """Returns recorded so far (a view)."""
+        return self._buf[:self._n]
+
     def process_bar(self, bar):
         # Assume bar['return'] is the per-bar return (as a decimal, not %)
-        self.returns.append(bar.get('return', 0.0))
+        if self._n == self._buf.shape[0]:
+            self._buf = np.resize(self._buf, 2 * self._n)
+        self._buf[self._n] = bar.get('return', 0.0)
+        self._n += 1
 
     def finalize(self):
-        returns = np.array(self.returns)
+        returns = self.returns
         downside = returns[returns < self.risk_free_rate]
         downside_std = downside.std() * np.sqrt(252) if len(downside) > 0 else 0
         annualized_return = (1 + returns).prod() ** (252 / len(returns)) - 1 if len(returns) > 0 else 0
@@ -0,0 +1,50 @@
+"""
+Order-statistic helpers shared by the metrics and kill switch modules.
+
+Quantiles match np.percentile's default linear interpolation, but select just
+the two bracketing order statistics with ``np.partition`` instead of sorting.
+"""
+
+import numpy as np
+
+
+def _partition_quantile(
+    values: np.ndarray, q: float
+) -> tuple[np.ndarray, int, int, float]:
+    """Partition values around the q-quantile.
+
+    Returns the partitioned copy, the indices of the bracketing order
+    statistics and the interpolated quantile.
+    """
+    n = values.shape[0]
+    h = (n - 1) * q
+    lo = int(h)
+    hi = min(lo + 1, n - 1)
+    part = np.partition(values, (lo, hi))
+    low = part[lo]
+    return part, lo, hi, low + (part[hi] - low) * (h - lo)
+
+
+def quantile(values: np.ndarray, q: float) -> float:
+    """Linearly interpolated q-quantile of a non-empty array (q in [0, 1])."""
+    return _partition_quantile(values, q)[3]
+
+
+def var_cvar(returns: np.ndarray, q: float = 0.05) -> tuple[float, float]:
+    """Historical VaR and CVaR of a non-empty returns array at quantile q.
+
+    CVaR is the mean of the returns at or below the VaR. Both come from the one
+    partition: the returns left of the VaR are the tail, so there is no sort
+    and no mask over the whole array.
+    """
+    part, lo, hi, var = _partition_quantile(returns, q)
+    tail_sum, tail_count = part[: lo + 1].sum(), lo + 1
+    if hi > lo and part[hi] <= var:
+        # Values tied with the VaR beyond the bracketing pair are tail too
+        ties = part[hi:][part[hi:] <= var]
+        tail_sum += ties.sum()
+        tail_count += ties.shape[0]
+    return var, tail_sum / tail_count
+
+
+__all__ = ["quantile", "var_cvar"]
@@ -6,7 +6,11 @@ from .results import OptimizationResults
 
 
 class GridSearchOptimizer(ParameterOptimizer):
-    """Grid search parameter optimizer."""
+    """Grid search parameter optimizer.
+
+    Parallel runs need an importable strategy class and objective function
+    when workers are spawned; see ParameterOptimizer.
+    """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -24,15 +28,17 @@ class GridSearchOptimizer(ParameterOptimizer):
         Returns:
             OptimizationResults object
         """
-        combinations = parameter_space.get_combinations()
+        size = parameter_space.size()
 
         if verbose:
             print("Starting grid search optimization")
-            print(f"Parameter space size: {len(combinations)} combinations")
+            print(f"Parameter space size: {size} combinations")
             print(f"Using {self.max_workers or 'all available'} workers")
 
-        # Run optimization
-        results = self._run_parallel_optimization(data, combinations)
+        # Run optimization, streaming combinations rather than listing them
+        results = self._run_parallel_optimization(
+            data, parameter_space.iter_combinations(), count=size
+        )
 
         if verbose:
             successful_results = [r for r in results if r["success"]]
@@ -58,7 +64,11 @@ class GridSearchOptimizer(ParameterOptimizer):
 
 
 class RandomSearchOptimizer(ParameterOptimizer):
-    """Random search parameter optimizer."""
+    """Random search parameter optimizer.
+
+    Parallel runs need an importable strategy class and objective function
+    when workers are spawned; see ParameterOptimizer.
+    """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
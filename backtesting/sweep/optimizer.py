@@ -1,6 +1,10 @@
+import copy
+import multiprocessing
+import os
+import sys
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections.abc import Callable, Iterable, Iterator, Sized
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 import pandas as pd
@@ -8,9 +12,82 @@ import pandas as pd
 from ..core.engine import BacktestEngine
 from ..metrics.calculator import MetricsCalculator
 
+# Optimizer and market data of a worker process, set once by _init_worker so
+# each task only carries its parameter dict
+_worker_optimizer: "ParameterOptimizer | None" = None
+_worker_data: pd.DataFrame | None = None
+
+
+def _init_worker(optimizer: "ParameterOptimizer", data: pd.DataFrame) -> None:
+    """Receive the optimizer and data once per worker process."""
+    global _worker_optimizer, _worker_data
+    _worker_optimizer = optimizer
+    _worker_data = data
+
+
+def _evaluate_in_worker(params: dict[str, Any]) -> dict[str, Any]:
+    """Evaluate one combination against the worker's optimizer and data."""
+    return _worker_optimizer._evaluate_single_combination(params, _worker_data)
+
+
+def _numba_threads_started() -> bool:
+    """Whether Numba's threading layer has started its worker threads."""
+    numba = sys.modules.get("numba")
+    if numba is None:
+        return False
+    try:
+        numba.threading_layer()
+    except ValueError:
+        return False
+    return True
+
+
+def _pool_context(
+    mp_context: multiprocessing.context.BaseContext | None,
+) -> multiprocessing.context.BaseContext | None:
+    """Multiprocessing context for a worker pool.
+
+    An explicit context is used as given. Otherwise pools use the platform
+    default, except that once Numba's threading layer has started threads
+    (the parallel metrics kernels) workers come from a fork server, as
+    forking the parent directly then hangs it at exit.
+    """
+    if mp_context is not None:
+        return mp_context
+    if (
+        _numba_threads_started()
+        and "forkserver" in multiprocessing.get_all_start_methods()
+    ):
+        return multiprocessing.get_context("forkserver")
+    return None
+
+
+def _combination_key(params: dict[str, Any]) -> tuple | None:
+    """Canonical hashable key of a combination, or None if a value is unhashable.
+
+    Values are keyed with their type, so True, 1 and 1.0 stay distinct
+    combinations even though they compare and hash equal.
+    """
+    key = tuple(sorted((name, type(value), value) for name, value in params.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
 
 class ParameterOptimizer(ABC):
-    """Base class for parameter optimization."""
+    """Base class for parameter optimization.
+
+    Unless max_workers is 1, combinations are evaluated in worker processes.
+    Workers started with spawn or forkserver (the default on macOS and
+    Windows, and on Linux once Numba's parallel kernels have started threads)
+    import the strategy class and objective function by name, so these must
+    be importable: defined in a module, not in an interactive session, and
+    in scripts only with the pool run under ``if __name__ == "__main__":``.
+    Pass mp_context (e.g. ``multiprocessing.get_context("fork")``) to choose
+    the start method.
+    """
 
     def __init__(
         self,
@@ -18,11 +95,13 @@ class ParameterOptimizer(ABC):
         strategy_class: type,
         objective_function: Callable | None = None,
         max_workers: int | None = None,
+        mp_context: multiprocessing.context.BaseContext | None = None,
     ):
         self.engine = engine
         self.strategy_class = strategy_class
         self.objective_function = objective_function or self._default_objective
         self.max_workers = max_workers
+        self.mp_context = mp_context
 
     @staticmethod
     def _default_objective(metrics) -> float:
@@ -72,9 +151,62 @@ class ParameterOptimizer(ABC):
             }
 
     def _run_parallel_optimization(
-        self, data: pd.DataFrame, combinations: list[dict[str, Any]]
+        self,
+        data: pd.DataFrame,
+        combinations: Iterable[dict[str, Any]],
+        count: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run optimization in parallel.
+
+        Combinations may be a lazy iterable; count, or the length of a sized
+        input, sets the worker chunk size. Duplicate combinations are
+        evaluated once and a deep copy of their result is repeated in place,
+        so the output still has one independent entry per combination.
+        """
+        if count is None and isinstance(combinations, Sized):
+            count = len(combinations)
+
+        # Position in the unique results of each combination, and the
+        # parameters of each repeated one by output index
+        positions: list[int] = []
+        duplicates: dict[int, dict[str, Any]] = {}
+        seen: dict[tuple, int] = {}
+
+        def unique_combinations() -> Iterator[dict[str, Any]]:
+            n_unique = 0
+            for params in combinations:
+                key = _combination_key(params)
+                position = seen.get(key) if key is not None else None
+                if position is None:
+                    if key is not None:
+                        seen[key] = n_unique
+                    positions.append(n_unique)
+                    n_unique += 1
+                    yield params
+                else:
+                    duplicates[len(positions)] = params
+                    positions.append(position)
+
+        unique_results = self._evaluate_combinations(
+            data, unique_combinations(), count
+        )
+        if not duplicates:
+            return unique_results
+
+        return [
+            {**copy.deepcopy(unique_results[position]), "parameters": duplicates[index]}
+            if index in duplicates
+            else unique_results[position]
+            for index, position in enumerate(positions)
+        ]
+
+    def _evaluate_combinations(
+        self,
+        data: pd.DataFrame,
+        combinations: Iterable[dict[str, Any]],
+        count: int | None = None,
     ) -> list[dict[str, Any]]:
-        """Run optimization in parallel."""
+        """Evaluate combinations in order, across worker processes if enabled."""
         results = []
 
         if self.max_workers == 1:
@@ -83,19 +215,21 @@ class ParameterOptimizer(ABC):
                 result = self._evaluate_single_combination(params, data)
                 results.append(result)
         else:
-            # Multi-threaded execution
-            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit all jobs
-                future_to_params = {
-                    executor.submit(
-                        self._evaluate_single_combination, params, data
-                    ): params
-                    for params in combinations
-                }
-
-                # Collect results
-                for future in as_completed(future_to_params):
-                    result = future.result()
-                    results.append(result)
+            # Multi-process execution; the data is pickled once per worker
+            # rather than once per combination, and combinations are sent in
+            # chunks of about a quarter of each worker's share
+            workers = self.max_workers or os.cpu_count() or 1
+            chunksize = max(1, (count or 0) // (workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=_pool_context(self.mp_context),
+                initializer=_init_worker,
+                initargs=(self, data),
+            ) as executor:
+                results.extend(
+                    executor.map(
+                        _evaluate_in_worker, combinations, chunksize=chunksize
+                    )
+                )
 
         return results
@@ -1,4 +1,5 @@
 import itertools
+from collections.abc import Iterator
 from typing import Any
 
 
@@ -14,17 +15,13 @@ class ParameterSpace:
 
     def get_combinations(self) -> list[dict[str, Any]]:
         """Get all parameter combinations."""
-        if not self.parameters:
-            return [{}]
+        return list(self.iter_combinations())
 
+    def iter_combinations(self) -> Iterator[dict[str, Any]]:
+        """Yield parameter combinations one at a time, without building a list."""
         keys = list(self.parameters.keys())
-        values = list(self.parameters.values())
-
-        combinations = []
-        for combo in itertools.product(*values):
-            combinations.append(dict(zip(keys, combo, strict=False)))
-
-        return combinations
+        for combo in itertools.product(*self.parameters.values()):
+            yield dict(zip(keys, combo, strict=False))
 
     def size(self) -> int:
         """Get total number of combinations."""
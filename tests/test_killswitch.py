@@ -0,0 +1,230 @@
+"""Tests for the kill switch manager logging and triggers."""
+
+import logging
+import multiprocessing
+import os
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from backtesting.killswitch import manager
+from backtesting.killswitch.triggers import (
+    DrawdownTrigger,
+    LossTrigger,
+    VaRTrigger,
+    VolatilityTrigger,
+    _ReturnWindow,
+)
+from backtesting.stats import quantile
+
+
+def flush_killswitch_log():
+    for handler in manager.logger.handlers:
+        handler.flush()
+
+
+def log_in_child(path):
+    # No handlers configured: the record goes to logging's stderr fallback
+    logging.getLogger().handlers.clear()
+    sys.stderr = open(path, "w", buffering=1)
+    manager.logger.warning("child activation")
+
+
+def first_activation(trigger, equity, portfolio=None):
+    """Index at which per-tick check first activates, or -1."""
+    start = datetime(2024, 1, 1)
+    for i, value in enumerate(equity):
+        if trigger.check(portfolio, {}, start + timedelta(days=i), float(value)):
+            return i
+    return -1
+
+
+def first_activation_at(trigger, values, timestamps):
+    """Index at which per-tick check first activates on timed values, or -1."""
+    for i, (timestamp, value) in enumerate(zip(timestamps, values)):
+        if trigger.check(None, {}, timestamp, float(value)):
+            return i
+    return -1
+
+
+class TestKillSwitchLogging:
+    """Test cases for the kill switch activation logger."""
+
+    def test_import_starts_no_thread(self):
+        """Test that importing the package starts no listener thread."""
+        out = subprocess.run(
+            [sys.executable, "-c",
+             "import threading, backtesting; print(threading.active_count())"],
+            capture_output=True, text=True, check=True,
+        ).stdout
+        assert out.strip() == "1"
+
+    def test_records_reach_configured_handlers_once(self):
+        """Test that activations follow the application's logging setup."""
+        code = (
+            "import logging\n"
+            "logging.basicConfig(format='%(message)s')\n"
+            "from backtesting.killswitch import manager\n"
+            "manager.logger.warning('parent activation')\n"
+        )
+        err = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stderr
+        assert err.count("parent activation") == 1
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+    def test_forked_child_records_are_emitted(self, tmp_path):
+        """Test that a forked worker's activations are not left in the queue."""
+        # Start the listener in the parent before forking
+        manager.logger.warning("parent activation")
+        flush_killswitch_log()
+        manager.logger.warning("parent activation")
+
+        path = tmp_path / "child.log"
+        process = multiprocessing.get_context("fork").Process(
+            target=log_in_child, args=(str(path),)
+        )
+        process.start()
+        process.join(10)
+
+        assert process.exitcode == 0
+        assert "child activation" in path.read_text()
+
+
+class TestCheckBatch:
+    """Test cases for the vectorized trigger checks."""
+
+    EQUITY_CURVES = [
+        [100.0, 110.0, 90.0, 85.0, 120.0],
+        [100.0, np.nan, 100.0, 70.0],
+        [np.nan, 100.0, 60.0],
+        [100.0, 101.0, 102.0],
+        [100.0, 0.0],
+    ]
+
+    @pytest.mark.parametrize("equity", EQUITY_CURVES)
+    def test_drawdown_batch_matches_check(self, equity):
+        """Test DrawdownTrigger.check_batch against successive check calls."""
+        timestamps = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(5)]
+        batch = DrawdownTrigger(max_drawdown=0.2)
+        per_tick = DrawdownTrigger(max_drawdown=0.2)
+
+        idx = batch.check_batch(np.array(equity), timestamps)
+        assert idx == first_activation(per_tick, equity)
+        assert batch.activated == per_tick.activated
+        assert batch.activation_time == per_tick.activation_time
+
+    @pytest.mark.parametrize("equity", EQUITY_CURVES)
+    def test_loss_batch_matches_check(self, equity):
+        """Test LossTrigger.check_batch against successive check calls."""
+        timestamps = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(5)]
+        batch = LossTrigger(max_loss=15.0)
+        per_tick = LossTrigger(max_loss=15.0)
+
+        idx = batch.check_batch(np.array(equity), timestamps, initial_cash=100.0)
+        portfolio = SimpleNamespace(initial_cash=100.0)
+        assert idx == first_activation(per_tick, equity, portfolio)
+        assert batch.activation_time == per_tick.activation_time
+
+    def test_batch_on_activated_trigger(self):
+        """Test that an activated trigger reports the curve halted from the start."""
+        trigger = DrawdownTrigger(max_drawdown=0.2)
+        trigger.activate("manual", datetime(2024, 1, 1))
+        assert trigger.check_batch(np.array([100.0, 100.0]), [None, None]) == 0
+
+
+def random_series(seed, n=400, hourly=False):
+    """Portfolio values and irregularly spaced timestamps."""
+    rng = np.random.default_rng(seed)
+    values = 100000 * np.cumprod(1 + rng.normal(0, 0.02, n))
+    unit = timedelta(hours=1) if hourly else timedelta(days=1)
+    # Mostly regular steps with occasional gaps that expire many entries
+    steps = np.where(rng.random(n) < 0.05, rng.integers(5, 40, n), 1)
+    start = datetime(2024, 1, 1)
+    timestamps = [start + unit * int(k) for k in np.cumsum(steps)]
+    return values, timestamps
+
+
+def reference_returns(history, timestamp, value, lookback_days):
+    """List-based window update, as the triggers kept it before NumPy buffers."""
+    if history:
+        prev_value = history[-1][1]
+        if prev_value > 0:
+            history.append((timestamp, value, (value - prev_value) / prev_value))
+    else:
+        history.append((timestamp, value, 0.0))
+    cutoff = timestamp - timedelta(days=lookback_days)
+    history[:] = [entry for entry in history if entry[0] >= cutoff]
+    return [r for _, _, r in history[1:]]
+
+
+class TestReturnWindow:
+    """Test cases for the buffered return window behind the triggers."""
+
+    @pytest.mark.parametrize("seed", range(4))
+    @pytest.mark.parametrize("hourly", [False, True])
+    def test_window_matches_list_reference(self, seed, hourly):
+        """Test window contents and statistics through compactions and growth."""
+        lookback_days = 10
+        values, timestamps = random_series(seed, hourly=hourly)
+        # Capacity as the triggers size it; hourly data forces doubling
+        window = _ReturnWindow(lookback_days + 1)
+        history = []
+        for timestamp, value in zip(timestamps, values):
+            expected = reference_returns(history, timestamp, value, lookback_days)
+            if len(window):
+                prev_value = window.last_value
+                if prev_value > 0:
+                    window.append(timestamp, value, (value - prev_value) / prev_value)
+            else:
+                window.append(timestamp, value, 0.0)
+            window.expire_before(timestamp - timedelta(days=lookback_days))
+
+            assert len(window) == len(history)
+            np.testing.assert_allclose(window.returns, expected, rtol=1e-6)
+            if len(expected) > 1:
+                assert window.returns_std() == pytest.approx(
+                    np.std(expected), rel=1e-5, abs=1e-9
+                )
+                assert quantile(window.returns, 0.05) == pytest.approx(
+                    np.percentile(expected, 5), rel=1e-6, abs=1e-9
+                )
+
+    @pytest.mark.parametrize("seed", range(10))
+    @pytest.mark.parametrize("hourly", [False, True])
+    def test_volatility_trigger_matches_np_std(self, seed, hourly):
+        """Test VolatilityTrigger activations against np.std of the window."""
+        values, timestamps = random_series(seed, hourly=hourly)
+        trigger = VolatilityTrigger(max_volatility=0.36, lookback_days=10)
+        history = []
+        expected = -1
+        for i, (timestamp, value) in enumerate(zip(timestamps, values)):
+            returns = reference_returns(history, timestamp, value, 10)
+            if len(history) >= 10 and np.std(returns) * np.sqrt(252) >= 0.36:
+                expected = i
+                break
+
+        assert first_activation_at(trigger, values, timestamps) == expected
+
+    @pytest.mark.parametrize("seed", range(10))
+    @pytest.mark.parametrize("hourly", [False, True])
+    def test_var_trigger_matches_np_percentile(self, seed, hourly):
+        """Test VaRTrigger activations against np.percentile of the window."""
+        values, timestamps = random_series(seed, hourly=hourly)
+        trigger = VaRTrigger(var_limit=0.03, confidence=0.95, lookback_days=40)
+        history = []
+        expected = -1
+        for i, (timestamp, value) in enumerate(zip(timestamps, values)):
+            returns = reference_returns(history, timestamp, value, 40)
+            if len(history) >= 30:
+                var_estimate = np.percentile(returns, 5)
+                current = returns[-1]
+                if current <= var_estimate and abs(current) > 0.03:
+                    expected = i
+                    break
+
+        assert first_activation_at(trigger, values, timestamps) == expected
@@ -0,0 +1,80 @@
+"""Tests for the LiveMetricsAggregator running statistics."""
+
+import asyncio
+import math
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtesting.metrics.live_aggregator import LiveMetricsAggregator
+
+
+class FakeBroker:
+    """Broker stub reporting a scripted sequence of account values."""
+
+    def __init__(self, values):
+        self._values = iter(values)
+
+    async def get_account_info(self):
+        value = next(self._values)
+        return SimpleNamespace(total_value=value, cash_balance=value)
+
+    async def get_positions(self):
+        return []
+
+    async def get_orders(self):
+        return []
+
+
+def run_session(values, update_interval=60):
+    aggregator = LiveMetricsAggregator(FakeBroker(values), update_interval)
+    metrics = None
+    for _ in values:
+        metrics = asyncio.run(aggregator.update_metrics())
+    return metrics
+
+
+def reference_metrics(values, update_interval=60):
+    """Metrics as computed from the full history with pandas."""
+    total_value = pd.Series(values, dtype=float)
+    returns = total_value.pct_change().dropna()
+    periods = 525600 / update_interval
+    mean_return = returns.mean()
+    volatility = returns.std()
+    peak = total_value.expanding().max()
+    drawdown = (total_value - peak) / peak
+    negative_returns = returns[returns < 0]
+    downside = negative_returns.std() if len(negative_returns) > 1 else 0
+    return {
+        'total_return': (total_value.iloc[-1] - total_value.iloc[0]) / total_value.iloc[0],
+        'volatility': volatility,
+        'sharpe_ratio': (mean_return * periods) / (volatility * periods ** 0.5),
+        'sortino_ratio': (
+            (mean_return * periods) / (downside * periods ** 0.5) if downside > 0 else 0
+        ),
+        'max_drawdown': drawdown.min(),
+        'current_drawdown': drawdown.iloc[-1],
+    }
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_running_stats_match_pandas(seed):
+    """Test the O(1) running statistics against the full-history computation."""
+    rng = np.random.default_rng(seed)
+    values = list(100000 * np.cumprod(1 + rng.normal(0, 0.01, 50)))
+
+    metrics = run_session(values)
+    expected = reference_metrics(values)
+    for key, value in expected.items():
+        assert metrics[key] == pytest.approx(value, rel=1e-9, abs=1e-12), key
+
+
+def test_unfunded_start_does_not_raise():
+    """Test an account starting at zero value."""
+    metrics = run_session([0.0, 0.0, 1000.0, 900.0, 950.0])
+
+    assert math.isnan(metrics['total_return'])
+    assert metrics['max_drawdown'] == pytest.approx(-0.1)
+    assert metrics['current_drawdown'] == pytest.approx(-0.05)
@@ -0,0 +1,86 @@
+"""Tests for SimpleTradingStrategy's per-quote and batch paths."""
+
+import numpy as np
+import pytest
+
+from backtesting.execution.live_engine import SimpleTradingStrategy
+
+
+def quote_cycles(seed, n_cycles=60):
+    """Quote cycles over a changing set of symbols."""
+    rng = np.random.default_rng(seed)
+    symbols = [f"SYM{i}" for i in range(12)]
+    prices = dict.fromkeys(symbols, 100.0)
+    cycles = []
+    for _ in range(n_cycles):
+        # Each cycle quotes a random subset, in a random order
+        active = rng.permutation(symbols)[: rng.integers(1, len(symbols) + 1)]
+        cycle = {}
+        for symbol in active:
+            prices[symbol] *= 1 + rng.normal(0, 0.02)
+            cycle[str(symbol)] = {"price": prices[symbol]}
+        cycles.append(cycle)
+    return cycles
+
+
+def order_key(order):
+    return (order.symbol, order.side, order.quantity, order.order_type, order.price)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_on_batch_matches_on_data(seed):
+    """Test that on_batch gives the orders of on_data, in the same order."""
+    per_quote = SimpleTradingStrategy()
+    batch = SimpleTradingStrategy()
+
+    for cycle in quote_cycles(seed):
+        expected = [
+            order_key(order)
+            for symbol, data in cycle.items()
+            for order in per_quote.on_data(symbol, data)
+        ]
+        assert [order_key(order) for order in batch.on_batch(cycle)] == expected
+
+    assert batch.positions == per_quote.positions
+    assert batch.previous_prices == per_quote.previous_prices
+
+
+def test_state_views_are_read_only():
+    """Test that positions and prices reject item assignment but accept replacement."""
+    strategy = SimpleTradingStrategy()
+    strategy.on_data("AAPL", {"price": 100.0})
+
+    with pytest.raises(TypeError):
+        strategy.positions["AAPL"] = 10
+    with pytest.raises(TypeError):
+        strategy.previous_prices["AAPL"] = 90.0
+
+    strategy.positions = {"AAPL": 10, "MSFT": 5}
+    strategy.previous_prices = {"MSFT": 300.0}
+    assert strategy.positions == {"AAPL": 10, "MSFT": 5}
+    assert strategy.previous_prices == {"MSFT": 300.0}
+
+    # A 3% rise on MSFT with a position held gives a sell of the whole position
+    orders = strategy.on_data("MSFT", {"price": 309.0})
+    assert [(o.symbol, o.quantity) for o in orders] == [("MSFT", 5)]
+
+
+@pytest.mark.parametrize("n_symbols", [1, 8, 9, 17, 40])
+def test_state_assignment_allocates_unseen_symbols(n_symbols):
+    """Test replacing the state with symbols that have no slot yet."""
+    prices = {f"SYM{i}": 100.0 + i for i in range(n_symbols)}
+    positions = {f"SYM{i}": i + 1 for i in range(n_symbols)}
+
+    strategy = SimpleTradingStrategy()
+    strategy.positions = positions
+    strategy.previous_prices = prices
+    assert strategy.positions == positions
+    assert strategy.previous_prices == prices
+
+    # Unseen symbols past the current capacity on a strategy with state
+    strategy = SimpleTradingStrategy()
+    strategy.on_data("AAPL", {"price": 100.0})
+    strategy.previous_prices = prices
+    strategy.positions = positions
+    assert strategy.previous_prices == prices
+    assert strategy.positions == {"AAPL": 0, **positions}
@@ -0,0 +1,49 @@
+"""
+Test batch metric calculation against the per-backtest calculator.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtesting.metrics.calculator import MetricsCalculator
+
+
+class _Portfolio:
+    initial_cash = 100_000.0
+
+
+class _Results:
+    """Minimal stand-in for BacktestResults with a fixed equity curve."""
+
+    def __init__(self, equity):
+        self.portfolio = _Portfolio()
+        self._equity = equity
+
+    def get_equity_curve(self):
+        return pd.DataFrame({"equity": self._equity})
+
+    def get_trades(self):
+        return pd.DataFrame()
+
+
+def test_calculate_batch_matches_calculate():
+    """Each column of the batch result matches calculate() on that curve."""
+    rng = np.random.default_rng(42)
+    steps = rng.normal(0.0005, 0.01, size=(300, 6))
+    equities = 100_000.0 * np.cumprod(1 + steps, axis=0)
+
+    batch = MetricsCalculator.calculate_batch(equities, initial_cash=100_000.0)
+
+    for j in range(equities.shape[1]):
+        single = MetricsCalculator.calculate(_Results(equities[:, j]))
+        for name, values in batch.items():
+            assert values[j] == pytest.approx(getattr(single, name), rel=1e-9), name
+
+
+def test_calculate_batch_rejects_bad_shapes():
+    """Batch input must be a 2-D array with at least two rows."""
+    with pytest.raises(ValueError):
+        MetricsCalculator.calculate_batch(np.ones(10), initial_cash=1.0)
+    with pytest.raises(ValueError):
+        MetricsCalculator.calculate_batch(np.ones((1, 3)), initial_cash=1.0)
@@ -4,7 +4,9 @@ import pytest
 import pandas as pd
 from datetime import datetime, timedelta
 from backtesting.metrics.pipeline import MetricsPipeline
-from backtesting.metrics.processors import EquityCurveProcessor, DrawdownProcessor, TradeListProcessor
+from backtesting.metrics.processors import (
+    EquityCurveProcessor, DrawdownProcessor, TradeListProcessor, ReturnsStatsProcessor
+)
 
 
 class TestMetricsPipeline:
@@ -64,7 +66,8 @@ class TestMetricsPipeline:
         
         # Get equity curve
         equity_curve = pipeline.get_equity_curve()
-        assert len(equity_curve) == 4  # Including initialization
+        assert len(equity_curve) == 3  # One point per bar, no initial seed
+        assert equity_curve.index[0] == base_time
         assert equity_curve['equity'].iloc[-1] == 98000.0
         
         # Get summary metrics
@@ -90,6 +93,13 @@ class TestMetricsPipeline:
         summary = pipeline.get_summary_metrics()
         assert summary['max_drawdown'] < 0  # Should be negative
         assert abs(summary['max_drawdown']) > 0.13  # Should be > 13% (95k from 110k peak)
+        
+        # Scalar metrics match get_metrics without building the series
+        processor = pipeline.get_processor("drawdown")
+        scalars = processor.get_scalar_metrics()
+        assert "drawdown_series" not in scalars
+        full = processor.get_metrics()
+        assert scalars == {k: v for k, v in full.items() if k != "drawdown_series"}
     
     def test_trade_processing(self):
         """Test trade processing."""
@@ -166,7 +176,46 @@ class TestMetricsPipeline:
         summary = pipeline.get_summary_metrics()
         assert summary['current_value'] == 100000.0
         assert summary['total_trades'] == 0
+    
+    def test_returns_stats_match_batch_std(self):
+        """Test running return statistics against the batch computation."""
+        pipeline = MetricsPipeline()
+        pipeline.add_processor(ReturnsStatsProcessor())
+        pipeline.initialize(100000.0)
+        
+        values = [101000.0, 99500.0, 100200.0, 98000.0, 102000.0]
+        base_date = datetime(2024, 1, 1)
+        for i, value in enumerate(values):
+            pipeline.process_bar(base_date + timedelta(days=i), value)
+        
+        returns = pd.Series([100000.0] + values).pct_change().dropna()
+        stats = pipeline.get_processor_metrics("returns_stats")
+        assert stats["returns_count"] == 5
+        assert stats["mean_return"] == pytest.approx(returns.mean())
+        assert stats["return_std"] == pytest.approx(returns.std())
+        assert stats["downside_std"] == pytest.approx(returns[returns < 0].std())
+        
+        metrics = pipeline.to_performance_metrics()
+        assert metrics.volatility == pytest.approx(returns.std() * 252 ** 0.5)
 
+    
+    def test_process_bars_bulk_matches_per_bar(self):
+        """Test bulk bar processing against processing bar by bar."""
+        values = [101000.0, 99500.0, 100200.0, 98000.0, 102000.0, 101500.0]
+        timestamps = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(6)]
+        
+        per_bar = MetricsPipeline()
+        per_bar.initialize(100000.0)
+        for timestamp, value in zip(timestamps, values):
+            per_bar.process_bar(timestamp, value)
+        
+        bulk = MetricsPipeline()
+        bulk.initialize(100000.0)
+        bulk.process_bars_bulk(timestamps[:2], values[:2])
+        bulk.process_bars_bulk(timestamps[2:], values[2:])
+        
+        assert bulk.get_summary_metrics() == per_bar.get_summary_metrics()
+        pd.testing.assert_frame_equal(bulk.get_equity_curve(), per_bar.get_equity_curve())
 
 if __name__ == "__main__":
     # Run basic smoke test
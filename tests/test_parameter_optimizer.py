@@ -0,0 +1,154 @@
+"""Tests for ParameterOptimizer's evaluation of combinations."""
+
+import multiprocessing
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from backtesting.jit import NUMBA_AVAILABLE, njit, prange
+from backtesting.sweep.optimizer import ParameterOptimizer, _pool_context
+
+
+def evaluated(params):
+    """Record of the evaluated values, including their types."""
+    return repr(sorted(params.items()))
+
+
+class RecordingOptimizer(ParameterOptimizer):
+    """Optimizer scoring combinations without running backtests.
+
+    Defined at module level so worker processes can unpickle it.
+    """
+
+    def optimize(self, data, parameter_space):
+        return self._run_parallel_optimization(data, parameter_space)
+
+    def _evaluate_single_combination(self, params, data):
+        return {
+            "parameters": params,
+            "metrics": {"fast": params["fast"], "slow": params["slow"]},
+            "objective_value": float(params["slow"]),
+            "results": [data, evaluated(params)],
+            "success": True,
+            "error": None,
+        }
+
+
+COMBINATIONS = [
+    {"fast": 5, "slow": 20},
+    {"fast": 10, "slow": 20},
+    {"slow": 20, "fast": 5},
+    {"fast": 5, "slow": 30},
+    {"fast": 10, "slow": 20},
+    {"fast": True, "slow": 20},
+    {"fast": 1, "slow": 20},
+    {"fast": 1.0, "slow": 20},
+    {"fast": 1, "slow": 20},
+]
+
+
+@pytest.fixture(params=[1, 2], ids=["serial", "pool"])
+def optimizer(request):
+    return RecordingOptimizer(None, object, max_workers=request.param)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_results_follow_combination_order(optimizer, lazy):
+    """Test one result per combination, in input order, with duplicates."""
+    combinations = iter(COMBINATIONS) if lazy else COMBINATIONS
+    results = optimizer.optimize("data", combinations)
+
+    assert [result["parameters"] for result in results] == COMBINATIONS
+    for params, result in zip(COMBINATIONS, results):
+        assert result["metrics"] == {"fast": params["fast"], "slow": params["slow"]}
+        assert result["results"] == ["data", evaluated(params)]
+
+
+def test_equal_values_of_other_types_are_distinct(optimizer):
+    """Test that True, 1 and 1.0 are evaluated as separate combinations."""
+    results = optimizer.optimize("data", COMBINATIONS)
+
+    fast_values = [result["results"][1] for result in results[5:]]
+    assert fast_values == [
+        "[('fast', True), ('slow', 20)]",
+        "[('fast', 1), ('slow', 20)]",
+        "[('fast', 1.0), ('slow', 20)]",
+        "[('fast', 1), ('slow', 20)]",
+    ]
+    assert type(results[5]["metrics"]["fast"]) is bool
+    assert type(results[7]["metrics"]["fast"]) is float
+
+
+def test_duplicates_do_not_share_results(optimizer):
+    """Test that a repeated combination gets its own metrics and results."""
+    results = optimizer.optimize("data", COMBINATIONS)
+
+    first, repeat = results[0], results[2]
+    assert repeat["metrics"] == first["metrics"]
+    assert repeat["metrics"] is not first["metrics"]
+    assert repeat["results"] is not first["results"]
+
+    repeat["metrics"]["fast"] = 0
+    repeat["results"].clear()
+    assert first["metrics"]["fast"] == 5
+    assert first["results"] == ["data", evaluated(COMBINATIONS[0])]
+
+
+def test_unhashable_combinations_are_all_evaluated(optimizer):
+    """Test that combinations with unhashable values skip deduplication."""
+    combinations = [{"fast": [5], "slow": 20}, {"fast": [5], "slow": 20}]
+    results = optimizer.optimize("data", combinations)
+
+    assert [result["parameters"] for result in results] == combinations
+    assert results[0]["metrics"] is not results[1]["metrics"]
+
+
+@njit(parallel=True)
+def parallel_sum(values):
+    total = 0.0
+    for i in prange(values.shape[0]):
+        total += values[i]
+    return total
+
+
+def test_main_module_optimizer_runs_in_pool():
+    """Test a pool run with an optimizer defined in __main__, as from python -c."""
+    code = (
+        "from backtesting.sweep.optimizer import ParameterOptimizer\n"
+        "class Optimizer(ParameterOptimizer):\n"
+        "    def optimize(self, data, parameter_space):\n"
+        "        return self._run_parallel_optimization(data, parameter_space)\n"
+        "    def _evaluate_single_combination(self, params, data):\n"
+        "        return {'parameters': params, 'objective_value': params['x']}\n"
+        "optimizer = Optimizer(None, object, max_workers=2)\n"
+        "results = optimizer.optimize(None, [{'x': 1}, {'x': 2}])\n"
+        "print([result['objective_value'] for result in results])\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True, timeout=60,
+    ).stdout
+    assert out.strip() == "[1, 2]"
+
+
+def test_explicit_pool_context_is_used():
+    """Test that a given multiprocessing context overrides the default."""
+    context = multiprocessing.get_context("spawn")
+    assert _pool_context(context) is context
+
+
+@pytest.mark.skipif(
+    not NUMBA_AVAILABLE
+    or "forkserver" not in multiprocessing.get_all_start_methods(),
+    reason="requires Numba and the forkserver start method",
+)
+def test_pool_uses_fork_server_after_numba_threads_start():
+    """Test that pools stop forking the parent once Numba has started threads."""
+    assert parallel_sum(np.ones(16)) == 16.0
+    assert _pool_context(None).get_start_method() == "forkserver"
+
+    optimizer = RecordingOptimizer(None, object, max_workers=2)
+    results = optimizer.optimize("data", COMBINATIONS)
+    assert [result["parameters"] for result in results] == COMBINATIONS